@@ -1,606 +1,494 @@
-from typing import List, NoReturn
-
+from collections import deque
+from typing import (Callable, Deque, Iterable, Iterator, List, NamedTuple,
+                    Optional, Tuple)
+
+from Analizador.gramatica import (FIN, HOJAS, TERMINALES_POR_TIPO,
+                                  ReglaNodo, TablasAnalizador,
+                                  calcular_expansion, obtener_expansiones,
+                                  obtener_tablas, terminal_componente)
 from Explorador.explorador import ComponenteLexico
 from Utils.arbol import ArbolSintaxisAbstracta, Nodo, TipoNodo
 
 
-class Analizador:
+class BufferLookahead:
     """
-    Clase encargada de revisar las reglas de gramatica
-    en el programa con el uso del arbol de sintaxis y el
-    algoritmo de descenso recursivo.
+    Ventana pequeña sobre un flujo de componentes léxicos, permite al
+    analizador consumir los componentes conforme el explorador los
+    genera sin necesitar la lista completa en memoria
     """
 
-    componentes_lexicos: List[ComponenteLexico]
-    componente_actual: ComponenteLexico
-    ast: ArbolSintaxisAbstracta
-    cantidad_componentes: int
-    posicion_componente_actual: int
-
-    def __init__(self, lista_componentes):
-
-        self.componentes_lexicos = lista_componentes
-        self.cantidad_componentes = len(lista_componentes)
+    flujo: Iterator[ComponenteLexico]
+    ventana: Deque[ComponenteLexico]
 
-        self.posicion_componente_actual = 0
-        self.componente_actual = lista_componentes[0]
-
-        self.ast = ArbolSintaxisAbstracta()
-
-    def imprimir_ast(self) -> None:
-        """
-        Imprime el árbol de sintáxis abstracta
-        """
-
-        if self.ast.raiz is None:
-            print([])
-        else:
-            self.ast.imprimir_preorden()
-
-    def analizar(self) -> None:
-        self.ast.raiz = self.__analizar_programa()
+    def __init__(self, componentes: Iterable[ComponenteLexico]):
+        self.flujo = iter(componentes)
+        self.ventana = deque()
 
-    def __analizar_programa(self) -> Nodo:
+    def ver(self, desplazamiento: int = 0) -> Optional[ComponenteLexico]:
         """
-        Programa ::= Comentario Asignación* (Comentario | Funcion)* Principal
+        Devuelve el componente que está `desplazamiento` posiciones
+        adelante sin consumirlo, o None si el flujo ya terminó
         """
 
-        nodos_nuevos = []
-
-        # Esto es porque pueden venir varias asignaciones y funciones
-        while (True):
-
-            # Es asignacion
-            if self.componente_actual.tipo == 'IDENTIFICADOR':
-                nodos_nuevos += [self.__analizar_asignacion()]
-
-            # Es función
-            elif self.componente_actual.valor == 'POV':
-                nodos_nuevos += [self.__analizar_funcion()]
-
-            else:
-                break
-
-        # Verifica que venga la función principal obligatoria
-        if (self.componente_actual.valor == 'maracuya'):
-            nodos_nuevos += [self.__analizar_principal()]
-        else:
-            self.__error_verificacion_texto('maracuya')
+        while len(self.ventana) <= desplazamiento:
+            componente = next(self.flujo, None)
+            if componente is None:
+                return None
+            self.ventana.append(componente)
 
-        return Nodo(TipoNodo.PROGRAMA, nodos=nodos_nuevos)
+        return self.ventana[desplazamiento]
 
-    def __analizar_asignacion(self) -> Nodo:
+    def avanzar(self) -> None:
         """
-        Asignación ::= Identificador anotado
-        (Valor | Invocación | ExpresiónMatematica).
+        Consume el componente actual
         """
 
-        nodos_nuevos = []
-
-        # Identificador obligatorio
-        nodos_nuevos += [self.__verificar_identificador()]
-
-        # anotado obligatorio
-        self.__verificar('anotado')
-
-        # Verifica si trae un valor, una invocación o una expresión
-        # matemática como la expresión, la invocación y el valor
-        # pueden iniciar por un identificador se revisa el
-        # siguiente componente para las validaciones
-
-        tipos_de_variable = {'ENTERO', 'FLOTANTE', 'BOOLEANO',
-                             'TEXTO', 'IDENTIFICADOR'}
-
-        # Caso Expresión Matemática
-        if self.componente_actual.valor == '#':
-            nodos_nuevos += [self.__analizar_expresion_matematica()]
-
-        # Caso Invocacion
-        elif self.componente_actual.tipo == 'INVOCACION':
-            nodos_nuevos += [self.__analizar_invocacion()]
-
-        # Caso Valor
-        elif self.componente_actual.tipo in tipos_de_variable:
-            nodos_nuevos += [self.__analizar_valor()]
-
-        # Un punto obligatorio
-        self.__verificar('.')
-
-        return Nodo(TipoNodo.ASIGNACION, nodos=nodos_nuevos)
+        if self.ver() is not None:
+            self.ventana.popleft()
 
-    def __analizar_invocacion(self) -> Nodo:
+    def siguiente(self) -> Optional[ComponenteLexico]:
         """
-        Invocación ::= jutsu Identificador(Parámetros?)
+        Consume el componente actual y devuelve el siguiente, equivale
+        a `avanzar` seguido de `ver` para el analizador por tablas
         """
 
-        nodos_nuevos = []
-
-        # verifica jutsu
-        self.__verificar('jutsu')
-        nodos_nuevos += [self.__verificar_identificador()]
-        self.__verificar('(')
-        if self.componente_actual.tipo != "PUNTUACION":
-            nodos_nuevos += [self.__analizar_parametros_funcion()]
-        self.__verificar(')')
-
-        return Nodo(TipoNodo.INVOCACION,
-                    contenido=nodos_nuevos[0].contenido, nodos=nodos_nuevos)
-
-    def __analizar_funcion(self) -> Nodo:
-        """
-        Función ::= POV Identificador(Parámetros?) xD ConjuntoInstrucciones v:
-        """
-
-        nodos_nuevos = []
-
-        # Verifica POV
-        self.__verificar('POV')
-
-        # Identificador obligatorio
-        nodos_nuevos += [self.__verificar_identificador()]
-
-        # Verifica parametros
-        self.__verificar('(')
-        if self.componente_actual.tipo != "PUNTUACION":
-            nodos_nuevos += [self.__analizar_parametros_funcion()]
-        self.__verificar(')')
-
-        # Verifica corchetes
-        self.__verificar('xD')
-
-        # Analizar instruccion
-        nodos_nuevos += [self.__analizar_conjunto_instrucciones()]
+        if self.ventana:
+            self.ventana.popleft()
+        else:
+            next(self.flujo, None)
 
-        # Verifica corchetes
-        self.__verificar('v:')
+        if self.ventana:
+            return self.ventana[0]
 
-        return Nodo(TipoNodo.FUNCION,
-                    contenido=nodos_nuevos[0].contenido, nodos=nodos_nuevos)
+        componente = next(self.flujo, None)
+        if componente is not None:
+            self.ventana.append(componente)
+        return componente
 
-    def __analizar_principal(self) -> Nodo:
+    def descartar_restantes(self) -> None:
         """
-        Principal::= maracuya() xD ConjuntoInstrucciones v:
+        Agota el flujo para que el explorador termine de reportar errores
         """
 
-        nodos_nuevos = []
-        atributos_nuevos = self.componente_actual.get_atributos()
-
-        # Verifica que sea la principal
-        self.__verificar('maracuya')
-        self.__verificar('(')
-        self.__verificar(')')
+        self.ventana.clear()
+        for _ in self.flujo:
+            pass
 
-        # Verifica corchetes
-        self.__verificar('xD')
 
-        # Si es instruccion
-        nodos_nuevos += [self.__analizar_conjunto_instrucciones()]
+# Textos en los que el analizador se sincroniza después de un error
+PUNTOS_SINCRONIZACION = frozenset({'.', 'v:', 'xD', 'POV', 'maracuya'})
 
-        # Verifica corchetes
-        self.__verificar('v:')
+# Textos que inician una función, donde se sincroniza el programa
+INICIOS_FUNCION = frozenset({'POV', 'maracuya'})
 
-        return Nodo(TipoNodo.PRINCIPAL, nodos=nodos_nuevos,
-                    atributos=atributos_nuevos)
+# Cantidad de errores de sintaxis que se reportan antes de detenerse
+LIMITE_ERRORES = 20
 
-    def __analizar_parametros_funcion(self) -> Nodo:
-        """
-        ParámetrosFuncion::= Identificador (, Identificador)*
-        """
+# Componentes que se deben consumir después de sincronizarse para
+# reportar otro error, los errores antes de eso suelen ser consecuencia
+# del anterior
+COMPONENTES_ENTRE_ERRORES = 3
 
-        nodos_nuevos = []
 
-        # Verifica el primer valor
-        nodos_nuevos += [self.__verificar_identificador()]
-
-        # Como puede traer varios parametros se revisa hasta que no hayan comas
-        while(self.componente_actual.valor == ','):
-            self.__verificar(',')
-            nodos_nuevos += [self.__verificar_identificador()]
-
-        return Nodo(TipoNodo.PARAMETROS_FUNCION, nodos=nodos_nuevos)
-
-    def __analizar_parametros_invocacion(self) -> Nodo:
-        """
-        ParámetrosInvocacion::= Valor (, Valor)*
-        """
-
-        nodos_nuevos = []
+class DiagnosticoSintaxis(NamedTuple):
+    """
+    Error de sintaxis encontrado por el analizador, sin posición si el
+    archivo no tiene componentes
+    """
 
-        # Verifica el primer valor
-        nodos_nuevos += [self.__analizar_valor()]
+    mensaje: str
+    linea: Optional[int]
+    columna: Optional[int]
 
-        # Como puede traer varios parametros se revisa hasta que no hayan comas
-        while(self.componente_actual.valor == ','):
-            self.__verificar(',')
-            nodos_nuevos += [self.__analizar_valor()]
+    def __str__(self):
+        if self.linea is None:
+            return f'{self.mensaje} (Fin del archivo)'
+        return f'{self.mensaje} (Linea {self.linea}, Columna {self.columna})'
 
-        return Nodo(TipoNodo.PARAMETROS_INVOCACION, nodos=nodos_nuevos)
 
-    def __verificar_identificador(self) -> Nodo:
-        """
-        Verifica si el tipo del componente léxico actual es de tipo
-        IDENTIFICADOR
-
-        Identificador ::= [A-Za-z_][A-Za-z_0-9]+
-        """
+class RecuperacionSintaxis:
+    """
+    Reporte de los errores de sintaxis y recuperación en modo pánico de
+    los analizadores que recorren las tablas LL(1) con una pila de
+    símbolos, construyan o no el árbol, así todos reportan los mismos
+    errores
+
+    Después de un error se descartan componentes hasta un punto de
+    sincronización que tenga dónde continuar en la pila: un '.' o un
+    'v:' termina la instrucción o el bloque que lo espera y un 'xD' abre
+    el bloque cuyo encabezado tuvo el error. 'POV' y 'maracuya' vuelven
+    al nivel del programa, a las declaraciones
+    """
 
-        # Se verifica el tipo de componente
-        self.__verificar_tipo_componente('IDENTIFICADOR')
-        nodo = Nodo(TipoNodo.IDENTIFICADOR,
-                    contenido=self.componente_actual.valor,
-                    atributos=self.componente_actual.get_atributos())
+    tablas: TablasAnalizador
+    diagnosticos: List[DiagnosticoSintaxis]
+    limite_errores: int
+    posicion_sincronizacion: int
+    descripcion_error: str
 
-        self.__siguiente_componente()
-        return nodo
+    def __init__(self, tablas: TablasAnalizador,
+                 limite_errores: int = LIMITE_ERRORES):
+        self.tablas = tablas
+        self.diagnosticos = []
+        self.limite_errores = limite_errores
+        self.posicion_sincronizacion = 0
+        self.descripcion_error = ''
 
-    def __analizar_instruccion(self) -> Nodo:
+    def registrar(self, mensaje: str, descripcion: str, posicion: int,
+                  linea: Optional[int], columna: Optional[int]) -> None:
         """
-        Instrucciones ::= Asignación | Repetir |
-                          Condicional | Comentario | Retorno
+        Reporta el error encontrado en el componente número `posicion`,
+        salvo que esté muy cerca del punto de sincronización anterior.
+        Al llegar al límite de errores se detiene con un SyntaxError
         """
 
-        nodos_nuevos = []
-
-        # Se verifica que tipo de instrucción se está enviando para validarla
-        if self.componente_actual.valor == 'whenCuando':
-            nodos_nuevos += [self.__analizar_repetir()]
-
-        elif self.componente_actual.tipo == 'IDENTIFICADOR':
-            nodos_nuevos += [self.__analizar_asignacion()]
-
-        elif self.componente_actual.valor == 'siuuu':
-            nodos_nuevos += [self.__analizar_condicional()]
-
-        elif self.componente_actual.valor == 'messirve':
-            nodos_nuevos += [self.__analizar_retorno()]
-
-        return Nodo(TipoNodo.INSTRUCCION, nodos=nodos_nuevos)
-
-    def __analizar_repetir(self) -> Nodo:
-        """
-        Repetir ::= whenCuando xD ConjuntoInstrucciones but (ExpCondicional) v:
-        """
+        if self.diagnosticos and posicion - self.posicion_sincronizacion < \
+                COMPONENTES_ENTRE_ERRORES:
+            return
 
-        nodos_nuevos = []
+        diagnostico = DiagnosticoSintaxis(mensaje, linea, columna)
+        print(diagnostico)
+        self.diagnosticos.append(diagnostico)
+        self.descripcion_error = descripcion
 
-        # sólo se verifica la estructura de repetición
-        self.__verificar('whenCuando')
-        self.__verificar('xD')
-        nodos_nuevos += [self.__analizar_conjunto_instrucciones()]
-        self.__verificar('but')
-        self.__verificar('(')
-        nodos_nuevos += [self.__analizar_expresion_condicional()]
-        self.__verificar(')')
-        self.__verificar('v:')
-        return Nodo(TipoNodo.REPETIR, nodos=nodos_nuevos)
+        if len(self.diagnosticos) >= self.limite_errores:
+            raise SyntaxError(f'Se alcanzó el límite de ' +
+                              f'{self.limite_errores} errores de ' +
+                              'sintaxis en analizador')
 
-    def __analizar_condicional(self) -> Nodo:
+    def sincronizar(self, pila: List, terminal: str, posicion: int,
+                    avanzar: Callable[[], str],
+                    cerrar: Optional[Callable] = None) -> Tuple[str, int]:
         """
-        Condicional::= Siuuu Nimodo?
+        Descarta componentes con `avanzar` hasta un punto de
+        sincronización y deja en la pila dónde continuar. Los símbolos
+        que se sacan de la pila y no son texto son marcas de nodos, se
+        terminan con `cerrar`. Retorna el terminal y la posición en que
+        se continúa, al final del archivo la pila queda vacía
         """
 
-        nodos_nuevos = []
-
-        # analiza el siuuu
-        nodos_nuevos += [self.__analizar_siuuu()]
-
-        # Como puede o no traer el else entonces lo validamos
-        if self.componente_actual.valor == 'nimodo':
-            nodos_nuevos += [self.__analizar_nimodo()]
+        while terminal != FIN:
+            if terminal in INICIOS_FUNCION:
+                self.__volver_al_programa(pila, cerrar)
+                break
 
-        return Nodo(TipoNodo.CONDICIONAL, nodos=nodos_nuevos)
+            if terminal in PUNTOS_SINCRONIZACION and terminal in pila:
+                self.__descartar_hasta(pila, terminal, cerrar)
+                break
 
-    def __analizar_siuuu(self):
-        """
-        Siuuu::= siuuu (ExpCondicional) xD Conjunto Instrucciones v:
-        """
-        
-        nodos_nuevos = []
+            terminal = avanzar()
+            posicion += 1
 
-        # Todos presentes en ese orden... sin opciones
-        self.__verificar('siuuu')
-        self.__verificar('(')        
-        nodos_nuevos += [self.__analizar_expresion_condicional()]
-        self.__verificar(')')
-        self.__verificar('xD')
-        nodos_nuevos += [self.__analizar_conjunto_instrucciones()]
-        self.__verificar('v:')
+        else:
+            self.__descartar_hasta(pila, None, cerrar)
 
-        return Nodo(TipoNodo.SIUUU, nodos=nodos_nuevos)
+        self.posicion_sincronizacion = posicion
+        return terminal, posicion
 
-    def __analizar_nimodo(self):
+    def terminar(self) -> None:
         """
-        Nimodo::=  nimodo xD ConjuntoInstrucciones v:
+        Levanta un SyntaxError si se reportó algún error, con un solo
+        error el mensaje es el de ese error
         """
 
-        nodos_nuevos = []
-
-        self.__verificar('nimodo')
-        self.__verificar('xD')
-        nodos_nuevos += [self.__analizar_conjunto_instrucciones()]
-        self.__verificar('v:')
+        if len(self.diagnosticos) == 1:
+            raise SyntaxError(self.descripcion_error)
 
-        return Nodo(TipoNodo.NIMODO, nodos=nodos_nuevos)
+        if self.diagnosticos:
+            raise SyntaxError(f'{len(self.diagnosticos)} errores de ' +
+                              'sintaxis en analizador')
 
-
-    def __analizar_conjunto_instrucciones(self) -> Nodo:
+    @staticmethod
+    def __descartar_hasta(pila: List, simbolo: Optional[str],
+                          cerrar: Optional[Callable]) -> None:
         """
-        ConjuntoInstrucciones ::= Instruccion+
+        Saca de la pila los símbolos que están sobre el último `simbolo`,
+        o todos si es None
         """
 
-        nodos_nuevos = []
-
-        # Valida la primera instrucción
-        nodos_nuevos += [self.__analizar_instruccion()]
+        while pila and pila[-1] != simbolo:
+            descartado = pila.pop()
+            if type(descartado) is not str:
+                cerrar(descartado)
 
-        # Recorre todas las instrucciones dentro de una función
-        # Las envía a verificar una por una
-        instrucciones = {'whenCuando', 'siuuu', 'messirve'}
-        while self.componente_actual.valor in instrucciones or\
-                self.componente_actual.tipo == 'IDENTIFICADOR':
-
-            nodos_nuevos += [self.__analizar_instruccion()]
-
-        return Nodo(TipoNodo.CONJUNTO_INSTRUCCIONES, nodos=nodos_nuevos)
-
-    def __analizar_expresion_condicional(self) -> Nodo:
+    def __volver_al_programa(self, pila: List,
+                             cerrar: Optional[Callable]) -> None:
         """
-        ExpCondicional ::= Comparación(OperadorLogico Comparación)?
+        Deja en la pila la producción del símbolo inicial, sólo queda
+        debajo la marca del nodo del programa si se está construyendo
         """
 
-        nodos_nuevos = []
+        base = 1 if pila and type(pila[0]) is not str else 0
+        while len(pila) > base:
+            descartado = pila.pop()
+            if type(descartado) is not str:
+                cerrar(descartado)
 
-        # Verifica la comparación
-        nodos_nuevos += [self.__analizar_comparacion()]
+        inicial = self.tablas.predeterminadas[self.tablas.inicial]
+        pila.extend(reversed(self.tablas.producciones[inicial][1]))
 
-        # Se valida si trae operador lógico y se manda a verificar
-        if self.componente_actual.tipo == 'OPERADOR_LOGICO':
-            nodos_nuevos += [self.__verificar_operador_logico()]
-            nodos_nuevos += [self.__analizar_comparacion()]
 
-        return Nodo(TipoNodo.EXPRESION_CONDICIONAL, nodos=nodos_nuevos)
-
-    def __analizar_comparacion(self) -> Nodo:
-        """
-        Comparación::= Valor Comporador Valor
-        """
-
-        nodos_nuevos = []
+class Analizador:
+    """
+    Clase encargada de revisar las reglas de gramatica en el programa
+    y construir el arbol de sintaxis, con un analizador LL(1) dirigido
+    por las tablas generadas desde la gramática declarativa de
+    `Analizador.gramatica`
+
+    En lugar de una función por regla utiliza una pila de símbolos y la
+    decisión de qué producción aplicar es una búsqueda en la tabla con
+    el terminal del componente actual. Los errores de sintaxis se
+    reportan todos y se recuperan igual que en el validador
+    (RecuperacionSintaxis)
+    """
 
-        # Se verifica la estructura de comparación
-        nodos_nuevos += [self.__analizar_valor()]
-        nodos_nuevos += [self.__verificar_comparador()]
-        nodos_nuevos += [self.__analizar_valor()]
-        return Nodo(TipoNodo.COMPARACION, nodos=nodos_nuevos)
+    componentes_lexicos: BufferLookahead
+    componente_actual: Optional[ComponenteLexico]
+    ast: ArbolSintaxisAbstracta
+    tablas: TablasAnalizador
+    recuperacion: RecuperacionSintaxis
 
-    def __analizar_retorno(self) -> Nodo:
+    def __init__(self, componentes: Iterable[ComponenteLexico],
+                 limite_errores: int = LIMITE_ERRORES,
+                 tablas: TablasAnalizador = None):
         """
-        Retorno: := messirve Valor?.
+        Los componentes pueden venir en una lista o en un generador
+        como el de `Explorador.iterar_componentes`
         """
 
-        nodos_nuevos = []
-
-        # Palabra clave obligatoria
-        self.__verificar('messirve')
+        self.componentes_lexicos = BufferLookahead(componentes)
+        self.componente_actual = self.componentes_lexicos.ver()
+        self.tablas = obtener_tablas() if tablas is None else tablas
+        self.recuperacion = RecuperacionSintaxis(self.tablas, limite_errores)
 
-        tipos_de_variable = {'IDENTIFICADOR', 'ENTERO', 'FLOTANTE',
-                             'BOOLEANO', 'TEXTO'}
-
-        if self.componente_actual.tipo in tipos_de_variable:
-            nodos_nuevos += [self.__analizar_valor()]
+        self.ast = ArbolSintaxisAbstracta()
 
-        # Punto obligatorio
-        self.__verificar('.')
-        return Nodo(TipoNodo.RETORNO, nodos=nodos_nuevos)
+    @property
+    def diagnosticos(self) -> List[DiagnosticoSintaxis]:
+        return self.recuperacion.diagnosticos
 
-    def __analizar_valor(self) -> Nodo:
+    def imprimir_ast(self) -> None:
         """
-        Valor : := Literal | Identificador
+        Imprime el árbol de sintáxis abstracta
         """
 
-        # Se revisa si corresponde a un identificador o un literal
-        if self.componente_actual.tipo == 'IDENTIFICADOR':
-            nodo = self.__verificar_identificador()
-
+        if self.ast.raiz is None:
+            print([])
         else:
-            nodo = self.__analizar_literal()
-
-        return nodo
-
-    def __analizar_literal(self) -> Nodo:
-        """
-        Literal ::= Texto|Entero|Flotante|Booleano
-        """
-
-        # Se verifica el tipo de literal y se manda al
-        # verificar correspondiente
-        if self.componente_actual.tipo == 'ENTERO':
-            nodo = self.__verificar_entero()
-
-        elif self.componente_actual.tipo == 'FLOTANTE':
-            nodo = self.__verificar_flotante()
-
-        elif self.componente_actual.tipo == 'BOOLEANO':
-            nodo = self.__verificar_booleano()
-
-        elif self.componente_actual.tipo == 'TEXTO':
-            nodo = self.__verificar_texto()
-
-        return nodo
-
-    def __verificar_entero(self) -> Nodo:
-        """
-        Entero::= -?[0-9]+
-        """
-
-        self.__verificar_tipo_componente('ENTERO')
-
-        nodo = Nodo(TipoNodo.ENTERO, contenido=self.componente_actual.valor,
-                    atributos=self.componente_actual.get_atributos())
-        self.__siguiente_componente()
-
-        return nodo
-
-    def __verificar_flotante(self) -> Nodo:
-        """
-        Flotante::= -?[0-9]+;[0-9]+
-        """
-
-        self.__verificar_tipo_componente('FLOTANTE')
-
-        nodo = Nodo(TipoNodo.FLOTANTE, contenido=self.componente_actual.valor,
-                    atributos=self.componente_actual.get_atributos())
-        self.__siguiente_componente()
-
-        return nodo
-
-    def __verificar_booleano(self) -> Nodo:
-        """
-        Booleano::= SIUA|NOUA
-        """
-
-        self.__verificar_tipo_componente('BOOLEANO')
-
-        nodo = Nodo(TipoNodo.BOOLEANO, contenido=self.componente_actual.valor,
-                    atributos=self.componente_actual.get_atributos())
-        self.__siguiente_componente()
-
-        return nodo
+            self.ast.imprimir_preorden()
 
-    def __verificar_texto(self) -> Nodo:
+    def analizar(self) -> None:
         """
-        Texto ::= ツ.*ツ
+        Analiza el programa completo. Si hay errores de sintaxis se
+        reportan todos, el árbol parcial queda con nodos de error y al
+        final se levanta un SyntaxError
         """
 
-        self.__verificar_tipo_componente('TEXTO')
-
-        nodo = Nodo(TipoNodo.TEXTO, contenido=self.componente_actual.valor,
-                    atributos=self.componente_actual.get_atributos())
-        self.__siguiente_componente()
-
-        return nodo
-
-    def __verificar_tipo_componente(self, tipo_componente_esperado) -> None:
-
-        # Error sintactico si no son de tipo equivalentes
-        if self.componente_actual.tipo != tipo_componente_esperado:
-            self.__error_verificacion_tipo(tipo_componente_esperado)
+        self.ast.raiz = self.__analizar_programa()
+        self.componentes_lexicos.descartar_restantes()
+        self.recuperacion.terminar()
 
-    def __siguiente_componente(self) -> None:
-        """
-        Pasa al siguiente componente léxico de la lista
+    def __analizar_programa(self) -> Nodo:
         """
+        Reconoce el programa con la pila de símbolos. Los nodos ya
+        construidos se acumulan en `valores` y por cada nodo abierto se
+        guarda en `inicios` cuántos valores había y el componente con el
+        que inicia, al terminar el nodo sus hijos son los valores que se
+        agregaron desde entonces
+        """
+
+        tablas = self.tablas
+        expansiones = obtener_expansiones(tablas)
+        flujo = self.componentes_lexicos
+
+        pila: List = [tablas.inicial]
+        valores: List[Nodo] = []
+        inicios: List[tuple] = []
+
+        def cerrar(regla: ReglaNodo) -> None:
+            inicio, primero = inicios.pop()
+            hijos = valores[inicio:]
+            del valores[inicio:]
+
+            # Después de un error el nodo puede quedar sin hijos
+            contenido = None
+            if regla.contenido_primer_hijo and hijos:
+                contenido = hijos[0].contenido
+
+            linea = columna = None
+            if regla.posicion and primero is not None:
+                linea, columna = primero.linea, primero.columna
+
+            valores.append(Nodo(regla.tipo, contenido=contenido,
+                                nodos=hijos, linea=linea, columna=columna))
+
+        # Posición del componente actual en el flujo
+        posicion = 0
+
+        componente = flujo.ver()
+        terminal = self.__terminal(componente)
+
+        while pila:
+            simbolo = pila.pop()
+
+            # Fin de un nodo, se construye con sus hijos
+            if type(simbolo) is not str:
+                cerrar(simbolo)
+                continue
+
+            fila = expansiones.get(simbolo)
+
+            # Terminal, debe coincidir con el componente actual
+            if fila is None:
+                if simbolo != terminal:
+                    pila.append(simbolo)
+                    valores.append(self.__error_terminal(simbolo, terminal,
+                                                         posicion))
+                    terminal, posicion = self.recuperacion.sincronizar(
+                        pila, terminal, posicion, self.__avanzar, cerrar)
+                    componente = flujo.ver()
+                    continue
+
+                hoja = HOJAS.get(simbolo)
+                if hoja is not None:
+                    valores.append(Nodo(hoja, contenido=componente.valor,
+                                        linea=componente.linea,
+                                        columna=componente.columna))
+
+                posicion += 1
+                componente = flujo.siguiente()
+                if componente is None:
+                    terminal = FIN
+                    continue
+
+                self.componente_actual = componente
+                terminal = componente.tipo
+                if terminal not in TERMINALES_POR_TIPO:
+                    terminal = componente.valor
+                continue
+
+            # No terminal, la producción se busca en la tabla
+            if terminal in fila:
+                expansion = fila[terminal]
+            else:
+                expansion = calcular_expansion(tablas, simbolo, terminal)
+                fila[terminal] = expansion
 
-        # Recorre los componentes hasta llegar a su cantidad máxima
-        self.posicion_componente_actual += 1
+            if expansion is None:
+                pila.append(simbolo)
+                valores.append(self.__error_esperados(
+                    sorted(tablas.tabla[simbolo]), terminal, posicion))
+                terminal, posicion = self.recuperacion.sincronizar(
+                    pila, terminal, posicion, self.__avanzar, cerrar)
+                componente = flujo.ver()
+                continue
 
-        if self.posicion_componente_actual >= self.cantidad_componentes:
-            return
+            simbolos, nodos_abiertos = expansion
+            if nodos_abiertos:
+                inicios.extend([(len(valores), componente)] * nodos_abiertos)
+            pila.extend(simbolos)
 
-        self.componente_actual =\
-            self.componentes_lexicos[self.posicion_componente_actual]
+        return valores[0]
 
-    def __analizar_expresion_matematica(self) -> Nodo:
+    def __avanzar(self) -> str:
         """
-        ExpresionMatematica::= #Valor (Operador Valor)*#
+        Consume el componente actual y retorna el terminal del siguiente
         """
 
-        nodos_nuevos = []
-
-        self.__verificar('#')
-
-        # Se verifica el primer valor
-        nodos_nuevos += [self.__analizar_valor()]
-
-        # Como pueden o no estar se validan mientras siga un operador
-        while(self.componente_actual.tipo == 'OPERADOR'):
+        componente = self.componentes_lexicos.siguiente()
+        if componente is None:
+            return FIN
 
-            nodos_nuevos += [self.__verificar_operador()]
-            nodos_nuevos += [self.__analizar_valor()]
+        self.componente_actual = componente
+        return self.__terminal(componente)
 
-        self.__verificar('#')
-
-        return Nodo(TipoNodo.EXPRESION_MATEMATICA, nodos=nodos_nuevos)
-
-    def __verificar_operador(self) -> Nodo:
+    @staticmethod
+    def __terminal(componente: Optional[ComponenteLexico]) -> str:
         """
-        Operador::= bobMar | bobStar | bobiDir | bobTiplicar
+        Terminal de la gramática para el componente actual
         """
 
-        self.__verificar_tipo_componente('OPERADOR')
+        if componente is None:
+            return FIN
 
-        nodo = Nodo(TipoNodo.OPERADOR, contenido=self.componente_actual.valor,
-                    atributos=self.componente_actual.get_atributos())
-        self.__siguiente_componente()
+        return terminal_componente(componente.tipo, componente.valor)
 
-        return nodo
-
-    def __verificar_operador_logico(self) -> Nodo:
+    def __error_terminal(self, esperado: str, terminal: str,
+                         posicion: int) -> Nodo:
         """
-        OperadorLogico::= aja | ayno
+        Reporta el error de sintaxis cuando el componente actual no es
+        el terminal esperado
         """
 
-        self.__verificar_tipo_componente('OPERADOR_LOGICO')
-
-        nodo = Nodo(TipoNodo.OPERADOR_LOGICO,
-                    contenido=self.componente_actual.valor,
-                    atributos=self.componente_actual.get_atributos())
-                    
-        self.__siguiente_componente()
+        if esperado in TERMINALES_POR_TIPO:
+            return self.__error_verificacion_tipo(repr(esperado), terminal,
+                                                  posicion)
 
-        return nodo
+        return self.__error_verificacion_texto(repr(esperado), terminal,
+                                               posicion)
 
-    def __verificar_comparador(self) -> Nodo:
+    def __error_esperados(self, esperados: List[str], terminal: str,
+                          posicion: int) -> Nodo:
         """
-        Comparador ::= chikito | tapotente | panapotente |
-                        panachikito | nolocrick | panas
+        Reporta el error de sintaxis cuando ninguna producción del
+        no terminal inicia con el componente actual
         """
 
-        self.__verificar_tipo_componente('COMPARADOR')
+        descripcion = ' | '.join(repr(esperado) for esperado in esperados)
 
-        nodo = Nodo(TipoNodo.COMPARADOR,
-                    contenido=self.componente_actual.valor,
-                    atributos=self.componente_actual.get_atributos())
-        self.__siguiente_componente()
+        if all(esperado in TERMINALES_POR_TIPO for esperado in esperados):
+            return self.__error_verificacion_tipo(descripcion, terminal,
+                                                  posicion)
 
-        return nodo
+        return self.__error_verificacion_texto(descripcion, terminal,
+                                               posicion)
 
-    def __verificar(self, texto_esperado: str) -> None:
+    def __registrar_error(self, mensaje: str, descripcion: str,
+                          posicion: int) -> Nodo:
         """
-        Verifica si el texto del componente léxico actual corresponde con
-        el esperado cómo argumento
+        Reporta el error en el componente actual, al final del flujo en
+        el último componente, y retorna el nodo de error que queda en
+        el árbol parcial
         """
 
-        # Error sintactico si no tienen el mismo contenido
-        if self.componente_actual.valor != texto_esperado:
-            self.__error_verificacion_texto(texto_esperado)
+        linea = columna = None
+        if self.componente_actual is not None:
+            linea = self.componente_actual.linea
+            columna = self.componente_actual.columna
 
-        self.__siguiente_componente()
+        self.recuperacion.registrar(mensaje, descripcion, posicion,
+                                    linea, columna)
+        return Nodo(TipoNodo.ERROR, contenido=mensaje, linea=linea,
+                    columna=columna)
 
-    def __error_verificacion_texto(self, texto_esperado: str) -> NoReturn:
+    def __error_verificacion_texto(self, texto_esperado: str, terminal: str,
+                                   posicion: int) -> Nodo:
         """
-        Levanta un error de sintaxis si no empareja un texto esperado
+        Reporta un error de sintaxis si no empareja un texto esperado
         con el texto del componenete actual
         """
 
-        texto_encontrado = self.componente_actual.valor
-        linea, columna = self.componente_actual.get_atributos().values()
-        print(f'Texto esperado: {texto_esperado!r} ' +
-              f'texto encontrado : {texto_encontrado!r} ' +
-              f'(Linea {linea}, Columna {columna})')
+        texto_encontrado = FIN
+        if terminal != FIN:
+            texto_encontrado = self.componente_actual.valor
 
-        raise SyntaxError('Error de verificacion de texto en analizador')
+        return self.__registrar_error(
+            f'Texto esperado: {texto_esperado} ' +
+            f'texto encontrado : {texto_encontrado!r}',
+            'Error de verificacion de texto en analizador', posicion)
 
-    def __error_verificacion_tipo(self, tipo_esperado: str) -> NoReturn:
+    def __error_verificacion_tipo(self, tipo_esperado: str, terminal: str,
+                                  posicion: int) -> Nodo:
         """
-        Levanta un error de sintaxis si no empareja un tipo esperado
+        Reporta un error de sintaxis si no empareja un tipo esperado
         con el tipo del componente actual
         """
 
-        tipo_encontrado = self.componente_actual.tipo
-        linea, columna = self.componente_actual.get_atributos().values()
-        print(f'Tipo esperado: {tipo_esperado!r} ' +
-              f'tipo encontrado : {tipo_encontrado!r} ' +
-              f'(Linea {linea}, Columna {columna})')
+        tipo_encontrado = FIN
+        if terminal != FIN:
+            tipo_encontrado = self.componente_actual.tipo
 
-        raise SyntaxError('Error de verificacion de tipos en analizador')
+        return self.__registrar_error(
+            f'Tipo esperado: {tipo_esperado} ' +
+            f'tipo encontrado : {tipo_encontrado!r}',
+            'Error de verificacion de tipos en analizador', posicion)
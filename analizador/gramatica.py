@@ -0,0 +1,374 @@
+import hashlib
+import json
+from functools import lru_cache
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from Utils.arbol import TipoNodo
+
+# Símbolo que representa el final del flujo de componentes
+FIN = '$'
+
+# Componentes cuyo terminal es su tipo, para el resto el terminal
+# es su valor (palabras clave y puntuación)
+TERMINALES_POR_TIPO: FrozenSet[str] = frozenset({
+    'IDENTIFICADOR', 'ENTERO', 'FLOTANTE', 'BOOLEANO', 'TEXTO',
+    'OPERADOR', 'COMPARADOR', 'OPERADOR_LOGICO'})
+
+# Terminales que generan una hoja en el árbol
+HOJAS: Dict[str, TipoNodo] = {
+    terminal: TipoNodo[terminal] for terminal in TERMINALES_POR_TIPO}
+
+
+# Gramática de C-Mamuth, cada no terminal tiene sus producciones en
+# orden. Los no terminales que no aparecen en NODOS son auxiliares y sus
+# hijos pasan directamente al nodo que los contiene
+GRAMATICA: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+
+    # Programa ::= (Asignación | Funcion)* Principal
+    'Programa': (('Declaraciones', 'Principal'),),
+    'Declaraciones': (('Asignacion', 'Declaraciones'),
+                      ('Funcion', 'Declaraciones'),
+                      ()),
+
+    # Asignación ::= Identificador anotado
+    #                (Valor | Invocación | ExpresiónMatematica)?.
+    'Asignacion': (('IDENTIFICADOR', 'anotado', 'ValorAsignacion', '.'),),
+    'ValorAsignacion': (('ExpresionMatematica',),
+                        ('Invocacion',),
+                        ('Valor',),
+                        ()),
+
+    # Invocación ::= jutsu Identificador(Parámetros?)
+    'Invocacion': (('jutsu', 'IDENTIFICADOR',
+                    '(', 'ParametrosOpcionales', ')'),),
+
+    # Función ::= POV Identificador(Parámetros?) xD ConjuntoInstrucciones v:
+    'Funcion': (('POV', 'IDENTIFICADOR', '(', 'ParametrosOpcionales', ')',
+                 'xD', 'ConjuntoInstrucciones', 'v:'),),
+
+    # Principal::= maracuya() xD ConjuntoInstrucciones v:
+    'Principal': (('maracuya', '(', ')',
+                   'xD', 'ConjuntoInstrucciones', 'v:'),),
+
+    # ParámetrosFuncion::= Identificador (, Identificador)*
+    'ParametrosOpcionales': (('ParametrosFuncion',), ()),
+    'ParametrosFuncion': (('IDENTIFICADOR', 'MasParametros'),),
+    'MasParametros': ((',', 'IDENTIFICADOR', 'MasParametros'), ()),
+
+    # ConjuntoInstrucciones ::= Instruccion+
+    # la primera instrucción de un conjunto puede venir vacía
+    'ConjuntoInstrucciones': (('Instruccion', 'MasInstrucciones'),
+                              ('InstruccionVacia',)),
+    'MasInstrucciones': (('Instruccion', 'MasInstrucciones'), ()),
+    'InstruccionVacia': ((),),
+
+    # Instrucciones ::= Asignación | Repetir | Condicional | Retorno
+    'Instruccion': (('Asignacion',),
+                    ('Repetir',),
+                    ('Condicional',),
+                    ('Retorno',)),
+
+    # Repetir ::= whenCuando xD ConjuntoInstrucciones but (ExpCondicional) v:
+    'Repetir': (('whenCuando', 'xD', 'ConjuntoInstrucciones',
+                 'but', '(', 'ExpCondicional', ')', 'v:'),),
+
+    # Condicional::= Siuuu Nimodo?
+    'Condicional': (('Siuuu', 'NimodoOpcional'),),
+    'NimodoOpcional': (('Nimodo',), ()),
+
+    # Siuuu::= siuuu (ExpCondicional) xD Conjunto Instrucciones v:
+    'Siuuu': (('siuuu', '(', 'ExpCondicional', ')',
+               'xD', 'ConjuntoInstrucciones', 'v:'),),
+
+    # Nimodo::=  nimodo xD ConjuntoInstrucciones v:
+    'Nimodo': (('nimodo', 'xD', 'ConjuntoInstrucciones', 'v:'),),
+
+    # ExpCondicional ::= Comparación(OperadorLogico Comparación)?
+    'ExpCondicional': (('Comparacion', 'ComparacionLogica'),),
+    'ComparacionLogica': (('OPERADOR_LOGICO', 'Comparacion'), ()),
+
+    # Comparación::= Valor Comporador Valor
+    'Comparacion': (('Valor', 'COMPARADOR', 'Valor'),),
+
+    # Retorno: := messirve Valor?.
+    'Retorno': (('messirve', 'ValorOpcional', '.'),),
+    'ValorOpcional': (('Valor',), ()),
+
+    # Valor : := Literal | Identificador
+    'Valor': (('IDENTIFICADOR',),
+              ('ENTERO',),
+              ('FLOTANTE',),
+              ('BOOLEANO',),
+              ('TEXTO',)),
+
+    # ExpresionMatematica::= #Valor (Operador Valor)*#
+    'ExpresionMatematica': (('#', 'Valor', 'MasOperaciones', '#'),),
+    'MasOperaciones': (('OPERADOR', 'Valor', 'MasOperaciones'), ()),
+}
+
+SIMBOLO_INICIAL = 'Programa'
+
+# Versión del generador de tablas, forma parte de la firma para
+# distinguir las tablas cuando cambia la construcción
+VERSION_TABLAS = 1
+
+
+class ReglaNodo(NamedTuple):
+    """
+    Describe el nodo que se construye al terminar de reconocer
+    un no terminal
+    """
+
+    tipo: TipoNodo
+
+    # El contenido del nodo es el contenido de su primer hijo
+    contenido_primer_hijo: bool = False
+
+    # Los atributos del nodo son la posición de su primer componente
+    posicion: bool = False
+
+
+NODOS: Dict[str, ReglaNodo] = {
+    'Programa': ReglaNodo(TipoNodo.PROGRAMA),
+    'Asignacion': ReglaNodo(TipoNodo.ASIGNACION),
+    'Invocacion': ReglaNodo(TipoNodo.INVOCACION, contenido_primer_hijo=True),
+    'Funcion': ReglaNodo(TipoNodo.FUNCION, contenido_primer_hijo=True),
+    'Principal': ReglaNodo(TipoNodo.PRINCIPAL, posicion=True),
+    'ParametrosFuncion': ReglaNodo(TipoNodo.PARAMETROS_FUNCION),
+    'ConjuntoInstrucciones': ReglaNodo(TipoNodo.CONJUNTO_INSTRUCCIONES),
+    'Instruccion': ReglaNodo(TipoNodo.INSTRUCCION),
+    'InstruccionVacia': ReglaNodo(TipoNodo.INSTRUCCION),
+    'Repetir': ReglaNodo(TipoNodo.REPETIR),
+    'Condicional': ReglaNodo(TipoNodo.CONDICIONAL),
+    'Siuuu': ReglaNodo(TipoNodo.SIUUU),
+    'Nimodo': ReglaNodo(TipoNodo.NIMODO),
+    'ExpCondicional': ReglaNodo(TipoNodo.EXPRESION_CONDICIONAL),
+    'Comparacion': ReglaNodo(TipoNodo.COMPARACION),
+    'Retorno': ReglaNodo(TipoNodo.RETORNO),
+    'ExpresionMatematica': ReglaNodo(TipoNodo.EXPRESION_MATEMATICA),
+}
+
+
+class TablasAnalizador(NamedTuple):
+    """
+    Tablas LL(1) generadas a partir de la gramática
+
+    `producciones` tiene todas las producciones numeradas como
+    (no terminal, lado derecho), `tabla` indica para cada no terminal
+    qué producción usar según el terminal actual y `predeterminadas`
+    la producción que se usa cuando el terminal actual no está en la
+    tabla: la vacía en los no terminales anulables o la única que
+    tenga el no terminal, así el error se reporta en el primer
+    terminal que no coincide
+    """
+
+    firma: str
+    inicial: str
+    producciones: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    tabla: Dict[str, Dict[str, int]]
+    predeterminadas: Dict[str, int]
+
+
+def terminal_componente(tipo: str, valor: str) -> str:
+    """
+    Devuelve el terminal de la gramática que corresponde a un
+    componente léxico
+    """
+
+    return tipo if tipo in TERMINALES_POR_TIPO else valor
+
+
+def firma_gramatica() -> str:
+    """
+    Calcula una huella de la gramática, identifica las tablas en
+    las expansiones ya calculadas
+    """
+
+    contenido = json.dumps([VERSION_TABLAS, SIMBOLO_INICIAL, GRAMATICA],
+                           ensure_ascii=False)
+    return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+
+def calcular_primeros(gramatica: Dict = GRAMATICA) -> Dict[str, set]:
+    """
+    Calcula el conjunto PRIMEROS de cada no terminal, la cadena
+    vacía se representa con ''
+    """
+
+    primeros = {no_terminal: set() for no_terminal in gramatica}
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for no_terminal, producciones in gramatica.items():
+            for produccion in producciones:
+                nuevos = primeros_secuencia(produccion, primeros)
+                if not nuevos <= primeros[no_terminal]:
+                    primeros[no_terminal] |= nuevos
+                    cambio = True
+
+    return primeros
+
+
+def primeros_secuencia(secuencia: Tuple[str, ...],
+                       primeros: Dict[str, set]) -> set:
+    """
+    Calcula el conjunto PRIMEROS de una secuencia de símbolos
+    """
+
+    resultado = set()
+
+    for simbolo in secuencia:
+        if simbolo not in primeros:
+            resultado.add(simbolo)
+            return resultado
+
+        resultado |= primeros[simbolo] - {''}
+        if '' not in primeros[simbolo]:
+            return resultado
+
+    resultado.add('')
+    return resultado
+
+
+def calcular_siguientes(primeros: Dict[str, set],
+                        gramatica: Dict = GRAMATICA,
+                        inicial: str = SIMBOLO_INICIAL) -> Dict[str, set]:
+    """
+    Calcula el conjunto SIGUIENTES de cada no terminal
+    """
+
+    siguientes = {no_terminal: set() for no_terminal in gramatica}
+    siguientes[inicial].add(FIN)
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for no_terminal, producciones in gramatica.items():
+            for produccion in producciones:
+                for posicion, simbolo in enumerate(produccion):
+                    if simbolo not in gramatica:
+                        continue
+
+                    resto = primeros_secuencia(produccion[posicion + 1:],
+                                               primeros)
+                    nuevos = resto - {''}
+                    if '' in resto:
+                        nuevos |= siguientes[no_terminal]
+
+                    if not nuevos <= siguientes[simbolo]:
+                        siguientes[simbolo] |= nuevos
+                        cambio = True
+
+    return siguientes
+
+
+def construir_tablas(gramatica: Dict = GRAMATICA,
+                     inicial: str = SIMBOLO_INICIAL,
+                     firma: Optional[str] = None) -> TablasAnalizador:
+    """
+    Construye las tablas LL(1), levanta un ValueError si la
+    gramática tiene conflictos
+    """
+
+    primeros = calcular_primeros(gramatica)
+    siguientes = calcular_siguientes(primeros, gramatica, inicial)
+
+    producciones = []
+    tabla = {no_terminal: {} for no_terminal in gramatica}
+    predeterminadas = {}
+
+    for no_terminal, lados_derechos in gramatica.items():
+        if len(lados_derechos) == 1:
+            predeterminadas[no_terminal] = len(producciones)
+
+        for lado_derecho in lados_derechos:
+            indice = len(producciones)
+            producciones.append((no_terminal, tuple(lado_derecho)))
+
+            terminales = primeros_secuencia(lado_derecho, primeros)
+            if '' in terminales:
+                terminales = (terminales - {''}) | siguientes[no_terminal]
+                predeterminadas[no_terminal] = indice
+
+            for terminal in terminales:
+                anterior = tabla[no_terminal].setdefault(terminal, indice)
+                if anterior != indice:
+                    raise ValueError(
+                        f'Conflicto LL(1) en {no_terminal!r} con '
+                        f'{terminal!r}: {producciones[anterior][1]} y '
+                        f'{lado_derecho}')
+
+    if firma is None:
+        firma = firma_gramatica()
+
+    return TablasAnalizador(firma, inicial, tuple(producciones),
+                            tabla, predeterminadas)
+
+
+@lru_cache(maxsize=None)
+def obtener_tablas() -> TablasAnalizador:
+    """
+    Devuelve las tablas del analizador, se construyen
+    una única vez por proceso
+    """
+
+    return construir_tablas()
+
+
+# Expansiones ya calculadas por firma de las tablas, si llevan las
+# marcas de los nodos, no terminal y terminal
+_expansiones: Dict[Tuple[str, bool], Dict[str, Dict[str, tuple]]] = {}
+
+
+def calcular_expansion(tablas: TablasAnalizador, no_terminal: str,
+                       terminal: str, con_nodos: bool = True) -> \
+        Optional[Tuple[tuple, int]]:
+    """
+    Calcula los símbolos que se apilan al expandir `no_terminal` con
+    `terminal` como componente actual
+
+    Mientras el símbolo de arriba sea un no terminal su producción
+    también queda decidida por el mismo terminal, así que se expande de
+    una vez hasta que arriba quede un terminal. Retorna los símbolos en
+    el orden en que se apilan, junto con cuántos nodos se abrieron
+    (cada uno se marca en la pila con su ReglaNodo), o None si el
+    no terminal no tiene producción para el terminal. Sin `con_nodos`
+    no se agregan las marcas, para reconocer sin construir el árbol
+    """
+
+    pila = [no_terminal]
+    nodos_abiertos = 0
+
+    while pila and pila[-1] in tablas.tabla:
+        simbolo = pila[-1]
+        indice = tablas.tabla[simbolo].get(terminal)
+        if indice is None:
+            indice = tablas.predeterminadas.get(simbolo)
+            if indice is None:
+                # El no terminal inicial no tiene cómo expandirse
+                if len(pila) == 1 and nodos_abiertos == 0:
+                    return None
+                break
+
+        pila.pop()
+        regla = NODOS.get(simbolo) if con_nodos else None
+        if regla is not None:
+            pila.append(regla)
+            nodos_abiertos += 1
+
+        pila.extend(reversed(tablas.producciones[indice][1]))
+
+    return tuple(pila), nodos_abiertos
+
+
+def obtener_expansiones(tablas: TablasAnalizador,
+                        con_nodos: bool = True) -> Dict[str, Dict[str, tuple]]:
+    """
+    Devuelve el caché de expansiones de las tablas, se llena conforme
+    el analizador encuentra cada combinación de no terminal y terminal
+    """
+
+    return _expansiones.setdefault(
+        (tablas.firma, con_nodos),
+        {no_terminal: {} for no_terminal in tablas.tabla})
@@ -0,0 +1,205 @@
+from typing import Iterator, List, Sequence
+
+from Analizador.analizador import (LIMITE_ERRORES, DiagnosticoSintaxis,
+                                   RecuperacionSintaxis)
+from Analizador.gramatica import (FIN, TERMINALES_POR_TIPO, TablasAnalizador,
+                                  calcular_expansion, obtener_expansiones,
+                                  obtener_tablas, terminal_componente)
+from Explorador.componentes import BufferComponentes
+from Explorador.explorador import ComponenteLexico
+from Explorador.tablas import TIPOS_COMPONENTE
+
+
+# Por cada código de tipo de componente el terminal que le corresponde,
+# o None si el terminal es el valor del componente
+TERMINAL_POR_CODIGO = tuple(tipo if tipo in TERMINALES_POR_TIPO else None
+                            for tipo in TIPOS_COMPONENTE)
+
+
+class Validador:
+    """
+    Reconoce un programa con las mismas tablas LL(1) del analizador
+    por tablas pero sin construir el árbol, sólo indica si el programa
+    cumple la gramática. Reporta todos los errores de sintaxis y se
+    recupera de ellos igual que el analizador por tablas
+
+    No crea nodos ni copia atributos, con un BufferComponentes tampoco
+    crea componentes léxicos: los terminales se toman directamente de
+    los arreglos del buffer y la posición sólo se calcula si hay error
+    """
+
+    componentes_lexicos: Sequence[ComponenteLexico]
+    posicion_componente_actual: int
+    tablas: TablasAnalizador
+    recuperacion: RecuperacionSintaxis
+
+    def __init__(self, componentes: Sequence[ComponenteLexico],
+                 limite_errores: int = LIMITE_ERRORES,
+                 tablas: TablasAnalizador = None):
+
+        self.componentes_lexicos = componentes
+        self.posicion_componente_actual = 0
+        self.tablas = obtener_tablas() if tablas is None else tablas
+        self.recuperacion = RecuperacionSintaxis(self.tablas, limite_errores)
+
+    @property
+    def diagnosticos(self) -> List[DiagnosticoSintaxis]:
+        return self.recuperacion.diagnosticos
+
+    def validar(self) -> None:
+        """
+        Levanta un SyntaxError si el programa no cumple la gramática,
+        después de reportar todos los errores
+        """
+
+        tablas = self.tablas
+        expansiones = obtener_expansiones(tablas, con_nodos=False)
+        recuperacion = self.recuperacion
+
+        terminales = self.__iterar_terminales()
+
+        def avanzar() -> str:
+            return next(terminales, FIN)
+
+        terminal = avanzar()
+        posicion = 0
+
+        pila = [tablas.inicial]
+
+        while pila:
+            simbolo = pila.pop()
+            fila = expansiones.get(simbolo)
+
+            # Terminal, debe coincidir con el componente actual
+            if fila is None:
+                if simbolo != terminal:
+                    pila.append(simbolo)
+                    self.posicion_componente_actual = posicion
+                    self.__error_terminal(simbolo, terminal)
+                    terminal, posicion = recuperacion.sincronizar(
+                        pila, terminal, posicion, avanzar)
+                    continue
+
+                posicion += 1
+                terminal = next(terminales, FIN)
+                continue
+
+            # No terminal, la producción se busca en la tabla
+            if terminal in fila:
+                expansion = fila[terminal]
+            else:
+                expansion = calcular_expansion(tablas, simbolo, terminal,
+                                               con_nodos=False)
+                fila[terminal] = expansion
+
+            if expansion is None:
+                pila.append(simbolo)
+                self.posicion_componente_actual = posicion
+                self.__error_esperados(sorted(tablas.tabla[simbolo]),
+                                       terminal)
+                terminal, posicion = recuperacion.sincronizar(
+                    pila, terminal, posicion, avanzar)
+                continue
+
+            pila.extend(expansion[0])
+
+        recuperacion.terminar()
+
+    def __iterar_terminales(self) -> Iterator[str]:
+        """
+        Genera el terminal de cada componente léxico
+        """
+
+        componentes = self.componentes_lexicos
+
+        if not isinstance(componentes, BufferComponentes):
+            for componente in componentes:
+                yield terminal_componente(componente.tipo, componente.valor)
+            return
+
+        texto = componentes.texto
+        for codigo, inicio, fin in zip(componentes.tipos,
+                                       componentes.inicios,
+                                       componentes.finales):
+            terminal = TERMINAL_POR_CODIGO[codigo]
+            yield texto[inicio:fin] if terminal is None else terminal
+
+    def __error_terminal(self, esperado: str, encontrado: str) -> None:
+        """
+        Reporta el error de sintaxis cuando el componente actual no es
+        el terminal esperado
+        """
+
+        if esperado in TERMINALES_POR_TIPO:
+            self.__error_verificacion_tipo(repr(esperado), encontrado)
+        else:
+            self.__error_verificacion_texto(repr(esperado), encontrado)
+
+    def __error_esperados(self, esperados: list, encontrado: str) -> None:
+        """
+        Reporta el error de sintaxis cuando ninguna producción del
+        no terminal inicia con el componente actual
+        """
+
+        descripcion = ' | '.join(repr(esperado) for esperado in esperados)
+
+        if all(esperado in TERMINALES_POR_TIPO for esperado in esperados):
+            self.__error_verificacion_tipo(descripcion, encontrado)
+        else:
+            self.__error_verificacion_texto(descripcion, encontrado)
+
+    def __componente_error(self) -> ComponenteLexico:
+        """
+        Componente en el que se encontró el error, al final del flujo
+        se reporta la posición del último componente
+        """
+
+        indice = min(self.posicion_componente_actual,
+                     len(self.componentes_lexicos) - 1)
+        return self.componentes_lexicos[indice]
+
+    def __registrar_error(self, mensaje: str, descripcion: str) -> None:
+        """
+        Reporta el error en la posición del componente donde se encontró
+        """
+
+        linea = columna = None
+        if len(self.componentes_lexicos) != 0:
+            componente = self.__componente_error()
+            linea, columna = componente.linea, componente.columna
+
+        self.recuperacion.registrar(mensaje, descripcion,
+                                    self.posicion_componente_actual,
+                                    linea, columna)
+
+    def __error_verificacion_texto(self, texto_esperado: str,
+                                   terminal: str) -> None:
+        """
+        Reporta un error de sintaxis si no empareja un texto esperado
+        con el texto del componenete actual
+        """
+
+        texto_encontrado = FIN
+        if terminal != FIN:
+            texto_encontrado = self.__componente_error().valor
+
+        self.__registrar_error(
+            f'Texto esperado: {texto_esperado} ' +
+            f'texto encontrado : {texto_encontrado!r}',
+            'Error de verificacion de texto en analizador')
+
+    def __error_verificacion_tipo(self, tipo_esperado: str,
+                                  terminal: str) -> None:
+        """
+        Reporta un error de sintaxis si no empareja un tipo esperado
+        con el tipo del componente actual
+        """
+
+        tipo_encontrado = FIN
+        if terminal != FIN:
+            tipo_encontrado = self.__componente_error().tipo
+
+        self.__registrar_error(
+            f'Tipo esperado: {tipo_esperado} ' +
+            f'tipo encontrado : {tipo_encontrado!r}',
+            'Error de verificacion de tipos en analizador')
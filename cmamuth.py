@@ -2,12 +2,28 @@
 
 import os
 import sys
+import time
 from argparse import ArgumentParser
+from contextlib import contextmanager
+from types import CodeType
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
 
-from Analizador.analizador import Analizador
+from Analizador.analizador import LIMITE_ERRORES, Analizador
+from Analizador.validador import Validador
 from Explorador.explorador import Explorador
+from Generador.bytecode import a_bytes, desde_bytes, escribir_pyc
 from Generador.generador import Generador
+from Optimizador.optimizador import Optimizador
 from Utils import archivos as utils
+from Utils.archivos import escribir_bloques
+from Utils.arbol import TipoNodo
+from Utils.arena import ArbolArena
+from Utils.cache import (BYTECODE, DEPENDENCIAS, CacheArtefactos,
+                         clave_archivo, clave_ruta, directorio_cache)
+from Utils.internado import InternadorNodos
+from Utils.render import FORMATOS, escribir_arbol, escribir_verificacion
+from Verificador.estandar import cargar_nativas
+from Verificador.grafo import GrafoLlamadas
 from Verificador.verificador import Verificador
 
 parser = ArgumentParser(
@@ -21,6 +37,10 @@ parser.add_argument('--analizar', '-a', dest='analizar', action='store_true',
                     help='''Ejecutar el interprete hasta el analizador
                 unicamente mostrando arbol''')
 
+parser.add_argument('--validar', dest='validar', action='store_true',
+                    help='''Revisar únicamente la sintaxis del programa sin
+                construir el arbol''')
+
 parser.add_argument('--verificar', '-v', dest='verificar', action='store_true',
                     help='''Ejecutar el interprete hasta el verificador
                 mostrando arbol y tabla de simbolos''')
@@ -28,46 +48,393 @@ parser.add_argument('--verificar', '-v', dest='verificar', action='store_true',
 parser.add_argument('--generar', '-g', dest='generar', action='store_true',
                     help='''Ejecutar el interprete para generar código de cmamuth en python''')
 
+parser.add_argument('--pyc', dest='pyc', metavar='ARCHIVO',
+                    help='''Compilar el programa a un objeto de código de
+                python y guardarlo en ARCHIVO, que se ejecuta con
+                python3 ARCHIVO''')
+
+parser.add_argument('--ejecutar', '-x', dest='ejecutar', action='store_true',
+                    help='''Compilar el programa y ejecutar su principal en
+                el mismo proceso, el objeto de código compilado se guarda
+                en la caché aunque no se use --cache''')
+
+parser.add_argument('--posiciones', dest='posiciones', action='store_true',
+                    help='''Con --pyc y --ejecutar compilar sin pasar por el
+                texto, los errores al ejecutar muestran las líneas del
+                archivo .cm. Es más lento que compilar el código generado''')
+
+parser.add_argument('--salida', '-o', dest='salida', metavar='ARCHIVO',
+                    help='''Archivo donde se escribe el resultado (el código
+                generado, el arbol o la tabla de simbolos) en lugar de
+                la salida estándar''')
+
+parser.add_argument('-O', dest='optimizacion', action='count', default=0,
+                    help='''Optimizar el código generado: -O calcula las
+                expresiones con constantes y -OO además elimina las ramas
+                con condición conocida y lo que sigue a un messirve''')
+
+parser.add_argument('--eliminadas', dest='eliminadas', action='store_true',
+                    help='''Listar en la salida de errores las funciones y
+                asignaciones globales que no se generan porque la
+                principal no llega a ellas''')
+
+parser.add_argument('--nativas', dest='nativas', action='append',
+                    default=[], metavar='MANIFIESTO',
+                    help='''Manifiesto JSON con funciones nativas que se
+                agregan a las estándar, se puede repetir''')
+
+parser.add_argument('--procesos', '-p', dest='procesos', type=int,
+                    help='''Cantidad de procesos para explorar en paralelo
+                archivos grandes y verificar en paralelo las funciones''')
+
+parser.add_argument('--arena', dest='arena', action='store_true',
+                    help='''Guardar el arbol en arreglos paralelos en lugar
+                de nodos enlazados''')
+
+parser.add_argument('--compartir', dest='compartir', action='store_true',
+                    help='''Compartir los literales, identificadores y
+                expresiones que se repiten en el arbol ya construido''')
+
+parser.add_argument('--formato', dest='formato', choices=FORMATOS,
+                    default='texto',
+                    help='''Formato en que se muestran el arbol y la tabla
+                de simbolos''')
+
+parser.add_argument('--profundidad', dest='profundidad', type=int,
+                    help='''Profundidad maxima del arbol que se muestra,
+                los nodos mas profundos se omiten''')
+
+parser.add_argument('--limite-errores', dest='limite_errores', type=int,
+                    default=LIMITE_ERRORES,
+                    help='''Cantidad de errores de sintaxis que se reportan
+                antes de detener el analizador''')
+
+parser.add_argument('--cache', dest='cache', action='store_true',
+                    help='''Usar y guardar los resultados de cada etapa en
+                la caché .cmcache/ junto al archivo''')
+
 parser.add_argument('archivo',
                     help='Archivo de código fuente .cm')
 
 args = parser.parse_args()
 
+# La validación no produce artefactos, no necesita la caché
+cache = None
+if args.cache and not args.validar:
+    cache = CacheArtefactos(directorio_cache(args.archivo))
+
+# --ejecutar siempre guarda el objeto de código, así volver a ejecutar
+# el mismo archivo no lo compila. Las otras etapas sólo con --cache
+cache_bytecode = cache
+if args.ejecutar and cache is None:
+    cache_bytecode = CacheArtefactos(directorio_cache(args.archivo))
+
+# Las funciones nativas y el nivel de optimización cambian el
+# resultado, su manifiesto y el nivel son parte de la clave de la caché
+opciones_cache = []
+
+
+def etapa_objetivo() -> str:
+    """
+    Última etapa que se necesita según las opciones
+    """
+
+    if args.explorar:
+        return 'componentes'
+    if args.analizar:
+        return 'arbol'
+    if args.generar:
+        # La lista de eliminadas y el bytecode salen del árbol verificado
+        if args.eliminadas or args.pyc or args.ejecutar:
+            return 'verificado'
+        return 'python'
+    return 'verificado'
 
-def cmamuth() -> None:
+
+def compartir(arbol):
+    """
+    Comparte los subárboles repetidos si se pidió, sólo se aplica al
+    árbol que ya no va a cambiar
+    """
+
+    if args.compartir:
+        return InternadorNodos().internar(arbol)
+    return arbol
+
+
+@contextmanager
+def abrir_salida() -> Iterator[TextIO]:
+    """
+    Archivo de `--salida` o la salida estándar, se abre hasta que hay
+    algo que escribir
+    """
+
+    if args.salida is None:
+        yield sys.stdout
+    else:
+        with open(args.salida, 'w', encoding='utf-8') as salida:
+            yield salida
+
+
+def imprimir_arbol(arbol) -> None:
+    with abrir_salida() as salida:
+        escribir_arbol(arbol, salida, args.formato, args.profundidad)
+
+
+def copiar_partes(partes: Iterable, copia: List) -> Iterator:
+    """
+    Deja pasar las partes y las agrega a `copia`
+    """
+
+    for parte in partes:
+        copia.append(parte)
+        yield parte
+
+
+def imprimir_eliminadas(unidades) -> None:
+    for unidad in unidades:
+        tipo = 'funcion' if unidad.tipo == TipoNodo.FUNCION else 'global'
+        print(f'{tipo} {GrafoLlamadas.nombre(unidad)}', file=sys.stderr)
+
+
+def cargar_bytecode(clave: str) -> Optional[CodeType]:
+    """
+    Objeto de código guardado en la caché, None si no está o si es de
+    otra versión de python
+    """
+
+    datos = cache_bytecode.cargar(clave, BYTECODE)
+    if datos is None:
+        return None
 
     try:
-        texto = utils.cargar_archivo(args.archivo)
-        explorador = Explorador(texto)
-        explorador.explorar()
-        
-        if args.explorar:
-            explorador.imprimir_componentes()
-            sys.exit(os.EX_OK)
-    
-        analizador = Analizador(explorador.componentes)
-        analizador.analizar()
+        return desde_bytes(datos)
+    except (ValueError, EOFError, TypeError):
+        return None
+
+
+def ejecutar(codigo: CodeType, tiempo_compilar: float,
+             en_cache: bool) -> None:
+    """
+    Ejecuta el módulo compilado con un nombre distinto de `__main__`,
+    para que no invoque la principal por su cuenta, y luego la principal.
+    Al terminar muestra en la salida de errores el tiempo de compilar y
+    el de ejecutar
+    """
+
+    inicio = time.perf_counter()
+    try:
+        modulo = {'__name__': '__cmamuth__',
+                  '__file__': os.path.abspath(args.archivo)}
+        exec(codigo, modulo)
+        modulo['principal']()
+    finally:
+        tiempo_ejecutar = time.perf_counter() - inicio
+        origen = ' (bytecode de la caché)' if en_cache else ''
+        print(f'compilar {tiempo_compilar * 1000:.1f} ms{origen}, '
+              f'ejecutar {tiempo_ejecutar * 1000:.1f} ms', file=sys.stderr)
+
+
+def explorar(copia: Optional[List] = None):
+    """
+    Retorna los componentes léxicos del archivo. Si no se necesitan
+    completos el analizador los consume conforme se exploran y, con
+    `copia`, también se agregan a esa lista para guardarlos en la caché
+    """
+
+    if args.explorar or args.procesos or args.validar:
+        explorador = Explorador(utils.cargar_archivo(args.archivo))
+
+        if args.procesos:
+            explorador.explorar_paralelo(args.procesos)
+        else:
+            explorador.explorar()
+
+        return explorador.componentes
+
+    explorador = Explorador()
+    componentes = explorador.iterar_componentes(
+        utils.cargar_bloques(args.archivo))
+    if copia is not None:
+        componentes = copiar_partes(componentes, copia)
+    return componentes
+
+
+def ruta_errores() -> str:
+    """
+    Ruta del objeto de código que aparece en los errores al ejecutarlo:
+    con --posiciones la del archivo .cm y si no la del código generado,
+    donde lo escribe `-g -o`
+    """
+
+    ruta = os.path.abspath(args.archivo)
+    if args.posiciones:
+        return ruta
+    return os.path.splitext(ruta)[0] + '.py'
 
-        if args.analizar:
-            analizador.imprimir_ast()
-            sys.exit(os.EX_OK)
 
-        verificador = Verificador(analizador.ast)
-        tabla_simbolos = verificador.verificar()
+def compilar() -> Optional[Tuple[CodeType, bool]]:
+    """
+    Ejecuta las etapas que piden las opciones, con `--ejecutar` retorna
+    el objeto de código del programa y si salió de la caché
+    """
 
-        if args.verificar: 
-            print(tabla_simbolos)
-            verificador.imprimir_ast()
+    try:
+        for manifiesto in args.nativas:
+            cargar_nativas(manifiesto)
+            opciones_cache.append(utils.cargar_archivo(manifiesto))
+
+        if args.optimizacion:
+            opciones_cache.append(f'-O{args.optimizacion}')
+
+        etapa = etapa_objetivo()
+        encontrada, artefacto = None, None
+
+        # Los errores del objeto de código apuntan a una ruta que sale de
+        # la del archivo, que también es parte de su clave. Sólo se evita
+        # compilar si no se pidió nada más que use el generador
+        if args.ejecutar:
+            clave_bytecode = clave_archivo(
+                args.archivo,
+                opciones_cache + [ruta_errores(), str(args.posiciones)])
+            if not (args.generar or args.pyc or args.eliminadas):
+                codigo = cargar_bytecode(clave_bytecode)
+                if codigo is not None:
+                    return codigo, True
+
+        if cache:
+            clave = clave_archivo(args.archivo, opciones_cache)
+            encontrada, artefacto = cache.cargar_mas_profundo(clave, etapa)
+
+        if encontrada == 'python':
+            with abrir_salida() as salida:
+                salida.write(artefacto)
             sys.exit(os.EX_OK)
-        
-        if args.generar:
-            generador = Generador(verificador.ast)
-            generador.generar()
+
+        if encontrada == 'verificado':
+            arbol, tabla_simbolos = artefacto
+
+        else:
+            if encontrada == 'arbol':
+                arbol = artefacto
+
+            else:
+                copia = None
+                if encontrada == 'componentes':
+                    componentes = artefacto
+                elif args.explorar or args.procesos:
+                    componentes = explorar()
+                    if cache:
+                        cache.guardar(clave, 'componentes', componentes)
+                else:
+                    # Los componentes que consume el analizador se
+                    # guardan cuando termina
+                    if cache:
+                        copia = []
+                    componentes = explorar(copia)
+
+                if args.explorar:
+                    with abrir_salida() as salida:
+                        for componente in componentes:
+                            print(componente, file=salida)
+                    sys.exit(os.EX_OK)
+
+                if args.validar:
+                    Validador(componentes, args.limite_errores).validar()
+                    print('Sintaxis correcta')
+                    sys.exit(os.EX_OK)
+
+                analizador = Analizador(componentes, args.limite_errores)
+                analizador.analizar()
+                if copia is not None:
+                    cache.guardar(clave, 'componentes', copia)
+
+                # En la caché el árbol se guarda en arena, que se
+                # serializa sin recursión, pero se sigue con el que se
+                # pidió
+                arbol = analizador.ast
+                if args.arena:
+                    arbol = ArbolArena.desde_arbol(arbol)
+                if cache:
+                    cache.guardar(clave, 'arbol',
+                                  arbol if args.arena else
+                                  ArbolArena.desde_arbol(arbol))
+
+            if args.analizar:
+                imprimir_arbol(compartir(arbol))
+                sys.exit(os.EX_OK)
+
+            verificador = Verificador(arbol)
+            if cache:
+                # Sólo se verifican las funciones que cambiaron desde
+                # la última versión verificada del archivo
+                clave_dependencias = clave_ruta(args.archivo,
+                                                opciones_cache)
+                tabla_simbolos = verificador.reverificar(
+                    cache.cargar(clave_dependencias, DEPENDENCIAS),
+                    args.procesos or 1)
+                cache.guardar(clave_dependencias, DEPENDENCIAS,
+                              verificador.dependencias)
+
+                # La tabla de símbolos apunta a los nodos del árbol, se
+                # guardan juntos sólo si el árbol está en arena, como
+                # cuando se cargó de la caché
+                if isinstance(arbol, ArbolArena):
+                    cache.guardar(clave, 'verificado',
+                                  (arbol, tabla_simbolos))
+            elif args.procesos:
+                tabla_simbolos = verificador.verificar_paralelo(args.procesos)
+            else:
+                tabla_simbolos = verificador.verificar()
+
+        arbol = compartir(arbol)
+
+        if args.verificar:
+            with abrir_salida() as salida:
+                escribir_verificacion(tabla_simbolos, arbol, salida,
+                                      args.formato, args.profundidad)
             sys.exit(os.EX_OK)
 
+        if args.generar or args.pyc or args.ejecutar:
+            if args.optimizacion:
+                arbol = Optimizador(arbol, args.optimizacion).optimizar()
+
+            generador = Generador(arbol)
+            if args.eliminadas:
+                imprimir_eliminadas(generador.grafo.eliminadas())
+
+            codigo = None
+            if args.pyc or args.ejecutar:
+                codigo = generador.compilar(ruta_errores(), args.posiciones)
+                if args.pyc:
+                    escribir_pyc(codigo, args.pyc)
+                if args.ejecutar:
+                    cache_bytecode.guardar(clave_bytecode, BYTECODE,
+                                           a_bytes(codigo))
+                if not args.generar:
+                    return codigo, False
+
+            # Cada unidad se escribe en cuanto se genera, la caché
+            # necesita además el código completo
+            partes = generador.iterar_codigo()
+            copia = []
+            if cache:
+                partes = copiar_partes(partes, copia)
+
+            with abrir_salida() as salida:
+                escribir_bloques(salida, partes)
+
+            if cache:
+                cache.guardar(clave, 'python', ''.join(copia))
+            return codigo, False
+
 
     except SyntaxError as se:
         sys.exit(se)
+
+    # compile() recorre el código generado recursivamente
+    except RecursionError:
+        sys.exit('Programa con demasiados niveles anidados para compilar')
     
     except TypeError as te:
         sys.exit(te)
@@ -75,9 +442,26 @@ def cmamuth() -> None:
     except NameError as ne:
         sys.exit(ne)
     
-    except FileNotFoundError:
+    except ValueError as ve:
+        sys.exit(ve)
+
+    except FileNotFoundError as fe:
+        if fe.filename in args.nativas:
+            sys.exit(f'Manifiesto de funciones invalido {fe.filename!r}')
         sys.exit(f'Archivo .cm invalido {args.archivo!r}')
 
 
+def cmamuth() -> None:
+    inicio = time.perf_counter()
+    compilado = compilar()
+
+    # Los errores del programa se muestran completos, fuera de los del
+    # compilador
+    if args.ejecutar and compilado is not None:
+        codigo, en_cache = compilado
+        ejecutar(codigo, time.perf_counter() - inicio, en_cache)
+    sys.exit(os.EX_OK)
+
+
 if __name__ == '__main__':
     cmamuth()
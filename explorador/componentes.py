@@ -0,0 +1,194 @@
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+from Explorador.tablas import CODIGOS_COMPONENTE, TIPOS_COMPONENTE
+
+# Tipos de componente cuyo valor se internaliza, se repiten mucho
+TIPOS_INTERNADOS = frozenset(
+    CODIGOS_COMPONENTE[tipo] for tipo in TIPOS_COMPONENTE
+    if tipo not in {'TEXTO', 'ENTERO', 'FLOTANTE', 'ERROR', 'ERROR_ID'})
+
+
+class ComponenteLexico(NamedTuple):
+    """
+    Clase que almacena información del componente léxico
+    """
+
+    tipo: str
+    valor: str
+    linea: int
+    columna: int
+
+    def __str__(self):
+        """
+        Formato para imprimir el componente léxico
+        """
+
+        componente = f'{self.tipo:30} --> {self.valor:10} \
+                        (Linea: {self.linea} , Columna: {self.columna})'
+        return componente
+
+    def get_atributos(self) -> dict:
+        """
+        Devuelve atributos del componente léxico en un diccionario
+        """
+
+        return {'linea':self.linea, 
+                'columna':self.columna}
+
+
+class BufferComponentes(Sequence):
+    """
+    Almacena los componentes léxicos de un texto en arreglos compactos
+    (estructura de arreglos) en lugar de una lista de ComponenteLexico
+
+    Por cada componente se guarda el código de su tipo y las posiciones de
+    inicio y fin dentro del texto. El valor se toma del texto y la línea y
+    columna se calculan sólo cuando se necesitan, con un índice de inicios
+    de línea que se construye la primera vez que se pide una posición.
+
+    Se comporta como una secuencia de ComponenteLexico para que el
+    analizador y la impresión de componentes no cambien.
+    """
+
+    texto: str
+    linea_inicial: int
+    tipos: array
+    inicios: array
+    finales: array
+
+    def __init__(self, texto: str, linea_inicial: int = 1):
+        """
+        `linea_inicial` es el número de línea en que inicia el texto,
+        útil cuando el texto es un fragmento de un archivo más grande
+        """
+
+        self.texto = texto
+        self.linea_inicial = linea_inicial
+        self.tipos = array('B')
+        self.inicios = array('I')
+        self.finales = array('I')
+        self.__inicios_linea: Optional[array] = None
+
+    def agregar(self, codigo: int, inicio: int, fin: int) -> None:
+        """
+        Agrega un componente dado el código de su tipo y sus posiciones
+        """
+
+        self.tipos.append(codigo)
+        self.inicios.append(inicio)
+        self.finales.append(fin)
+
+    def extender(self, tipos: array, inicios: array, finales: array,
+                 desplazamiento: int = 0) -> None:
+        """
+        Agrega al final los componentes de otro buffer, cuyas posiciones
+        son relativas a `desplazamiento` dentro de este texto
+        """
+
+        self.tipos.extend(tipos)
+
+        if desplazamiento == 0:
+            self.inicios.extend(inicios)
+            self.finales.extend(finales)
+        else:
+            self.inicios.extend(
+                array('I', [inicio + desplazamiento for inicio in inicios]))
+            self.finales.extend(
+                array('I', [fin + desplazamiento for fin in finales]))
+
+    def tipo(self, indice: int) -> str:
+        """
+        Devuelve el tipo del componente en la posición `indice`
+        """
+
+        return TIPOS_COMPONENTE[self.tipos[indice]]
+
+    def valor(self, indice: int) -> str:
+        """
+        Devuelve el valor del componente en la posición `indice`, los
+        identificadores y palabras reservadas se internalizan
+        """
+
+        valor = self.texto[self.inicios[indice]:self.finales[indice]]
+        if self.tipos[indice] in TIPOS_INTERNADOS:
+            return sys.intern(valor)
+        return valor
+
+    def posicion(self, indice: int) -> Tuple[int, int]:
+        """
+        Devuelve la línea y columna del componente en la posición `indice`
+        """
+
+        return self.posicion_desplazamiento(self.inicios[indice])
+
+    def posicion_desplazamiento(self, desplazamiento: int) -> Tuple[int, int]:
+        """
+        Convierte un desplazamiento dentro del texto en línea y columna
+        """
+
+        inicios_linea = self.__obtener_inicios_linea()
+        indice_linea = bisect_right(inicios_linea, desplazamiento) - 1
+
+        return (self.linea_inicial + indice_linea,
+                desplazamiento - inicios_linea[indice_linea] + 1)
+
+    def __obtener_inicios_linea(self) -> array:
+        """
+        Construye (una sola vez) el índice con el desplazamiento
+        en que inicia cada línea del texto
+        """
+
+        if self.__inicios_linea is None:
+            inicios_linea = array('I', [0])
+            buscar = self.texto.find
+            posicion = buscar('\n')
+            while posicion != -1:
+                inicios_linea.append(posicion + 1)
+                posicion = buscar('\n', posicion + 1)
+            self.__inicios_linea = inicios_linea
+
+        return self.__inicios_linea
+
+    def __len__(self) -> int:
+        return len(self.tipos)
+
+    def __getitem__(self, indice):
+        """
+        Construye el ComponenteLexico (o la lista de ellos si es un rango)
+        """
+
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError('Índice de componente fuera de rango')
+
+        linea, columna = self.posicion(indice)
+        return ComponenteLexico(self.tipo(indice), self.valor(indice),
+                                linea, columna)
+
+    def __iter__(self) -> Iterator[ComponenteLexico]:
+        """
+        Recorre los componentes en orden, avanzando en el índice de líneas
+        sin necesidad de buscar la línea de cada componente
+        """
+
+        inicios_linea = self.__obtener_inicios_linea()
+        cantidad_lineas = len(inicios_linea)
+        indice_linea = 0
+
+        for indice in range(len(self.tipos)):
+            inicio = self.inicios[indice]
+            while indice_linea + 1 < cantidad_lineas and \
+                    inicios_linea[indice_linea + 1] <= inicio:
+                indice_linea += 1
+
+            yield ComponenteLexico(self.tipo(indice), self.valor(indice),
+                                   self.linea_inicial + indice_linea,
+                                   inicio - inicios_linea[indice_linea] + 1)
@@ -1,73 +1,175 @@
-import re
-from enum import Enum
-from typing import List, NamedTuple
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
+# DescriptorComponente y ComponenteLexico se reexportan para los módulos
+# que los importan de aquí
+from Explorador.componentes import BufferComponentes, ComponenteLexico
+from Explorador.tablas import (CODIGOS_COMPONENTE, DescriptorComponente,
+                               TablasExplorador, obtener_tablas)
 
-class DescriptorComponente(Enum):
+# Códigos de los componentes que son errores léxicos
+CODIGOS_ERROR = frozenset(codigo for tipo, codigo in CODIGOS_COMPONENTE.items()
+                          if tipo.startswith('ERROR'))
+
+# Tamaño mínimo (en caracteres) de cada fragmento en la exploración
+# en paralelo, con textos más pequeños no vale la pena repartir
+TAMANO_MINIMO_FRAGMENTO = 1 << 20
+
+
+class CambioComponentes(NamedTuple):
     """
-    Esta clase contiene el enum con los descriptores de
-    componentes del compilador
+    Rango de componentes que cambió al reexplorar una edición: los
+    componentes [inicio, fin_anterior) del buffer anterior fueron
+    reemplazados por los componentes [inicio, fin_nuevo) del nuevo
     """
-    
-    ERROR_ID = r'[0-9;]+[_A-Za-z]+'
-    COMENTARIO = r'muchoTexto:.*'  # Comentarios del lenguaje
-    TEXTO = r'ツ.*ツ'  # Tipos de dato string
-    PUNTUACION = r'(xD|v:|\(|\)|\.|\,|\#)'  # Parámetros y fin de expresiones
-    FLOTANTE = r'(-?[0-9]+;[0-9]+)'  # Numeros punto flotante
-    ENTERO = r'(-?[0-9]+)'  # Tipos entero negativos o positivos
-    IDENTIFICADOR = r'[A-Za-z_][A-Za-z_0-9]*'  # Identificadores alfanumericos
-    NUEVALINEA = r'\n'         # Fines de linea en lenguaje
-    ESPACIO = r'[ \t]+'       # Omitir espacios o tabs
-    ERROR = r'.'         # Cualquier otro carácter
-
-    # Diccionario con los identificadores reservados del lenguaje
-    RESERVADOS = {
-        'PALABRA_CLAVE': {'POV', 'maracuya', 'messirve'},
-        'OPERADOR': {'bobMar', 'bobStar', 'bobiDir', 'bobTiplicar'},
-        'COMPARADOR': {'chikito', 'tapotente', 'panachikito',
-                       'panapotente', 'nolocrick', 'panas'},
-        'OPERADOR_LOGICO': {'aja', 'ayno'},
-        'CONDICIONAL': {'siuuu', 'nimodo'},
-        'CICLO': {'whenCuando', 'but'},
-        'ASIGNACION': {'anotado'},
-        'INVOCACION': {'jutsu'},
-        'BOOLEANO': {'SIUA','NOUA'}
-    }
-
-    def __str__(self):
-        """
-        Devuelve el descriptor con su nombre de grupo
-        """
-
-        return f'(?P<{self.name}>{self.value})'
-
-
-class ComponenteLexico(NamedTuple):
+
+    inicio: int
+    fin_anterior: int
+    fin_nuevo: int
+
+
+def iterar_coincidencias(texto: str, tablas: TablasExplorador,
+                         inicio: int = 0) -> Iterator[Tuple[int, int, int]]:
     """
-    Clase que almacena información del componente léxico
+    Genera el código de tipo y las posiciones de inicio y fin de cada
+    componente léxico del texto a partir de la posición `inicio`
     """
 
-    tipo: str
-    valor: str
-    linea: int
-    columna: int
+    # códigos de tipo de los identificadores, reservados o no
+    codigo_identificador = CODIGOS_COMPONENTE['IDENTIFICADOR']
+    codigos_reservados = {palabra: CODIGOS_COMPONENTE[tipo]
+                          for palabra, tipo in tablas.reservados.items()}
 
-    def __str__(self):
-        """
-        Formato para imprimir el componente léxico
-        """
+    # recorre el texto y va emparejando con la expresiones regulares
+    for coincidencia in tablas.patron.finditer(texto, inicio):
+        tipo_coincidencia = coincidencia.lastgroup
 
-        componente = f'{self.tipo:30} --> {self.valor:10} \
-                        (Linea: {self.linea} , Columna: {self.columna})'
-        return componente
+    # ignora los cambios de línea, los espacios y comentarios, la línea
+    # y columna se calculan luego a partir de las posiciones
+        if tipo_coincidencia == 'NUEVALINEA' or \
+                tipo_coincidencia == 'ESPACIO' or \
+                tipo_coincidencia == 'COMENTARIO':
+            continue
 
-    def get_atributos(self) -> dict:
-        """
-        Devuelve atributos del componente léxico en un diccionario
-        """
+        inicio_coincidencia, fin_coincidencia = coincidencia.span()
+
+    # asignar el tipo de indentificador si es reservado
+        if tipo_coincidencia == 'IDENTIFICADOR':
+            codigo = codigos_reservados.get(coincidencia.group(),
+                                            codigo_identificador)
+        else:
+            codigo = CODIGOS_COMPONENTE[tipo_coincidencia]
+
+        yield codigo, inicio_coincidencia, fin_coincidencia
 
-        return {'linea':self.linea, 
-                'columna':self.columna}
+
+def tokenizar_texto(texto: str, tablas: TablasExplorador,
+                    linea_inicial: int = 1
+                    ) -> Tuple[BufferComponentes, List[int]]:
+    """
+    Extrae los componentes léxicos de un texto que inicia al comienzo de
+    la línea `linea_inicial`
+
+    Retorna los componentes y los índices de los componentes que
+    son errores, para que quien llama los reporte
+    """
+
+    componentes = BufferComponentes(texto, linea_inicial)
+    agregar = componentes.agregar
+    errores = []
+
+    for codigo, inicio, fin in iterar_coincidencias(texto, tablas):
+        if codigo in CODIGOS_ERROR:
+            errores.append(len(componentes))
+        agregar(codigo, inicio, fin)
+
+    return componentes, errores
+
+
+def reexplorar_texto(anteriores: BufferComponentes, desplazamiento: int,
+                     largo_eliminado: int, texto_insertado: str,
+                     tablas: TablasExplorador
+                     ) -> Tuple[BufferComponentes, List[int],
+                                CambioComponentes]:
+    """
+    Aplica una edición (se eliminan `largo_eliminado` caracteres a partir
+    de `desplazamiento` y se inserta `texto_insertado`) sobre el texto de
+    unos componentes ya explorados, y reexplora sólo lo necesario
+
+    Se vuelve a explorar desde el inicio de la línea editada y en cuanto
+    un componente nuevo, después de la edición, empieza en la misma
+    posición que un componente anterior el resto del texto es igual y se
+    exploraría igual, por lo que se reutilizan los componentes anteriores.
+
+    Retorna los nuevos componentes, los índices de los componentes nuevos
+    que son errores y el rango de componentes que cambió
+    """
+
+    texto_anterior = anteriores.texto
+    texto = texto_anterior[:desplazamiento] + texto_insertado + \
+        texto_anterior[desplazamiento + largo_eliminado:]
+    diferencia = len(texto_insertado) - largo_eliminado
+    fin_edicion = desplazamiento + len(texto_insertado)
+
+    # se reexplora desde el inicio de la línea editada
+    inicio_linea = texto.rfind('\n', 0, desplazamiento) + 1
+    primero = bisect_left(anteriores.inicios, inicio_linea)
+
+    componentes = BufferComponentes(texto, anteriores.linea_inicial)
+    componentes.extender(anteriores.tipos[:primero],
+                         anteriores.inicios[:primero],
+                         anteriores.finales[:primero])
+
+    inicios_anteriores = anteriores.inicios
+    cantidad_anteriores = len(anteriores)
+    siguiente_anterior = primero
+    errores = []
+
+    for codigo, inicio, fin in iterar_coincidencias(texto, tablas,
+                                                    inicio_linea):
+        if inicio >= fin_edicion:
+
+            # busca un componente anterior que empiece en la misma posición
+            inicio_anterior = inicio - diferencia
+            while siguiente_anterior < cantidad_anteriores and \
+                    inicios_anteriores[siguiente_anterior] < inicio_anterior:
+                siguiente_anterior += 1
+
+            if siguiente_anterior < cantidad_anteriores and \
+                    inicios_anteriores[siguiente_anterior] == inicio_anterior:
+                break
+
+        if codigo in CODIGOS_ERROR:
+            errores.append(len(componentes))
+        componentes.agregar(codigo, inicio, fin)
+
+    else:
+        # no se sincronizó, se reexploró hasta el final del texto
+        siguiente_anterior = cantidad_anteriores
+
+    cambio = CambioComponentes(primero, siguiente_anterior, len(componentes))
+
+    componentes.extender(anteriores.tipos[siguiente_anterior:],
+                         anteriores.inicios[siguiente_anterior:],
+                         anteriores.finales[siguiente_anterior:],
+                         diferencia)
+
+    return componentes, errores, cambio
+
+
+def _tokenizar_fragmento(fragmento: str, tablas: TablasExplorador
+                         ) -> Tuple[array, array, array, List[int]]:
+    """
+    Tokeniza un fragmento en un proceso aparte, sólo se devuelven los
+    arreglos para no enviar el texto de regreso
+    """
+
+    componentes, errores = tokenizar_texto(fragmento, tablas)
+    return (componentes.tipos, componentes.inicios,
+            componentes.finales, errores)
 
 
 class Explorador:
@@ -77,14 +179,19 @@ class Explorador:
     """
 
     texto: str
-    componentes: List[ComponenteLexico]
+    componentes: BufferComponentes
     cantidad_errores: int
+    tablas: TablasExplorador
 
-    def __init__(self, contenido_archivo: str):
+    def __init__(self, contenido_archivo: str = '',
+                 tablas: Optional[TablasExplorador] = None):
         self.texto = contenido_archivo
-        self.componentes = []
+        self.componentes = BufferComponentes(contenido_archivo)
         self.cantidad_errores = 0
 
+        # las tablas se construyen una sola vez por proceso
+        self.tablas = tablas if tablas is not None else obtener_tablas()
+
     def imprimir_componentes(self) -> None:
         """
         Imprime los componentes junto con su número de línea y columna
@@ -103,67 +210,160 @@ class Explorador:
             raise SyntaxError(f'{self.cantidad_errores} ' +
                               f'Error(es) en explorador')
 
-    def __tokenizar_componentes(self) -> List[ComponenteLexico]:
+    def reexplorar(self, desplazamiento: int, largo_eliminado: int,
+                   texto_insertado: str) -> CambioComponentes:
         """
-        Toma el texto y los procesa extrayendo los componentes léxicos
+        Actualiza el texto y los componentes después de una edición sin
+        volver a explorar el texto completo, sólo las líneas afectadas
+
+        Retorna el rango de componentes que cambió para que las
+        siguientes etapas puedan limitar su trabajo a ese rango
         """
 
-        componentes = []
-        num_linea = 1
-        inicio_linea = 0
+        self.componentes, errores, cambio = reexplorar_texto(
+            self.componentes, desplazamiento, largo_eliminado,
+            texto_insertado, self.tablas)
+        self.texto = self.componentes.texto
 
-        # concatenar los regexp en un string a exepcion del dicc de reservados
-        regexps = '|'.join(str(desc)
-                           for desc in list(DescriptorComponente)
-                           if desc != DescriptorComponente.RESERVADOS)
+        self.__reportar_errores(self.componentes, errores)
 
-        # recorre el texto y va emparejando con la expresiones regulares
-        for coincidencia in re.finditer(regexps, self.texto):
-            tipo_coincidencia = coincidencia.lastgroup
-            valor = coincidencia.group()
-            columna = coincidencia.start() - inicio_linea + 1
+        # se cuentan todos los errores que quedan en el texto editado,
+        # no sólo los de los componentes nuevos
+        tipos = self.componentes.tipos.tobytes()
+        self.cantidad_errores = sum(tipos.count(codigo)
+                                    for codigo in CODIGOS_ERROR)
 
-        # verifica si hay un cambio de línea para continuar con la siguente
-            if tipo_coincidencia == 'NUEVALINEA':
-                inicio_linea = coincidencia.end()
-                num_linea += 1
-                continue
+        if self.cantidad_errores > 0:
+            raise SyntaxError(f'{self.cantidad_errores} ' +
+                              f'Error(es) en explorador')
+
+        return cambio
 
-        # ignora los espacios y comentarios
-            elif tipo_coincidencia == 'ESPACIO' or \
-                    tipo_coincidencia == 'COMENTARIO':
-                continue
+    def explorar_paralelo(self, procesos: Optional[int] = None) -> None:
+        """
+        Igual que `explorar`, pero reparte el texto en fragmentos que
+        terminan en un cambio de línea y los explora en varios procesos
 
-        # asignar el tipo de indentificador si es reservado
-            elif tipo_coincidencia == 'IDENTIFICADOR':
-                tipo_coincidencia = self.__asignar_coincidencia_tipo_id(valor)
+        Como ningún componente léxico cruza de una línea a otra, los
+        fragmentos se exploran de forma independiente y luego se unen
+        corrigiendo sus posiciones dentro del texto completo
+        """
 
-        # devuelve error en caso que no sea ningún componente léxico valido
-            elif tipo_coincidencia.startswith('ERROR'):
-                self.__error_componente(valor, num_linea, columna)
+        if procesos is None:
+            procesos = os.cpu_count() or 1
 
-            componentes.append(
-                ComponenteLexico(tipo_coincidencia, valor, num_linea, columna))
+        fragmentos = self.__fragmentar(procesos)
+        if len(fragmentos) <= 1:
+            self.explorar()
+            return
 
-        return componentes
+        componentes = BufferComponentes(self.texto)
+        errores = []
+
+        with ProcessPoolExecutor(max_workers=len(fragmentos)) as ejecutor:
+            resultados = ejecutor.map(_tokenizar_fragmento,
+                                      [self.texto[inicio:fin]
+                                       for inicio, fin in fragmentos],
+                                      [self.tablas] * len(fragmentos))
+
+            # se unen en el orden de los fragmentos
+            for (inicio, _), resultado in zip(fragmentos, resultados):
+                tipos, inicios, finales, errores_fragmento = resultado
+                cantidad_previa = len(componentes)
+                componentes.extender(tipos, inicios, finales, inicio)
+                errores += [cantidad_previa + indice
+                            for indice in errores_fragmento]
+
+        self.componentes = componentes
+        self.__reportar_errores(componentes, errores)
+
+        if self.cantidad_errores > 0:
+            raise SyntaxError(f'{self.cantidad_errores} ' +
+                              f'Error(es) en explorador')
+
+    def __fragmentar(self, procesos: int) -> List[Tuple[int, int]]:
+        """
+        Divide el texto en a lo sumo `procesos` rangos (inicio, fin) de
+        tamaño parecido, cada uno termina justo después de un cambio de línea
+        """
+
+        cantidad = min(procesos, len(self.texto) // TAMANO_MINIMO_FRAGMENTO)
+        if cantidad <= 1:
+            return [(0, len(self.texto))]
+
+        tamano = len(self.texto) // cantidad
+        fragmentos = []
+        inicio = 0
+
+        while inicio < len(self.texto):
+            corte = self.texto.find('\n', inicio + tamano)
+            fin = len(self.texto) if corte == -1 else corte + 1
+            fragmentos.append((inicio, fin))
+            inicio = fin
+
+        return fragmentos
+
+    def iterar_componentes(self, bloques: Optional[Iterable[str]] = None
+                           ) -> Iterator[ComponenteLexico]:
+        """
+        Genera los componentes léxicos de forma perezosa conforme se
+        exploran los bloques de texto, sin construir la lista completa
+
+        Cada bloque debe terminar en un cambio de línea (a excepción del
+        último), ya que ningún componente léxico cruza de una línea a otra.
+        Si no se indican bloques se explora el texto del explorador.
+        """
+
+        if bloques is None:
+            bloques = (self.texto,)
+
+        yield from self.__tokenizar(bloques)
+
+        if self.cantidad_errores > 0:
+            raise SyntaxError(f'{self.cantidad_errores} ' +
+                              f'Error(es) en explorador')
 
-    def __asignar_coincidencia_tipo_id(self, valor: str) -> str:
+    def __tokenizar_componentes(self) -> BufferComponentes:
+        """
+        Toma el texto y los procesa extrayendo los componentes léxicos
         """
-        El valor se refiere a una coincidencia de tipo identificador
 
-        Busca la coincidencia en el diccionario de identificadores
-        reservados y lo retorna el tipo de identificador correspondiente
-        (por defecto es IDENTIFICADOR)
+        return self.__tokenizar_bloque(self.texto)
+
+    def __tokenizar(self, bloques: Iterable[str]) -> Iterator[ComponenteLexico]:
+        """
+        Recorre los bloques de texto y va generando los componentes léxicos,
+        llevando la cuenta de las líneas entre un bloque y el siguiente
+        """
+
+        num_linea = 1
+
+        for bloque in bloques:
+            yield from self.__tokenizar_bloque(bloque, num_linea)
+            num_linea += bloque.count('\n')
+
+    def __tokenizar_bloque(self, bloque: str,
+                           linea_inicial: int = 1) -> BufferComponentes:
+        """
+        Extrae los componentes léxicos de un bloque de texto que inicia
+        al comienzo de la línea `linea_inicial`
+        """
+
+        componentes, errores = tokenizar_texto(bloque, self.tablas,
+                                               linea_inicial)
+        self.__reportar_errores(componentes, errores)
+
+        return componentes
+
+    def __reportar_errores(self, componentes: BufferComponentes,
+                           errores: List[int]) -> None:
+        """
+        Reporta los componentes no identificados durante la exploración
         """
 
-        predeterminado = "IDENTIFICADOR"
-        miembro_resv = DescriptorComponente.RESERVADOS
-        dicc_resv = miembro_resv.value.items()
-        for tipo_id_resv, valores_resv in dicc_resv:
-            # si es un identificador reservado devolver su tipo
-            if valor in valores_resv:
-                return tipo_id_resv
-        return predeterminado
+        for indice in errores:
+            linea, columna = componentes.posicion(indice)
+            self.__error_componente(componentes.valor(indice), linea, columna)
 
     def __error_componente(self, valor: str,
                            linea: int, columna: int) -> None:
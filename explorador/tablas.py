@@ -0,0 +1,95 @@
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, NamedTuple, Pattern, Tuple
+
+
+class DescriptorComponente(Enum):
+    """
+    Esta clase contiene el enum con los descriptores de
+    componentes del compilador
+    """
+    
+    ERROR_ID = r'[0-9;]+[_A-Za-z]+'
+    COMENTARIO = r'muchoTexto:.*'  # Comentarios del lenguaje
+    TEXTO = r'ツ.*ツ'  # Tipos de dato string
+    PUNTUACION = r'(xD|v:|\(|\)|\.|\,|\#)'  # Parámetros y fin de expresiones
+    FLOTANTE = r'(-?[0-9]+;[0-9]+)'  # Numeros punto flotante
+    ENTERO = r'(-?[0-9]+)'  # Tipos entero negativos o positivos
+    IDENTIFICADOR = r'[A-Za-z_][A-Za-z_0-9]*'  # Identificadores alfanumericos
+    NUEVALINEA = r'\n'         # Fines de linea en lenguaje
+    ESPACIO = r'[ \t]+'       # Omitir espacios o tabs
+    ERROR = r'.'         # Cualquier otro carácter
+
+    # Diccionario con los identificadores reservados del lenguaje
+    RESERVADOS = {
+        'PALABRA_CLAVE': {'POV', 'maracuya', 'messirve'},
+        'OPERADOR': {'bobMar', 'bobStar', 'bobiDir', 'bobTiplicar'},
+        'COMPARADOR': {'chikito', 'tapotente', 'panachikito',
+                       'panapotente', 'nolocrick', 'panas'},
+        'OPERADOR_LOGICO': {'aja', 'ayno'},
+        'CONDICIONAL': {'siuuu', 'nimodo'},
+        'CICLO': {'whenCuando', 'but'},
+        'ASIGNACION': {'anotado'},
+        'INVOCACION': {'jutsu'},
+        'BOOLEANO': {'SIUA','NOUA'}
+    }
+
+    def __str__(self):
+        """
+        Devuelve el descriptor con su nombre de grupo
+        """
+
+        return f'(?P<{self.name}>{self.value})'
+
+
+# Todos los tipos de componente léxico, la posición de cada tipo es el
+# código con el que se guarda en un BufferComponentes
+TIPOS_COMPONENTE: Tuple[str, ...] = tuple(
+    [desc.name for desc in DescriptorComponente
+     if desc != DescriptorComponente.RESERVADOS] +
+    [tipo for tipo in DescriptorComponente.RESERVADOS.value
+     if tipo not in DescriptorComponente.__members__])
+
+CODIGOS_COMPONENTE: Dict[str, int] = {
+    tipo: codigo for codigo, tipo in enumerate(TIPOS_COMPONENTE)}
+
+
+class TablasExplorador(NamedTuple):
+    """
+    Tablas ya construidas que utiliza el explorador: la expresión regular
+    maestra compilada y el diccionario plano de palabras reservadas
+    (palabra --> tipo de componente)
+    """
+
+    patron: Pattern
+    reservados: Dict[str, str]
+
+
+def construir_tablas() -> TablasExplorador:
+    """
+    Construye las tablas a partir de DescriptorComponente
+    """
+
+    # concatenar los regexp en un string a exepcion del dicc de reservados
+    regexps = '|'.join(str(desc)
+                       for desc in DescriptorComponente
+                       if desc != DescriptorComponente.RESERVADOS)
+
+    # invertir el diccionario de reservados: palabra --> tipo
+    reservados = {palabra: tipo
+                  for tipo, palabras in
+                  DescriptorComponente.RESERVADOS.value.items()
+                  for palabra in palabras}
+
+    return TablasExplorador(re.compile(regexps), reservados)
+
+
+@lru_cache(maxsize=None)
+def obtener_tablas() -> TablasExplorador:
+    """
+    Devuelve las tablas del explorador, se construyen
+    una única vez por proceso
+    """
+
+    return construir_tablas()
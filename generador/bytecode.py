@@ -0,0 +1,36 @@
+# Objetos de código compilados guardados con el formato de los .pyc
+
+import marshal
+from importlib.util import MAGIC_NUMBER
+from types import CodeType
+
+# Encabezado de un .pyc (PEP 552): el número mágico de la versión de
+# python, las banderas en 0 y la fecha y el tamaño del fuente, que no
+# se revisan al ejecutar el archivo directamente
+ENCABEZADO = MAGIC_NUMBER + bytes(12)
+
+
+def a_bytes(codigo: CodeType) -> bytes:
+    """
+    Objeto de código con el encabezado de un .pyc, se puede ejecutar
+    con `python3 ARCHIVO`
+    """
+
+    return ENCABEZADO + marshal.dumps(codigo)
+
+
+def desde_bytes(datos: bytes) -> CodeType:
+    """
+    Objeto de código guardado con `a_bytes`, el bytecode sólo sirve
+    para la misma versión de python
+    """
+
+    if datos[:len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+        raise ValueError('El bytecode es de otra version de python')
+
+    return marshal.loads(datos[len(ENCABEZADO):])
+
+
+def escribir_pyc(codigo: CodeType, ruta: str) -> None:
+    with open(ruta, 'wb') as archivo:
+        archivo.write(a_bytes(codigo))
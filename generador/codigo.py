@@ -0,0 +1,51 @@
+from typing import List
+
+
+class ConstructorCodigo:
+    """
+    Acumula el código generado como una lista de líneas con un nivel de
+    sangría. Cada línea se escribe una sola vez y ya con su sangría
+    final, los bloques anidados no se vuelven a recorrer para tabularlos
+    """
+
+    __slots__ = ('lineas', 'nivel', 'sangria', 'prefijos')
+
+    lineas: List[str]
+    nivel: int
+    sangria: str
+    prefijos: List[str]
+
+    def __init__(self, sangria: str = '  '):
+        self.lineas = []
+        self.nivel = 0
+        self.sangria = sangria
+        self.prefijos = ['']
+
+    def linea(self, texto: str = '') -> None:
+        """
+        Agrega una línea con la sangría del nivel actual, las líneas
+        vacías no llevan sangría
+        """
+
+        self.lineas.append(self.prefijos[self.nivel] + texto
+                           if texto else '')
+
+    def entrar(self) -> None:
+        """
+        Inicia un bloque, las siguientes líneas llevan un nivel más de
+        sangría
+        """
+
+        self.nivel += 1
+        if self.nivel == len(self.prefijos):
+            self.prefijos.append(self.sangria * self.nivel)
+
+    def salir(self) -> None:
+        """
+        Termina el bloque actual
+        """
+
+        self.nivel -= 1
+
+    def texto(self) -> str:
+        return '\n'.join(self.lineas)
@@ -1,24 +1,55 @@
+import ast
+import gc
+import sys
+from types import CodeType
+from typing import Dict, Final, Iterator, List, Optional, TextIO
 
-from typing import Final
-
-from Utils.arbol import ArbolSintaxisAbstracta
+from Utils.arbol import ArbolSintaxisAbstracta, Nodo
+from Utils.archivos import escribir_bloques
 
 from Generador.visitadores import VisitantePython
+from Generador.visitadores_ast import VisitantePythonAST
+from Verificador.estandar import (MODULO_ESTANDAR, AmbienteEstandar,
+                                  ambiente_estandar)
+from Verificador.grafo import GrafoLlamadas
+from Verificador.inferencia import InferenciaTipos
 
 
 class Generador:
 
     
-    LIB_ESTANDAR: Final = "from Lib.estandar import *"
+    LIB_ESTANDAR: Final = f"from {MODULO_ESTANDAR} import *"
 
     asa            : ArbolSintaxisAbstracta
+    inferencia     : InferenciaTipos
     visitador      : VisitantePython
+    grafo          : GrafoLlamadas
+    ambiente       : AmbienteEstandar
+    unidades       : List[Nodo]
 
 
-    def __init__(self, nuevo_asa: ArbolSintaxisAbstracta):
+    def __init__(self, nuevo_asa: ArbolSintaxisAbstracta,
+                 eliminar: bool = True,
+                 ambiente: Optional[AmbienteEstandar] = None):
+        """
+        Con `eliminar` sólo se generan las funciones y asignaciones
+        globales alcanzables desde la principal. `ambiente` tiene las
+        funciones nativas, por defecto las estándar y las registradas
+        """
 
         self.asa            = nuevo_asa
-        self.visitador      = VisitantePython() 
+        self.ambiente       = ambiente or ambiente_estandar()
+        self.grafo          = GrafoLlamadas(nuevo_asa, self.ambiente)
+        if eliminar:
+            self.unidades   = self.grafo.construir().generadas()
+        else:
+            self.unidades   = list(nuevo_asa.raiz.nodos) \
+                if nuevo_asa.raiz is not None else []
+
+        # Los tipos sólo dependen de lo que se genera
+        self.inferencia     = InferenciaTipos(
+            nuevo_asa, self.unidades, self.ambiente).inferir()
+        self.visitador      = VisitantePython(self.inferencia)
 
     def imprimir_asa(self):
         """
@@ -30,7 +61,104 @@ class Generador:
         else:
             self.asa.imprimir_preorden()
 
-    def generar(self):
-        resultado = self.visitador.visitar(self.asa.raiz)
-        print(self.LIB_ESTANDAR)
-        print(resultado)
+    def generar(self, salida: Optional[TextIO] = None) -> None:
+        """
+        Escribe el código generado en `salida` (por defecto la salida
+        estándar) conforme se genera cada unidad, por bloques
+        """
+
+        escribir_bloques(salida or sys.stdout, self.iterar_codigo())
+
+    def generar_codigo(self) -> str:
+        """
+        Retorna el código de python generado, con la importación
+        de la librería estándar y sin las unidades eliminadas
+        """
+
+        return ''.join(self.iterar_codigo())
+
+    def iterar_codigo(self) -> Iterator[str]:
+        """
+        Genera el código por partes: las importaciones y luego cada
+        función, asignación global y la principal en cuanto se visita,
+        así sólo una unidad generada está en memoria a la vez
+        """
+
+        yield f'{self.importaciones()}\n'
+
+        # Las unidades se separan con una línea como lo haría PROGRAMA
+        for posicion, unidad in enumerate(self.unidades):
+            if posicion:
+                yield '\n'
+            yield self.visitador.visitar(unidad)
+
+        yield '\n'
+
+    def generar_modulo(self) -> ast.Module:
+        """
+        Retorna el módulo de python como nodos de `ast`, equivalente al
+        código de texto y con las posiciones del código fuente
+        """
+
+        visitador = VisitantePythonAST(self.inferencia)
+
+        cuerpo = [ast.ImportFrom(MODULO_ESTANDAR, [ast.alias('*')], 0)]
+        cuerpo += [ast.ImportFrom(modulo, [ast.alias(nombre)
+                                           for nombre in nombres], 0)
+                   for modulo, nombres in self.modulos_nativos().items()]
+        for importacion in cuerpo:
+            importacion.lineno = importacion.end_lineno = 1
+            importacion.col_offset = importacion.end_col_offset = 0
+            for alias in importacion.names:
+                ast.copy_location(alias, importacion)
+
+        # Los nodos de `ast` que se crean no se vuelven basura mientras se
+        # genera, sin pausar el recolector de basura las recolecciones
+        # recorren todos los nodos ya creados una y otra vez
+        activo = gc.isenabled()
+        gc.disable()
+        try:
+            for unidad in self.unidades:
+                cuerpo += visitador.visitar(unidad)
+        finally:
+            if activo:
+                gc.enable()
+
+        return ast.Module(cuerpo, [])
+
+    def compilar(self, archivo: str = '<cmamuth>',
+                 posiciones: bool = False) -> CodeType:
+        """
+        Compila el código generado, `archivo` es la ruta que aparece en
+        los errores. Con `posiciones` se compilan los nodos de `ast` sin
+        pasar por el texto, así los errores apuntan a las líneas del
+        código fuente .cm. Armar los nodos en python tarda más que unir
+        el texto y que compile() lo analice, por eso no es lo normal
+        """
+
+        if posiciones:
+            return compile(self.generar_modulo(), archivo, 'exec')
+        return compile(self.generar_codigo(), archivo, 'exec')
+
+    def importaciones(self) -> str:
+        """
+        Importación de la librería estándar y de las funciones nativas
+        registradas que vienen de otros módulos
+        """
+
+        return '\n'.join([self.LIB_ESTANDAR] + [
+            f'from {modulo} import {", ".join(nombres)}'
+            for modulo, nombres in self.modulos_nativos().items()])
+
+    def modulos_nativos(self) -> Dict[str, List[str]]:
+        """
+        Funciones nativas registradas de cada módulo que no es el de la
+        librería estándar
+        """
+
+        modulos = {}
+        for funcion in self.ambiente.funciones.values():
+            if funcion.modulo != MODULO_ESTANDAR:
+                modulos.setdefault(funcion.modulo, []).append(funcion.nombre)
+
+        return modulos
@@ -1,296 +1,351 @@
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
 from Utils.arbol import Nodo, TipoNodo
+from Utils.recorrido import recorrer
+from Utils.tipo_datos import TipoDato
+from Verificador.inferencia import GLOBAL, InferenciaTipos
+
+from Generador.codigo import ConstructorCodigo
+
+# Anotación de las variables con un tipo probado
+ANOTACIONES = {
+    TipoDato.ENTERO: 'int', TipoDato.FLOTANTE: 'float',
+    TipoDato.TEXTO: 'str', TipoDato.BOOLEANO: 'bool'
+}
 
 class VisitantePython:
+    """
+    Genera el código de python de un sector del árbol. Las instrucciones
+    se escriben como líneas en un ConstructorCodigo, cada una con su
+    sangría final, y las expresiones se generan como texto a partir del
+    texto de sus hijos
+    """
 
-    tabuladores = 0
+    inferencia: Optional[InferenciaTipos]
+    alcance: Hashable
+    anotadas: Set[Tuple[Hashable, str]]
+    dic_instrucciones: Dict[TipoNodo, Callable]
+    dic_tipos_nodo: Dict[TipoNodo, Callable]
 
-    def __init__(self):
+    def __init__(self, inferencia: Optional[InferenciaTipos] = None):
         """
-        Constructor para inicializar la clase visitante
+        Constructor para inicializar la clase visitante, con `inferencia`
+        las variables con un tipo probado se anotan en su primera
+        asignación
         """
 
-        #diccionario para asignar el tipo de nodo con su respectiva función
-        self.dic_tipos_nodo = {
+        self.inferencia = inferencia
+        self.alcance = GLOBAL
+        self.anotadas = set()
+
+        #diccionario con las instrucciones, que escriben líneas de código
+        self.dic_instrucciones = {
             TipoNodo.PROGRAMA: self.__visitar_programa, TipoNodo.ASIGNACION: self.__visitar_asignacion,
-            TipoNodo.EXPRESION_MATEMATICA: self.__visitar_expresion_matematica, TipoNodo.FUNCION: self.__visitar_funcion,
-            TipoNodo.INVOCACION: self.__visitar_invocacion, TipoNodo.COMPARACION: self.__visitar_comparacion,
-            TipoNodo.PARAMETROS_INVOCACION: self.__visitar_parametros_invocacion, TipoNodo.PARAMETROS_FUNCION: self.__visitar_parametros_funcion,
-            TipoNodo.INSTRUCCION: self.__visitar_instruccion, TipoNodo.REPETIR: self.__visitar_repetir, TipoNodo.CONDICIONAL: self.__visitar_condicional,
-            TipoNodo.SIUUU: self.__visitar_siuuu, TipoNodo.NIMODO: self.__visitar_nimodo, TipoNodo.OPERADOR_LOGICO: self.__visitar_operador_logico,
-            TipoNodo.COMPARADOR: self.__visitar_comparador, TipoNodo.RETORNO: self.__visitar_retorno, TipoNodo.PRINCIPAL: self.__visitar_principal,
-            TipoNodo.CONJUNTO_INSTRUCCIONES: self.__visitar_conjunto_instrucciones, TipoNodo.OPERADOR: self.__visitar_operador,
+            TipoNodo.FUNCION: self.__visitar_funcion, TipoNodo.PRINCIPAL: self.__visitar_principal,
+            TipoNodo.CONJUNTO_INSTRUCCIONES: self.__visitar_conjunto_instrucciones, TipoNodo.INSTRUCCION: self.__visitar_instruccion,
+            TipoNodo.REPETIR: self.__visitar_repetir, TipoNodo.CONDICIONAL: self.__visitar_condicional,
+            TipoNodo.SIUUU: self.__visitar_siuuu, TipoNodo.NIMODO: self.__visitar_nimodo,
+            TipoNodo.RETORNO: self.__visitar_retorno, TipoNodo.INVOCACION: self.__visitar_invocacion_instruccion
+        }
+
+        #diccionario para asignar el tipo de nodo de una expresión con su respectiva función
+        self.dic_tipos_nodo = {
+            TipoNodo.EXPRESION_MATEMATICA: self.__visitar_expresion_matematica, TipoNodo.INVOCACION: self.__visitar_invocacion,
+            TipoNodo.COMPARACION: self.__visitar_comparacion, TipoNodo.PARAMETROS_INVOCACION: self.__visitar_parametros_invocacion,
+            TipoNodo.PARAMETROS_FUNCION: self.__visitar_parametros_funcion, TipoNodo.OPERADOR_LOGICO: self.__visitar_operador_logico,
+            TipoNodo.COMPARADOR: self.__visitar_comparador, TipoNodo.OPERADOR: self.__visitar_operador,
             TipoNodo.TEXTO: self.__visitar_texto, TipoNodo.ENTERO: self.__visitar_entero, TipoNodo.FLOTANTE: self.__visitar_flotante,
             TipoNodo.IDENTIFICADOR: self.__visitar_identificador, TipoNodo.EXPRESION_CONDICIONAL: self.__visitar_expresion_condicional,
             TipoNodo.BOOLEANO: self.__visitar_booleano
         }
 
-    def visitar(self, nodo: Nodo) -> None:
+    def visitar(self, nodo: Nodo) -> str:
         """
-        Se utiliza el diccionario para visitar al sector del árbol correspondiente,
-        dependiendo del nodo que le entre, a esa función se llama
-
-        self.dic_tipos_nodo[TipoNodo.PROGRAMA] = self.__visitar_programa
+        Retorna el código del sector del árbol que inicia en el nodo
         """
 
-        return self.dic_tipos_nodo[nodo.tipo](nodo)
-    
-    def __visitar_programa(self, nodo_actual: Nodo) -> str:
-        """
-        Programa ::= Comentario Asignación* (Comentario | Funcion)* Principal
-        """
+        if nodo.tipo not in self.dic_instrucciones:
+            return self.__expresion(nodo)
 
-        instrucciones = []
-        # Se ignoran los comentarios
+        codigo = ConstructorCodigo()
+        self.escribir(nodo, codigo)
+        return codigo.texto()
 
-        for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
-        
-        return '\n'.join(instrucciones) 
-    
-    def __visitar_asignacion(self, nodo_actual: Nodo) -> str:
+    def escribir(self, nodo: Nodo, codigo: ConstructorCodigo) -> None:
         """
-        Asignación ::= Identificador anotado (Valor | Invocación | ExpresionMatematica).
+        Escribe en `codigo` las líneas de una instrucción sin recursión:
+        cada instrucción escribe sus líneas y deja en la pila sus hijos
+        y lo que hay que hacer al terminarlos (como cerrar el bloque),
+        así la profundidad del árbol sólo está limitada por la memoria
         """
 
-        resultado = """{} = {}"""
+        pendientes = [nodo]
 
-        instrucciones = []
+        while pendientes:
+            pendiente = pendientes.pop()
 
-        for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+            if callable(pendiente):
+                pendiente()
+            else:
+                self.dic_instrucciones[pendiente.tipo](pendiente, codigo,
+                                                       pendientes)
 
-        return resultado.format(instrucciones[0],instrucciones[1])
-    
-    def __visitar_expresion_matematica(self, nodo_actual: Nodo) -> str:
+    def __expresion(self, nodo: Nodo) -> str:
         """
-        ExpresionMatematica::= #Valor (Operador Valor)*#
+        Texto de una expresión, generado a partir del texto de sus hijos
         """
 
-        instrucciones = []
+        return recorrer(nodo, None, self.__salir)
 
-        for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+    def __salir(self, nodo: Nodo, instrucciones: List) -> str:
+        """
+        Genera el código del nodo a partir del código de sus hijos
+        """
 
-        return ' '.join(instrucciones)
-    
-    def __visitar_funcion(self, nodo_actual: Nodo) -> str:
+        return self.dic_tipos_nodo[nodo.tipo](nodo, instrucciones)
+
+    def __bloque(self, conjunto: Nodo, codigo: ConstructorCodigo,
+                 pendientes: List) -> None:
         """
-        Función ::= POV Identificador(Parámetros?) xD ConjuntoInstrucciones v:
+        Deja en la pila un bloque con un nivel más de sangría
         """
 
-        resultado = """\ndef {}({}):\n{}"""
+        codigo.entrar()
+        pendientes.append(codigo.salir)
+        pendientes.append(conjunto)
 
-        instrucciones = []
+    def __entrar_alcance(self, nodo: Nodo, pendientes: List) -> None:
+        """
+        Las funciones y la principal cambian el alcance de las variables
+        hasta que terminan
+        """
 
-        for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+        self.alcance = InferenciaTipos.alcance(nodo)
+        pendientes.append(self.__salir_alcance)
 
-        if len(instrucciones) == 2:
-            return resultado.format(instrucciones[0],"",'\n'.join(instrucciones[1]))
+        # Los parámetros no se anotan dentro del cuerpo
+        if nodo.tipo == TipoNodo.FUNCION and \
+                nodo.nodos[1].tipo == TipoNodo.PARAMETROS_FUNCION:
+            self.anotadas.update((self.alcance, parametro.contenido)
+                                 for parametro in nodo.nodos[1].nodos)
 
-        return resultado.format(instrucciones[0],instrucciones[1], '\n'.join(instrucciones[2]))
+    def __salir_alcance(self) -> None:
+        self.alcance = GLOBAL
 
+    def __visitar_programa(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                           pendientes: List) -> None:
+        """
+        Programa ::= Comentario Asignación* (Comentario | Funcion)* Principal
+        """
+
+        pendientes.extend(reversed(nodo_actual.nodos))
 
-    def __visitar_invocacion(self, nodo_actual: Nodo) -> str:
+    def __visitar_asignacion(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                             pendientes: List) -> None:
         """
-        Invocación ::= jutsu Identificador(Parámetros?)
+        Asignación ::= Identificador anotado (Valor | Invocación | ExpresionMatematica).
         """
 
-        resultado = """{}({})"""
+        resultado = """{} = {}"""
 
-        instrucciones = []
+        variable = (self.alcance, nodo_actual.nodos[0].contenido)
+        if self.inferencia is not None and variable not in self.anotadas:
+            self.anotadas.add(variable)
 
-        for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+            anotacion = ANOTACIONES.get(
+                self.inferencia.tipo_variable(*variable))
+            if anotacion is not None:
+                resultado = f"""{{}}: {anotacion} = {{}}"""
 
-        if len(instrucciones) == 1:
-            return resultado.format(instrucciones[0],"")
+        codigo.linea(resultado.format(nodo_actual.nodos[0].contenido,
+                                      self.__expresion(nodo_actual.nodos[1])))
 
-        return resultado.format(instrucciones[0], instrucciones[1])
-    
-    def __visitar_parametros_invocacion(self, nodo_actual: Nodo) -> str:
+    def __visitar_funcion(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                          pendientes: List) -> None:
         """
-        ParámetrosInvocacion::= Valor (, Valor)*
+        Función ::= POV Identificador(Parámetros?) xD ConjuntoInstrucciones v:
         """
-        parametros = []
 
-        for nodo in nodo_actual.nodos:
-            parametros.append(nodo.visitar(self))
+        parametros = ''
+        if len(nodo_actual.nodos) == 3:
+            parametros = self.__expresion(nodo_actual.nodos[1])
 
-        if len(parametros) > 0:
-            return ','.join(parametros)
+        codigo.linea()
+        codigo.linea(f'def {nodo_actual.nodos[0].contenido}({parametros}):')
 
-        else:
-            return ''
+        self.__entrar_alcance(nodo_actual, pendientes)
+        self.__bloque(nodo_actual.nodos[-1], codigo, pendientes)
 
-    def __visitar_parametros_funcion(self, nodo_actual: Nodo) -> str:
+    def __visitar_invocacion_instruccion(self, nodo_actual: Nodo,
+                                         codigo: ConstructorCodigo,
+                                         pendientes: List) -> None:
         """
-        ParámetrosFuncion::= Identificador (, Identificador)*
+        Invocación como instrucción
         """
 
-        parametros = []
-
-        for nodo in nodo_actual.nodos:
-            parametros.append(nodo.visitar(self))
-
-        if len(parametros) > 0:
-            return ','.join(parametros)
+        codigo.linea(self.__expresion(nodo_actual))
 
-        else:
-            return ''     
-    def __visitar_instruccion(self, nodo_actual: Nodo) -> str :
+    def __visitar_instruccion(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                              pendientes: List) -> None:
         """
         Instrucción ::= (Repetición | Bifurcación | (Asignación | Invocación) | Retorno | Error | Comentario )
         """
 
-        valor = ""
-
-        for nodo in nodo_actual.nodos:
-            valor = nodo.visitar(self)
-
-        return valor
+        if nodo_actual.nodos:
+            pendientes.append(nodo_actual.nodos[-1])
+        else:
+            codigo.linea()
 
-    def __visitar_repetir(self, nodo_actual: Nodo) -> str:
+    def __visitar_repetir(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                          pendientes: List) -> None:
         """
         Repetir ::= whenCuando xD ConjuntoInstrucciones but (ExpCondicional) v:
         """
 
-        resultado = """while {}:\n{}"""
+        codigo.linea(f'while {self.__expresion(nodo_actual.nodos[1])}:')
+        self.__bloque(nodo_actual.nodos[0], codigo, pendientes)
 
-        instrucciones = []
-
-        # Visita la condición
-        for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
-
-        return resultado.format(instrucciones[1],'\n'.join(instrucciones[0]))
-
-    def __visitar_condicional(self, nodo_actual: Nodo) -> str:
+    def __visitar_condicional(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                              pendientes: List) -> None:
         """
         Condicional::= Siuuu Nimodo?
         """
 
-        resultado = """{}{}"""
+        pendientes.extend(reversed(nodo_actual.nodos))
 
-        instrucciones = []
+    def __visitar_siuuu(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                        pendientes: List) -> None:
+        """
+        Siuuu::= siuuu (ExpCondicional) xD ConjuntoInstrucciones v:
+        """
 
-        for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+        codigo.linea(f'if {self.__expresion(nodo_actual.nodos[0])}:')
+        self.__bloque(nodo_actual.nodos[1], codigo, pendientes)
 
-        return resultado.format(instrucciones[0], '')
- 
-    def __visitar_siuuu(self, nodo_actual: Nodo) -> str:
+    def __visitar_nimodo(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                         pendientes: List) -> None:
         """
-        Siuuu::= siuuu (ExpCondicional) xD ConjuntoInstrucciones v:
+        Nimodo::=  nimodo xD ConjuntoInstrucciones v:
         """
 
-        resultado = """if {}:\n{}"""
+        codigo.linea('else:')
+        self.__bloque(nodo_actual.nodos[0], codigo, pendientes)
 
-        instrucciones = []
+    def __visitar_retorno(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                          pendientes: List) -> None:
+        """
+        Retorno: := messirve Valor?
+        """
+        resultado = 'return {}'
+        valor = ''
 
-        for nodo in nodo_actual.nodos:
-            instrucciones.append(nodo.visitar(self))
+        if nodo_actual.nodos:
+            valor = self.__expresion(nodo_actual.nodos[-1])
 
-        return resultado.format(instrucciones[0],'\n'.join(instrucciones[1]))
+        codigo.linea(resultado.format(valor))
 
-    def __visitar_nimodo(self, nodo_actual: Nodo) -> str:
+    def __visitar_principal(self, nodo_actual: Nodo, codigo: ConstructorCodigo,
+                            pendientes: List) -> None:
         """
-        Nimodo::=  nimodo xD ConjuntoInstrucciones v:
+        Principal::= maracuya() xD ConjuntoInstrucciones v:
         """
 
-        resultado = """else:\n  {}"""
+        codigo.linea()
+        codigo.linea('def principal():')
 
-        instrucciones = []
+        # Al terminar el cuerpo se escribe la invocación
+        pendientes.append(lambda: self.__escribir_invocacion_principal(codigo))
+        self.__entrar_alcance(nodo_actual, pendientes)
+        self.__bloque(nodo_actual.nodos[0], codigo, pendientes)
 
-        for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+    def __escribir_invocacion_principal(self, codigo: ConstructorCodigo) -> None:
+        codigo.linea()
+        codigo.linea()
+        codigo.linea("if __name__ == '__main__':")
+        codigo.linea('    principal()')
+        codigo.linea()
 
-        return resultado.format('\n'.join(instrucciones[0]))
-    
-    def __visitar_expresion_condicional(self, nodo_actual: Nodo) -> str:
+    def __visitar_conjunto_instrucciones(self, nodo_actual: Nodo,
+                                         codigo: ConstructorCodigo,
+                                         pendientes: List) -> None:
         """
-        ExpCondicional ::= Comparación(OperadorLogico Comparación)?
+        ConjuntoInstrucciones ::= Instruccion+
+
+        El optimizador puede dejar un conjunto sin instrucciones
         """
 
-        resultado = """{} {} {}"""
+        if not nodo_actual.nodos:
+            codigo.linea('pass')
 
-        instrucciones = []
+        pendientes.extend(reversed(nodo_actual.nodos))
 
-        for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+    def __visitar_expresion_matematica(self, nodo_actual: Nodo, instrucciones: List) -> str:
+        """
+        ExpresionMatematica::= #Valor (Operador Valor)*#
+        """
 
-        if len(instrucciones) == 1:
-            return resultado.format(instrucciones[0],'', '')
-        else:
-            return resultado.format(instrucciones[0],instrucciones[1],instrucciones[2])
+        return ' '.join(instrucciones)
 
-    def __visitar_comparacion(self, nodo_actual: Nodo) -> str:
+    def __visitar_invocacion(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
-        Comparación::= Valor Comparador Valor
+        Invocación ::= jutsu Identificador(Parámetros?)
         """
-        resultado = '{} {} {}'
 
-        elementos = []
+        resultado = """{}({})"""
 
-        #Si valor es IDENTIFICADOR se verifica que exista
-        for nodo in nodo_actual.nodos:
-            elementos.append(nodo.visitar(self))
-        
-        return resultado.format(elementos[0], elementos[1], elementos[2])
-    
-    def __visitar_retorno(self, nodo_actual: Nodo) -> str:
+        if len(instrucciones) == 1:
+            return resultado.format(instrucciones[0],"")
+
+        return resultado.format(instrucciones[0], instrucciones[1])
+
+    def __visitar_parametros_invocacion(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
-        Retorno: := messirve Valor?
+        ParámetrosInvocacion::= Valor (, Valor)*
         """
-        resultado = 'return {}'
-        valor = ''
+        parametros = instrucciones
 
-        for nodo in nodo_actual.nodos:
-            valor = nodo.visitar(self)
+        if len(parametros) > 0:
+            return ','.join(parametros)
 
-        return resultado.format(valor)
+        else:
+            return ''
 
-    def __visitar_principal(self, nodo_actual: Nodo) -> None:
+    def __visitar_parametros_funcion(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
-        Principal::= maracuya() xD ConjuntoInstrucciones v:
+        ParámetrosFuncion::= Identificador (, Identificador)*
         """
-        #Solo visita un bloque de instrucciones
 
-        resultado = """\ndef principal():\n{}\n
+        parametros = instrucciones
 
-if __name__ == '__main__':
-    principal()
-"""
-        instrucciones = []
-        
-        for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
-        
-        return resultado.format("\n".join(instrucciones[0]))
+        if len(parametros) > 0:
+            return ','.join(parametros)
 
-    def __visitar_conjunto_instrucciones(self, nodo_actual: Nodo):
+        else:
+            return ''
+
+    def __visitar_expresion_condicional(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
-        ConjuntoInstrucciones ::= Instruccion+
+        ExpCondicional ::= Comparación(OperadorLogico Comparación)?
         """
-        self.tabuladores += 2
 
-        instrucciones = []
+        resultado = """{} {} {}"""
 
-        #Se visitan todas las instrucciones
-        for nodo in nodo_actual.nodos:
-            instrucciones += [nodo.visitar(self)]
+        if len(instrucciones) == 1:
+            return resultado.format(instrucciones[0],'', '')
+        else:
+            return resultado.format(instrucciones[0],instrucciones[1],instrucciones[2])
 
-        instrucciones_tabuladas = []
+    def __visitar_comparacion(self, nodo_actual: Nodo, instrucciones: List) -> str:
+        """
+        Comparación::= Valor Comparador Valor
+        """
+        resultado = '{} {} {}'
 
-        for instruccion in instrucciones:
-            instrucciones_tabuladas += [self.__retornar_tabuladores() + instruccion]
+        elementos = instrucciones
         
-        self.tabuladores -= 2
-
-        return instrucciones_tabuladas
-       
+        return resultado.format(elementos[0], elementos[1], elementos[2])
 
-    def __visitar_operador(self, nodo_actual: Nodo) -> str:
+    def __visitar_operador(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
         Operador::= bobMar | bobStar | bobiDir | bobTiplicar
         """
@@ -307,7 +362,7 @@ if __name__ == '__main__':
         else:
             return '/'
 
-    def __visitar_booleano(self, nodo_actual: Nodo) -> str:
+    def __visitar_booleano(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
         Booleano::= SIUA|NOUA
         """
@@ -318,7 +373,7 @@ if __name__ == '__main__':
         else:
             return 'False'
 
-    def __visitar_operador_logico(self, nodo_actual: Nodo) -> str:
+    def __visitar_operador_logico(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
         Operador logico ::= (aja | ayno)
         """
@@ -328,8 +383,8 @@ if __name__ == '__main__':
         
         else:
             return 'or'
-    
-    def __visitar_comparador(self, nodo_actual: Nodo) -> str:
+
+    def __visitar_comparador(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
         Comparador ::= chikito | tapotente | panapotente | panachikito | nolocrick | panas
         """
@@ -354,30 +409,26 @@ if __name__ == '__main__':
         else:
             return 'yo'
 
-    def __visitar_texto(self, nodo_actual: Nodo) -> str:
+    def __visitar_texto(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
         Texto ::= ツ.*ツ
         """
         return nodo_actual.contenido.replace('ツ', '"')
 
-    def __visitar_entero(self, nodo_actual: Nodo) -> str:
+    def __visitar_entero(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
         Entero::= -?[0-9]+
         """
         return nodo_actual.contenido
 
-    def __visitar_flotante(self, nodo_actual: Nodo) -> str:
+    def __visitar_flotante(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
         Flotante::= -?[0-9]+;[0-9]+
         """
         return nodo_actual.contenido.replace(';', '.')
-        
 
-    def __visitar_identificador(self, nodo_actual: Nodo) -> str:
+    def __visitar_identificador(self, nodo_actual: Nodo, instrucciones: List) -> str:
         """
         Identificador ::= [a-z][a-zA-Z0-9]+
         """
         return nodo_actual.contenido
-
-    def __retornar_tabuladores(self):
-        return " " * self.tabuladores
@@ -0,0 +1,489 @@
+import ast
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from Utils.arbol import Nodo, TipoNodo
+from Verificador.inferencia import GLOBAL, InferenciaTipos
+
+from Generador.visitadores import ANOTACIONES
+
+# Los operadores y los contextos no guardan nada, todos los nodos
+# comparten la misma instancia
+OPERADORES = {
+    'bobMar': ast.Add(), 'bobStar': ast.Sub(), 'bobTiplicar': ast.Mult(),
+    'bobiDir': ast.Div()
+}
+
+# Operadores que se aplican antes que la suma y la resta, igual que en
+# el código de texto que se genera
+MULTIPLICATIVOS = frozenset({'bobTiplicar', 'bobiDir'})
+
+COMPARADORES = {
+    'tapotente': ast.Gt(), 'chikito': ast.Lt(), 'panas': ast.Eq(),
+    'nolocrick': ast.NotEq(), 'panachikito': ast.LtE(),
+    'panapotente': ast.GtE()
+}
+
+OPERADORES_LOGICOS = {'aja': ast.And(), 'ayno': ast.Or()}
+
+CARGAR = ast.Load()
+GUARDAR = ast.Store()
+
+
+def abarcar(nodo: ast.AST, inicio: ast.AST, fin: ast.AST) -> ast.AST:
+    """
+    Ubica el nodo desde el inicio de `inicio` hasta el final de `fin`
+    """
+
+    nodo.lineno = inicio.lineno
+    nodo.col_offset = inicio.col_offset
+
+    if (fin.end_lineno, fin.end_col_offset) > \
+            (inicio.end_lineno, inicio.end_col_offset):
+        inicio = fin
+    nodo.end_lineno = inicio.end_lineno
+    nodo.end_col_offset = inicio.end_col_offset
+    return nodo
+
+
+def definir_funcion(nombre: str, parametros: List[str]) -> ast.FunctionDef:
+    """
+    Definición de una función sin decoradores ni anotaciones y con el
+    cuerpo vacío, los campos cambian entre versiones de python
+    """
+
+    funcion = ast.FunctionDef(
+        name=nombre,
+        args=ast.arguments(posonlyargs=[],
+                           args=[ast.arg(parametro) for parametro in parametros],
+                           kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=[], decorator_list=[], returns=None)
+
+    if 'type_params' in ast.FunctionDef._fields:
+        funcion.type_params = []
+    return funcion
+
+
+class VisitantePythonAST:
+    """
+    Genera los nodos del módulo `ast` de python de un sector del árbol,
+    listos para `compile()` sin pasar por el texto. Cada nodo lleva la
+    línea y columna del código fuente .cm de la que sale, así los
+    errores al ejecutar apuntan al programa original.
+
+    Produce lo mismo que VisitantePython (las mismas anotaciones y la
+    invocación de `principal`) y recorre las instrucciones igual, con
+    una pila: cada instrucción agrega su nodo a la lista del bloque que
+    la contiene y deja en la pila sus bloques con la lista de su cuerpo.
+    Las expresiones se generan recursivamente, la gramática no las anida
+    más de unos pocos niveles
+    """
+
+    inferencia: Optional[InferenciaTipos]
+    alcance: Hashable
+    anotadas: Set[Tuple[Hashable, str]]
+    posicion: Tuple[int, int]
+    dic_instrucciones: Dict[TipoNodo, Callable]
+    dic_tipos_nodo: Dict[TipoNodo, Callable]
+
+    def __init__(self, inferencia: Optional[InferenciaTipos] = None):
+        """
+        Constructor para inicializar la clase visitante, con `inferencia`
+        las variables con un tipo probado se anotan en su primera
+        asignación
+        """
+
+        self.inferencia = inferencia
+        self.alcance = GLOBAL
+        self.anotadas = set()
+
+        # Posición de lo último que se generó, para los nodos sin una
+        self.posicion = (1, 0)
+
+        #diccionario con las instrucciones, que agregan sus nodos al bloque
+        self.dic_instrucciones = {
+            TipoNodo.PROGRAMA: self.__visitar_programa, TipoNodo.ASIGNACION: self.__visitar_asignacion,
+            TipoNodo.FUNCION: self.__visitar_funcion, TipoNodo.PRINCIPAL: self.__visitar_principal,
+            TipoNodo.CONJUNTO_INSTRUCCIONES: self.__visitar_conjunto_instrucciones, TipoNodo.INSTRUCCION: self.__visitar_instruccion,
+            TipoNodo.REPETIR: self.__visitar_repetir, TipoNodo.CONDICIONAL: self.__visitar_condicional,
+            TipoNodo.RETORNO: self.__visitar_retorno, TipoNodo.INVOCACION: self.__visitar_invocacion_instruccion
+        }
+
+        #diccionario para asignar el tipo de nodo de una expresión con su respectiva función
+        self.dic_tipos_nodo = {
+            TipoNodo.EXPRESION_MATEMATICA: self.__visitar_expresion_matematica, TipoNodo.INVOCACION: self.__visitar_invocacion,
+            TipoNodo.COMPARACION: self.__visitar_comparacion, TipoNodo.EXPRESION_CONDICIONAL: self.__visitar_expresion_condicional,
+            TipoNodo.TEXTO: self.__visitar_texto, TipoNodo.ENTERO: self.__visitar_entero,
+            TipoNodo.FLOTANTE: self.__visitar_flotante, TipoNodo.BOOLEANO: self.__visitar_booleano,
+            TipoNodo.IDENTIFICADOR: self.__visitar_identificador
+        }
+
+    def visitar(self, nodo: Nodo):
+        """
+        Retorna lo que genera el sector del árbol que inicia en el nodo:
+        la lista de instrucciones o la expresión
+        """
+
+        if nodo.tipo not in self.dic_instrucciones:
+            return self.__expresion(nodo)
+
+        instrucciones = []
+        self.escribir(nodo, instrucciones)
+        return instrucciones
+
+    def escribir(self, nodo: Nodo, destino: List[ast.stmt]) -> None:
+        """
+        Agrega a `destino` las instrucciones del nodo sin recursión: la
+        pila guarda cada nodo con la lista donde van sus instrucciones y
+        lo que hay que hacer al terminar un bloque
+        """
+
+        pendientes = [(nodo, destino)]
+
+        while pendientes:
+            pendiente = pendientes.pop()
+
+            if callable(pendiente):
+                pendiente()
+            else:
+                nodo, destino = pendiente
+                self.dic_instrucciones[nodo.tipo](nodo, destino, pendientes)
+
+    def __expresion(self, nodo: Nodo) -> ast.expr:
+        return self.dic_tipos_nodo[nodo.tipo](nodo)
+
+    def __ubicar(self, nodo: ast.AST, origen: Optional[Nodo] = None,
+                 largo: int = 0) -> ast.AST:
+        """
+        Ubica el nodo de python en la posición de `origen` en el código
+        fuente, o en la última posición si no tiene. `largo` es la
+        cantidad de caracteres que ocupa
+        """
+
+        if origen is not None:
+            linea = origen.linea
+            if linea is not None:
+                self.posicion = (linea, (origen.columna or 1) - 1)
+
+        nodo.lineno, nodo.col_offset = self.posicion
+        nodo.end_lineno = nodo.lineno
+        nodo.end_col_offset = nodo.col_offset + largo
+        return nodo
+
+    def __bloque(self, conjunto: Nodo, cuerpo: List[ast.stmt],
+                 pendientes: List) -> None:
+        """
+        Deja en la pila un bloque cuyas instrucciones van en `cuerpo`, si
+        queda vacío se completa con `pass`
+        """
+
+        def completar() -> None:
+            if not cuerpo:
+                cuerpo.append(self.__ubicar(ast.Pass()))
+
+        pendientes.append(completar)
+        pendientes.append((conjunto, cuerpo))
+
+    def __entrar_alcance(self, nodo: Nodo, pendientes: List) -> None:
+        """
+        Las funciones y la principal cambian el alcance de las variables
+        hasta que terminan
+        """
+
+        self.alcance = InferenciaTipos.alcance(nodo)
+        pendientes.append(self.__salir_alcance)
+
+        # Los parámetros no se anotan dentro del cuerpo
+        if nodo.tipo == TipoNodo.FUNCION and \
+                nodo.nodos[1].tipo == TipoNodo.PARAMETROS_FUNCION:
+            self.anotadas.update((self.alcance, parametro.contenido)
+                                 for parametro in nodo.nodos[1].nodos)
+
+    def __salir_alcance(self) -> None:
+        self.alcance = GLOBAL
+
+    def __visitar_programa(self, nodo_actual: Nodo, destino: List[ast.stmt],
+                           pendientes: List) -> None:
+        """
+        Programa ::= Comentario Asignación* (Comentario | Funcion)* Principal
+        """
+
+        pendientes.extend((unidad, destino)
+                          for unidad in reversed(nodo_actual.nodos))
+
+    def __visitar_asignacion(self, nodo_actual: Nodo, destino: List[ast.stmt],
+                             pendientes: List) -> None:
+        """
+        Asignación ::= Identificador anotado (Valor | Invocación | ExpresionMatematica).
+        """
+
+        nombre = nodo_actual.nodos[0].contenido
+        objetivo = self.__ubicar(ast.Name(nombre, GUARDAR),
+                                 nodo_actual.nodos[0], len(nombre))
+        valor = self.__expresion(nodo_actual.nodos[1])
+
+        anotacion = None
+        variable = (self.alcance, nombre)
+        if self.inferencia is not None and variable not in self.anotadas:
+            self.anotadas.add(variable)
+            anotacion = ANOTACIONES.get(
+                self.inferencia.tipo_variable(*variable))
+
+        if anotacion is not None:
+            asignacion = ast.AnnAssign(
+                objetivo, abarcar(ast.Name(anotacion, CARGAR),
+                                  objetivo, objetivo),
+                valor, simple=1)
+        else:
+            asignacion = ast.Assign([objetivo], valor)
+
+        destino.append(abarcar(asignacion, objetivo, valor))
+
+    def __visitar_funcion(self, nodo_actual: Nodo, destino: List[ast.stmt],
+                          pendientes: List) -> None:
+        """
+        Función ::= POV Identificador(Parámetros?) xD ConjuntoInstrucciones v:
+        """
+
+        parametros = []
+        if len(nodo_actual.nodos) == 3:
+            parametros = [parametro.contenido
+                          for parametro in nodo_actual.nodos[1].nodos]
+
+        funcion = self.__ubicar(
+            definir_funcion(nodo_actual.nodos[0].contenido, parametros),
+            nodo_actual.nodos[0])
+
+        # Los parámetros llevan la posición de la función
+        for parametro in funcion.args.args:
+            self.__ubicar(parametro)
+        destino.append(funcion)
+
+        self.__entrar_alcance(nodo_actual, pendientes)
+        self.__bloque(nodo_actual.nodos[-1], funcion.body, pendientes)
+
+    def __visitar_invocacion_instruccion(self, nodo_actual: Nodo,
+                                         destino: List[ast.stmt],
+                                         pendientes: List) -> None:
+        """
+        Invocación como instrucción
+        """
+
+        invocacion = self.__expresion(nodo_actual)
+        destino.append(abarcar(ast.Expr(invocacion), invocacion, invocacion))
+
+    def __visitar_instruccion(self, nodo_actual: Nodo, destino: List[ast.stmt],
+                              pendientes: List) -> None:
+        """
+        Instrucción ::= (Repetición | Bifurcación | (Asignación | Invocación) | Retorno | Error | Comentario )
+        """
+
+        if nodo_actual.nodos:
+            pendientes.append((nodo_actual.nodos[-1], destino))
+
+    def __visitar_repetir(self, nodo_actual: Nodo, destino: List[ast.stmt],
+                          pendientes: List) -> None:
+        """
+        Repetir ::= whenCuando xD ConjuntoInstrucciones but (ExpCondicional) v:
+
+        El ciclo se ubica en su condición
+        """
+
+        condicion = self.__expresion(nodo_actual.nodos[1])
+        repetir = abarcar(ast.While(condicion, [], []), condicion, condicion)
+        destino.append(repetir)
+
+        self.__bloque(nodo_actual.nodos[0], repetir.body, pendientes)
+
+    def __visitar_condicional(self, nodo_actual: Nodo, destino: List[ast.stmt],
+                              pendientes: List) -> None:
+        """
+        Condicional::= Siuuu Nimodo?
+        Siuuu::= siuuu (ExpCondicional) xD ConjuntoInstrucciones v:
+        Nimodo::=  nimodo xD ConjuntoInstrucciones v:
+        """
+
+        siuuu = nodo_actual.nodos[0]
+        condicion = self.__expresion(siuuu.nodos[0])
+        condicional = abarcar(ast.If(condicion, [], []), condicion, condicion)
+        destino.append(condicional)
+
+        # El nimodo queda debajo en la pila, se genera después del siuuu
+        if len(nodo_actual.nodos) == 2:
+            self.__bloque(nodo_actual.nodos[1].nodos[0], condicional.orelse,
+                          pendientes)
+        self.__bloque(siuuu.nodos[1], condicional.body, pendientes)
+
+    def __visitar_retorno(self, nodo_actual: Nodo, destino: List[ast.stmt],
+                          pendientes: List) -> None:
+        """
+        Retorno: := messirve Valor?
+        """
+
+        if not nodo_actual.nodos:
+            destino.append(self.__ubicar(ast.Return(None)))
+            return
+
+        valor = self.__expresion(nodo_actual.nodos[-1])
+        destino.append(abarcar(ast.Return(valor), valor, valor))
+
+    def __visitar_principal(self, nodo_actual: Nodo, destino: List[ast.stmt],
+                            pendientes: List) -> None:
+        """
+        Principal::= maracuya() xD ConjuntoInstrucciones v:
+
+        La principal se invoca cuando el módulo es el programa
+        """
+
+        principal = self.__ubicar(definir_funcion('principal', []),
+                                  nodo_actual)
+
+        invocacion = self.__ubicar(ast.If(
+            self.__ubicar(ast.Compare(
+                self.__ubicar(ast.Name('__name__', CARGAR)),
+                [COMPARADORES['panas']],
+                [self.__ubicar(ast.Constant('__main__'))])),
+            [self.__ubicar(ast.Expr(self.__ubicar(ast.Call(
+                self.__ubicar(ast.Name('principal', CARGAR)), [], []))))],
+            []))
+
+        destino.append(principal)
+        destino.append(invocacion)
+
+        self.__entrar_alcance(nodo_actual, pendientes)
+        self.__bloque(nodo_actual.nodos[0], principal.body, pendientes)
+
+    def __visitar_conjunto_instrucciones(self, nodo_actual: Nodo,
+                                         destino: List[ast.stmt],
+                                         pendientes: List) -> None:
+        """
+        ConjuntoInstrucciones ::= Instruccion+
+        """
+
+        pendientes.extend((instruccion, destino)
+                          for instruccion in reversed(nodo_actual.nodos))
+
+    def __visitar_expresion_matematica(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        ExpresionMatematica::= #Valor (Operador Valor)*#
+
+        Los operadores multiplicativos se agrupan primero y luego la suma
+        y la resta, todos de izquierda a derecha
+        """
+
+        nodos = nodo_actual.nodos
+        terminos = []
+        aditivos = []
+        termino = self.__expresion(nodos[0])
+
+        for posicion in range(1, len(nodos), 2):
+            contenido = nodos[posicion].contenido
+            operando = self.__expresion(nodos[posicion + 1])
+
+            if contenido in MULTIPLICATIVOS:
+                termino = abarcar(ast.BinOp(termino, OPERADORES[contenido],
+                                            operando),
+                                  termino, operando)
+            else:
+                terminos.append(termino)
+                aditivos.append(OPERADORES[contenido])
+                termino = operando
+
+        terminos.append(termino)
+
+        resultado = terminos[0]
+        for operador, termino in zip(aditivos, terminos[1:]):
+            resultado = abarcar(ast.BinOp(resultado, operador, termino),
+                                resultado, termino)
+
+        return resultado
+
+    def __visitar_invocacion(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        Invocación ::= jutsu Identificador(Parámetros?)
+
+        Los argumentos pueden venir como ParámetrosInvocacion o como
+        ParámetrosFuncion
+        """
+
+        funcion = self.__expresion(nodo_actual.nodos[0])
+
+        argumentos = []
+        if len(nodo_actual.nodos) == 2:
+            argumentos = [self.__expresion(argumento)
+                          for argumento in nodo_actual.nodos[1].nodos]
+
+        return abarcar(ast.Call(funcion, argumentos, []), funcion,
+                       argumentos[-1] if argumentos else funcion)
+
+    def __visitar_expresion_condicional(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        ExpCondicional ::= Comparación(OperadorLogico Comparación)?
+        """
+
+        izquierda = self.__expresion(nodo_actual.nodos[0])
+        if len(nodo_actual.nodos) == 1:
+            return izquierda
+
+        derecha = self.__expresion(nodo_actual.nodos[2])
+        return abarcar(ast.BoolOp(
+            OPERADORES_LOGICOS[nodo_actual.nodos[1].contenido],
+            [izquierda, derecha]), izquierda, derecha)
+
+    def __visitar_comparacion(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        Comparación::= Valor Comparador Valor
+        """
+
+        izquierda = self.__expresion(nodo_actual.nodos[0])
+        derecha = self.__expresion(nodo_actual.nodos[2])
+        return abarcar(ast.Compare(
+            izquierda, [COMPARADORES[nodo_actual.nodos[1].contenido]],
+            [derecha]), izquierda, derecha)
+
+    def __visitar_booleano(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        Booleano::= SIUA|NOUA
+        """
+
+        contenido = nodo_actual.contenido
+        return self.__ubicar(ast.Constant(contenido == 'SIUA'), nodo_actual,
+                             len(contenido))
+
+    def __visitar_texto(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        Texto ::= ツ.*ツ
+
+        El valor es el del literal de python que se genera como texto
+        """
+
+        contenido = nodo_actual.contenido
+        return self.__ubicar(
+            ast.Constant(ast.literal_eval(contenido.replace('ツ', '"'))),
+            nodo_actual, len(contenido))
+
+    def __visitar_entero(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        Entero::= -?[0-9]+
+        """
+
+        contenido = nodo_actual.contenido
+        return self.__ubicar(ast.Constant(int(contenido)), nodo_actual,
+                             len(contenido))
+
+    def __visitar_flotante(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        Flotante::= -?[0-9]+;[0-9]+
+        """
+
+        contenido = nodo_actual.contenido
+        return self.__ubicar(ast.Constant(float(contenido.replace(';', '.'))),
+                             nodo_actual, len(contenido))
+
+    def __visitar_identificador(self, nodo_actual: Nodo) -> ast.expr:
+        """
+        Identificador ::= [a-z][a-zA-Z0-9]+
+        """
+
+        contenido = nodo_actual.contenido
+        return self.__ubicar(ast.Name(contenido, CARGAR), nodo_actual,
+                             len(contenido))
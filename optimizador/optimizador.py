@@ -0,0 +1,389 @@
+# Optimizaciones del árbol verificado antes de generar el código
+
+import operator
+from typing import Callable, Dict, List, Optional, Union
+
+from Utils.arbol import ArbolSintaxisAbstracta, Nodo, TipoNodo
+from Utils.recorrido import preorden, recorrer
+from Utils.tipo_datos import TipoDato
+
+# Niveles de optimización, cada uno incluye los anteriores
+PLEGAR_CONSTANTES = 1
+PODAR_RAMAS = 2
+
+# Operadores que se aplican antes que la suma y la resta en el código
+# generado, la expresión se escribe igual que en el fuente
+MULTIPLICATIVOS = frozenset({'bobTiplicar', 'bobiDir'})
+
+OPERACIONES = {
+    'bobMar': operator.add, 'bobStar': operator.sub,
+    'bobTiplicar': operator.mul
+}
+
+COMPARACIONES = {
+    'tapotente': operator.gt, 'chikito': operator.lt,
+    'panas': operator.eq, 'nolocrick': operator.ne,
+    'panachikito': operator.le, 'panapotente': operator.ge
+}
+
+def numero(nodo) -> Union[int, float, None]:
+    """
+    Valor de un literal numérico, None si el nodo no es uno
+    """
+
+    if nodo.tipo == TipoNodo.ENTERO:
+        return int(nodo.contenido)
+    if nodo.tipo == TipoNodo.FLOTANTE:
+        return float(nodo.contenido.replace(';', '.'))
+    return None
+
+
+def booleano(nodo) -> Optional[bool]:
+    """
+    Valor de un literal booleano, None si el nodo no es uno
+    """
+
+    if nodo.tipo == TipoNodo.BOOLEANO:
+        return nodo.contenido == 'SIUA'
+    return None
+
+
+def literal_entero(valor: int, origen) -> Nodo:
+    return Nodo(TipoNodo.ENTERO, str(valor),
+                atributos={'tipo': TipoDato.NUMERO},
+                linea=origen.linea, columna=origen.columna)
+
+
+def literal_booleano(valor: bool, origen) -> Nodo:
+    return Nodo(TipoNodo.BOOLEANO, 'SIUA' if valor else 'NOUA',
+                atributos={'tipo': TipoDato.BOOLEANO},
+                linea=origen.linea, columna=origen.columna)
+
+
+def condicion_constante(condicion) -> Optional[bool]:
+    """
+    Valor de una ExpCondicional que quedó reducida a un booleano
+    """
+
+    if len(condicion.nodos) == 1:
+        return booleano(condicion.nodos[0])
+    return None
+
+
+class Optimizador:
+    """
+    Construye un árbol optimizado a partir del árbol verificado, el
+    original no se modifica (puede venir de la caché o tener nodos
+    compartidos) y los subárboles que no cambian se reutilizan.
+
+    Con PLEGAR_CONSTANTES se calculan las operaciones entre literales
+    numéricos de las expresiones matemáticas, las comparaciones entre
+    literales y las ExpCondicional con algún lado conocido. Con
+    PODAR_RAMAS además se eliminan las ramas de siuuu/nimodo y los
+    whenCuando cuya condición se conoce, y lo que sigue a un messirve,
+    sin cambiar qué variables son locales de cada función
+    """
+
+    arbol: ArbolSintaxisAbstracta
+    nivel: int
+    plegadas: int
+    podadas: int
+    dic_tipos_nodo: Dict[TipoNodo, Callable]
+
+    def __init__(self, arbol: ArbolSintaxisAbstracta,
+                 nivel: int = PLEGAR_CONSTANTES):
+        self.arbol = arbol
+        self.nivel = nivel
+        self.plegadas = 0
+        self.podadas = 0
+
+        self.dic_tipos_nodo = {}
+
+        if nivel >= PLEGAR_CONSTANTES:
+            self.dic_tipos_nodo.update({
+                TipoNodo.EXPRESION_MATEMATICA: self.__plegar_expresion_matematica,
+                TipoNodo.COMPARACION: self.__plegar_comparacion,
+                TipoNodo.EXPRESION_CONDICIONAL: self.__plegar_expresion_condicional
+            })
+
+        if nivel >= PODAR_RAMAS:
+            self.dic_tipos_nodo.update({
+                TipoNodo.CONDICIONAL: self.__podar_condicional,
+                TipoNodo.REPETIR: self.__podar_repetir,
+                TipoNodo.INSTRUCCION: self.__podar_instruccion,
+                TipoNodo.CONJUNTO_INSTRUCCIONES: self.__podar_conjunto_instrucciones,
+                TipoNodo.FUNCION: self.__conservar_locales,
+                TipoNodo.PRINCIPAL: self.__conservar_locales
+            })
+
+    def optimizar(self) -> ArbolSintaxisAbstracta:
+        """
+        Retorna el árbol optimizado
+        """
+
+        optimizado = ArbolSintaxisAbstracta()
+        optimizado.raiz = self.arbol.raiz
+
+        if self.arbol.raiz is not None and self.dic_tipos_nodo:
+            optimizado.raiz = recorrer(self.arbol.raiz, None, self.__salir)
+
+        return optimizado
+
+    def __salir(self, nodo, hijos: List):
+        """
+        Retorna lo que reemplaza al nodo con sus hijos ya optimizados,
+        las instrucciones podadas se reemplazan por una lista con las
+        instrucciones que quedan en su lugar
+        """
+
+        optimizar = self.dic_tipos_nodo.get(nodo.tipo)
+        if optimizar is not None:
+            return optimizar(nodo, hijos)
+
+        return self.__reconstruir(nodo, hijos)
+
+    def __reconstruir(self, nodo, hijos: List):
+        """
+        Si los hijos no cambiaron se conserva el nodo original
+        """
+
+        if len(hijos) == len(nodo.nodos) and \
+                all(hijo is original
+                    for hijo, original in zip(hijos, nodo.nodos)):
+            return nodo
+
+        return Nodo(nodo.tipo, nodo.contenido, list(hijos) or (),
+                    dict(nodo.iterar_atributos()) or None,
+                    nodo.linea, nodo.columna)
+
+    def __plegar_expresion_matematica(self, nodo, hijos: List):
+        """
+        ExpresionMatematica::= #Valor (Operador Valor)*#
+
+        El código generado aplica bobTiplicar y bobiDir antes que bobMar
+        y bobStar, y cada grupo de izquierda a derecha. Sólo se calculan
+        los literales al inicio de cada término y los términos literales
+        al inicio de la suma, así no se reordena ninguna operación. El
+        verificador sólo acepta literales enteros en la expresión, así
+        que los resultados siempre son enteros
+        """
+
+        terminos = [[hijos[0]]]
+        aditivos = []
+        for operador, operando in zip(hijos[1::2], hijos[2::2]):
+            if operador.contenido in MULTIPLICATIVOS:
+                terminos[-1] += [operador, operando]
+            else:
+                aditivos.append(operador)
+                terminos.append([operando])
+
+        for termino in terminos:
+            self.__plegar_prefijo(termino)
+
+        suma = [terminos[0]]
+        for operador, termino in zip(aditivos, terminos[1:]):
+            if len(suma) == 1 and len(suma[0]) == 1 and len(termino) == 1:
+                resultado = self.__operar(suma[0][0], operador, termino[0])
+                if resultado is not None:
+                    suma[0] = [resultado]
+                    continue
+
+            suma += [[operador], termino]
+
+        nodos = [elemento for termino in suma for elemento in termino]
+
+        # Un único literal reemplaza la expresión en la asignación
+        if len(nodos) == 1 and len(hijos) > 1:
+            return nodos[0]
+
+        return self.__reconstruir(nodo, nodos)
+
+    def __plegar_prefijo(self, elementos: List) -> None:
+        """
+        Calcula de izquierda a derecha las operaciones entre literales
+        al inicio de `elementos` (Valor (Operador Valor)*)
+        """
+
+        while len(elementos) >= 3:
+            resultado = self.__operar(*elementos[:3])
+            if resultado is None:
+                return
+            elementos[:3] = [resultado]
+
+    def __operar(self, izquierda, operador, derecha) -> Optional[Nodo]:
+        """
+        Literal con el resultado de la operación, None si no se calcula
+        (no son literales enteros o es una división)
+        """
+
+        # bobiDir se genera como `/` y da un flotante, que no es un
+        # literal de la expresión. También mantiene el error de la
+        # división por cero para cuando se ejecute
+        if izquierda.tipo != TipoNodo.ENTERO or \
+                derecha.tipo != TipoNodo.ENTERO or \
+                operador.contenido not in OPERACIONES:
+            return None
+
+        valor = OPERACIONES[operador.contenido](numero(izquierda),
+                                                numero(derecha))
+
+        self.plegadas += 1
+        return literal_entero(valor, izquierda)
+
+    def __plegar_comparacion(self, nodo, hijos: List):
+        """
+        Comparación::= Valor Comparador Valor
+
+        Una comparación entre dos literales numéricos o dos booleanos se
+        reemplaza por el booleano con su resultado
+        """
+
+        izquierda, comparador, derecha = hijos
+        comparar = COMPARACIONES.get(comparador.contenido)
+
+        valores = numero(izquierda), numero(derecha)
+        if None in valores:
+            valores = booleano(izquierda), booleano(derecha)
+
+        if comparar is None or None in valores:
+            return self.__reconstruir(nodo, hijos)
+
+        self.plegadas += 1
+        return literal_booleano(comparar(*valores), izquierda)
+
+    def __plegar_expresion_condicional(self, nodo, hijos: List):
+        """
+        ExpCondicional ::= Comparación(OperadorLogico Comparación)?
+
+        Las comparaciones no tienen efectos, con un lado conocido el
+        resultado es ese lado o el otro
+        """
+
+        if len(hijos) == 3:
+            izquierda, operador, derecha = hijos
+            aja = operador.contenido == 'aja'
+
+            for conocido, otro in ((izquierda, derecha), (derecha, izquierda)):
+                valor = booleano(conocido)
+                if valor is None:
+                    continue
+
+                # aja con NOUA y ayno con SIUA ya tienen su resultado
+                self.plegadas += 1
+                resultado = otro if valor == aja else conocido
+                return self.__reconstruir(nodo, [resultado])
+
+        return self.__reconstruir(nodo, hijos)
+
+    def __podar_condicional(self, nodo, hijos: List):
+        """
+        Condicional::= Siuuu Nimodo?
+
+        Con la condición conocida queda sólo la rama que se ejecuta,
+        sus instrucciones toman el lugar del condicional
+        """
+
+        siuuu = hijos[0]
+        valor = condicion_constante(siuuu.nodos[0])
+        if valor is None:
+            return self.__reconstruir(nodo, hijos)
+
+        self.podadas += 1
+        if valor:
+            return list(siuuu.nodos[1].nodos)
+        if len(hijos) == 2:
+            return list(hijos[1].nodos[0].nodos)
+        return []
+
+    def __podar_repetir(self, nodo, hijos: List):
+        """
+        Repetir ::= whenCuando xD ConjuntoInstrucciones but (ExpCondicional) v:
+
+        El ciclo se genera como un while, con la condición en NOUA nunca
+        ejecuta su cuerpo
+        """
+
+        if condicion_constante(hijos[1]) is False:
+            self.podadas += 1
+            return []
+
+        return self.__reconstruir(nodo, hijos)
+
+    def __podar_instruccion(self, nodo, hijos: List):
+        """
+        Una instrucción podada se reemplaza por las que quedan en su lugar
+        """
+
+        if hijos and isinstance(hijos[-1], list):
+            return hijos[-1]
+
+        return self.__reconstruir(nodo, hijos)
+
+    def __podar_conjunto_instrucciones(self, nodo, hijos: List):
+        """
+        ConjuntoInstrucciones ::= Instruccion+
+
+        Agrega las instrucciones de las ramas podadas y elimina lo que
+        sigue a un messirve, el conjunto puede quedar vacío
+        """
+
+        instrucciones = []
+        for hijo in hijos:
+            if isinstance(hijo, list):
+                instrucciones += hijo
+            else:
+                instrucciones.append(hijo)
+
+        for posicion, instruccion in enumerate(instrucciones):
+            if instruccion.nodos and \
+                    instruccion.nodos[-1].tipo == TipoNodo.RETORNO:
+                if posicion + 1 < len(instrucciones):
+                    self.podadas += 1
+                    del instrucciones[posicion + 1:]
+                break
+
+        return self.__reconstruir(nodo, instrucciones)
+
+    def __conservar_locales(self, nodo, hijos: List):
+        """
+        Función ::= POV Identificador(Parámetros?) xD ConjuntoInstrucciones v:
+
+        En python una variable asignada en cualquier parte de la función
+        es local aunque la asignación nunca se ejecute. Si se podaron
+        todas las asignaciones de una variable, la primera se conserva
+        en un siuuu con la condición en NOUA al inicio de la función,
+        así la variable sigue siendo local y el programa falla igual que
+        sin optimizar
+        """
+
+        conjunto = hijos[-1]
+
+        quedan = {instruccion.nodos[0].contenido
+                  for instruccion in preorden(conjunto)
+                  if instruccion.tipo == TipoNodo.ASIGNACION}
+        if nodo.tipo == TipoNodo.FUNCION and \
+                hijos[1].tipo == TipoNodo.PARAMETROS_FUNCION:
+            quedan.update(parametro.contenido for parametro in hijos[1].nodos)
+
+        podadas = {}
+        for original in preorden(nodo.nodos[-1]):
+            if original.tipo == TipoNodo.ASIGNACION and \
+                    original.nodos[0].contenido not in quedan:
+                podadas.setdefault(original.nodos[0].contenido, original)
+
+        if not podadas:
+            return self.__reconstruir(nodo, hijos)
+
+        primera = next(iter(podadas.values()))
+        condicion = Nodo(TipoNodo.EXPRESION_CONDICIONAL,
+                         nodos=[literal_booleano(False, primera)])
+        bloque = Nodo(TipoNodo.CONJUNTO_INSTRUCCIONES,
+                      nodos=[Nodo(TipoNodo.INSTRUCCION, nodos=[asignacion])
+                             for asignacion in podadas.values()])
+        condicional = Nodo(TipoNodo.CONDICIONAL, nodos=[
+            Nodo(TipoNodo.SIUUU, nodos=[condicion, bloque])])
+
+        conjunto = self.__reconstruir(
+            conjunto, [Nodo(TipoNodo.INSTRUCCION, nodos=[condicional]),
+                       *conjunto.nodos])
+        return self.__reconstruir(nodo, [*hijos[:-1], conjunto])
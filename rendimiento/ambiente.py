@@ -0,0 +1,103 @@
+# Benchmark del ambiente estándar compartido
+#
+# Simula el uso por lotes: verifica `--compilaciones` veces un programa
+# pequeño y compara crear en cada compilación la tabla de símbolos sobre
+# el ambiente estándar ya construido contra volver a crear los nodos y
+# registros de las funciones estándar (lo que se hacía antes), y contra
+# leer el manifiesto cada vez. Revisa que la tabla resultante sea igual.
+#
+#   $ python3 -m rendimiento.ambiente [--compilaciones 10000]
+
+import time
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arbol import Nodo, TipoNodo
+from Verificador.estandar import (MANIFIESTO_ESTANDAR, AmbienteEstandar,
+                                  ambiente_estandar, leer_manifiesto)
+from Verificador.verificador import TablaSimbolos, Verificador
+
+PROGRAMA = '''POV largo (texto) xD
+    cantidad anotado jutsu nel(texto).
+    messirve cantidad.
+v:
+
+maracuya() xD
+    texto anotado ツholaツ.
+    n anotado jutsu largo(texto).
+    messirve n.
+v:
+'''
+
+
+def tabla_reconstruida() -> TablaSimbolos:
+    """
+    Tabla con un registro nuevo por función estándar, como se creaba
+    en cada compilación
+    """
+
+    tabla = TablaSimbolos()
+    for funcion in ambiente_estandar().funciones.values():
+        nodo = Nodo(TipoNodo.FUNCION, contenido=funcion.nombre,
+                    atributos={'tipo': funcion.tipo})
+        tabla.nuevo_registro(nodo)
+    return tabla
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark del ambiente estándar '
+                                        'compartido')
+    parser.add_argument('--compilaciones', type=int, default=10000,
+                        help='Cantidad de veces que se verifica el programa')
+    args = parser.parse_args()
+
+    explorador = Explorador(PROGRAMA)
+    explorador.explorar()
+    componentes = list(explorador.componentes)
+
+    def arbol():
+        analizador = Analizador(iter(componentes))
+        analizador.analizar()
+        return analizador.ast
+
+    arboles = [arbol() for _ in range(args.compilaciones)]
+
+    casos = [
+        ('compartido', lambda: TablaSimbolos(ambiente_estandar())),
+        ('reconstruido', tabla_reconstruida),
+        ('manifiesto', lambda: TablaSimbolos(AmbienteEstandar(
+            leer_manifiesto(MANIFIESTO_ESTANDAR)))),
+    ]
+
+    print(f'{args.compilaciones:,} compilaciones')
+    tiempo_compartido = None
+
+    for nombre, crear_tabla in casos:
+        inicio = time.perf_counter()
+        for _ in range(args.compilaciones):
+            crear_tabla()
+        tiempo_tabla = time.perf_counter() - inicio
+
+        linea = f'{nombre:14} tabla {tiempo_tabla * 1000:8.1f} ms'
+        if tiempo_compartido is None:
+            tiempo_compartido = tiempo_tabla
+        else:
+            linea += f' {tiempo_tabla / tiempo_compartido:7.1f}x más lento'
+        print(linea)
+
+    # Verificación completa, la tabla impresa es la misma de antes
+    inicio = time.perf_counter()
+    for arbol_programa in arboles:
+        tabla = Verificador(arbol_programa).verificar()
+    tiempo = time.perf_counter() - inicio
+
+    esperada = tabla_reconstruida()
+    for registro in tabla.simbolos:
+        esperada.simbolos.append(registro)
+    print(f'{"verificar":14} total {tiempo * 1000:8.1f} ms '
+          f'{"misma tabla" if str(tabla) == str(esperada) else "DISTINTA"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# Benchmark del analizador
+#
+# Mide los componentes por segundo del analizador LL(1) dirigido por
+# tablas sobre un programa que repite las funciones de
+# carrera_caracoles.cm y los compara con los del validador (--validar),
+# que reconoce el programa con las mismas tablas sin construir el árbol.
+#
+#   $ python3 -m rendimiento.analizador [--escala 500]
+
+import gc
+import os
+import time
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Analizador.validador import Validador
+from Explorador.explorador import Explorador
+
+RUTA_EJEMPLO = os.path.join(os.path.dirname(__file__),
+                            '..', 'docs', 'ejemplos', 'carrera_caracoles.cm')
+
+
+def generar_programa(escala: int) -> str:
+    """
+    Repite `escala` veces las funciones del ejemplo y agrega
+    la función principal al final
+    """
+
+    with open(RUTA_EJEMPLO, 'r', encoding='utf-8') as archivo:
+        texto = archivo.read()
+
+    inicio_principal = texto.index('maracuya')
+    funciones = texto[:inicio_principal].rstrip('\n') + '\n'
+
+    return funciones * escala + texto[inicio_principal:]
+
+
+def medir(componentes, repeticiones: int = 3) -> float:
+    """
+    Analiza los componentes y retorna los componentes por segundo de
+    la mejor repetición
+
+    El recolector de basura se desactiva mientras se mide, si no cada
+    repetición paga las revisiones de los nodos de la anterior
+    """
+
+    mejor = float('inf')
+
+    for _ in range(repeticiones):
+        analizador = Analizador(componentes)
+
+        gc.collect()
+        gc.disable()
+        inicio = time.perf_counter()
+        analizador.analizar()
+        mejor = min(mejor, time.perf_counter() - inicio)
+        gc.enable()
+
+    return len(componentes) / mejor
+
+
+def medir_validador(componentes, repeticiones: int = 3) -> float:
+    """
+    Retorna los componentes por segundo de la mejor repetición
+    del validador
+    """
+
+    mejor = float('inf')
+
+    for _ in range(repeticiones):
+        validador = Validador(componentes)
+
+        inicio = time.perf_counter()
+        validador.validar()
+        mejor = min(mejor, time.perf_counter() - inicio)
+
+    return len(componentes) / mejor
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark del analizador')
+    parser.add_argument('--escala', type=int, default=500,
+                        help='Cantidad de veces que se repiten las funciones')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.escala))
+    explorador.explorar()
+    componentes = list(explorador.componentes)
+
+    analizador = medir(componentes)
+    validador = medir_validador(explorador.componentes)
+
+    print(f'{len(componentes):,} componentes')
+    print(f'{"analizador":15} {analizador:15,.0f} componentes/s')
+    print(f'{"validador":15} {validador:15,.0f} componentes/s')
+    print(f'{"aceleración":15} {validador / analizador:15.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# Benchmark de programas con bloques profundamente anidados
+#
+# Genera un programa con `--niveles` bloques whenCuando/siuuu anidados
+# dentro de maracuya y mide el análisis, la verificación, la impresión
+# del árbol (hacia /dev/null) y la generación del código de python.
+#
+#   $ python3 -m rendimiento.anidamiento [--niveles 10000]
+
+import contextlib
+import os
+import time
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.generador import Generador
+from Verificador.verificador import Verificador
+
+
+def generar_programa(niveles: int) -> str:
+    """
+    Genera un programa con `niveles` bloques anidados, alternando
+    ciclos y condicionales
+    """
+
+    lineas = ['maracuya() xD', 'i anotado 0.']
+
+    for nivel in range(niveles):
+        if nivel % 2 == 0:
+            lineas.append('whenCuando xD')
+        else:
+            lineas.append('siuuu (i chikito 10) xD')
+        lineas.append('i anotado #i bobMar 1#.')
+
+    for nivel in reversed(range(niveles)):
+        if nivel % 2 == 0:
+            lineas.append('but (i chikito 10) v:')
+        else:
+            lineas.append('v:')
+
+    lineas += ['messirve i.', 'v:']
+    return '\n'.join(lineas) + '\n'
+
+
+def medir(descripcion: str, funcion):
+    """
+    Imprime el tiempo que tomó `funcion` y retorna su resultado
+    """
+
+    inicio = time.perf_counter()
+    resultado = funcion()
+    print(f'{descripcion:12} {time.perf_counter() - inicio:8.3f} s')
+    return resultado
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de anidamiento profundo')
+    parser.add_argument('--niveles', type=int, default=10000,
+                        help='Cantidad de bloques anidados')
+    args = parser.parse_args()
+
+    texto = generar_programa(args.niveles)
+    print(f'{args.niveles} niveles de anidamiento')
+
+    explorador = Explorador(texto)
+    medir('explorar', explorador.explorar)
+
+    analizador = Analizador(explorador.componentes)
+    medir('analizar', analizador.analizar)
+
+    verificador = Verificador(analizador.ast)
+    medir('verificar', verificador.verificar)
+
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        inicio = time.perf_counter()
+        verificador.imprimir_ast()
+        duracion = time.perf_counter() - inicio
+    print(f'{"imprimir":12} {duracion:8.3f} s')
+
+    codigo = medir('generar', Generador(analizador.ast).generar_codigo)
+    print(f'{"lineas":12} {codigo.count(chr(10)):8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+# Benchmark del árbol en arena
+#
+# Analiza un programa de aproximadamente `--nodos` nodos y compara el
+# árbol de Nodo contra el mismo árbol guardado en una ArenaNodos:
+# memoria por nodo, tiempo de un recorrido en preorden y tiempo de
+# serializar y reconstruir la arena como bytes. También revisa que el
+# verificador produzca los mismos tipos sobre ambos árboles.
+#
+#   $ python3 -m rendimiento.arena [--nodos 100000]
+
+import gc
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arena import ArbolArena, ArenaNodos, NodoArena
+from Verificador.verificador import Verificador
+from rendimiento.nodos import contar_nodos, generar_programa
+
+
+def analizar(componentes) -> Analizador:
+    analizador = Analizador(componentes)
+    analizador.analizar()
+    return analizador
+
+
+def medir_memoria(construir) -> tuple:
+    """
+    Bytes que quedan ocupados después de llamar a `construir`
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado = construir()
+    memoria = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+
+    return memoria, resultado
+
+
+def medir_tiempo(funcion, repeticiones: int = 3) -> float:
+    """
+    Mejor tiempo de `repeticiones` llamadas a `funcion`
+    """
+
+    mejor = float('inf')
+
+    for _ in range(repeticiones):
+        gc.collect()
+        gc.disable()
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+        gc.enable()
+
+    return mejor
+
+
+def recorrer_nodos(raiz) -> int:
+    """
+    Preorden con pila sobre los nodos enlazados, suma las líneas
+    para que el recorrido lea algún campo
+    """
+
+    total = 0
+    pendientes = [raiz]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        total += nodo.linea or 0
+        pendientes.extend(reversed(nodo.nodos))
+
+    return total
+
+
+def recorrer_arena(arena: ArenaNodos) -> int:
+    """
+    Preorden de la arena, es un ciclo sobre los índices
+    """
+
+    total = 0
+    lineas = arena.lineas
+
+    for indice in range(len(arena)):
+        total += lineas[indice]
+
+    return total
+
+
+def tipos_verificados(raiz) -> list:
+    """
+    Tipos que el verificador asignó a cada nodo, en preorden
+    """
+
+    tipos = []
+    pendientes = [raiz]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        tipos.append(dict(nodo.iterar_atributos()).get('tipo'))
+        pendientes.extend(reversed(nodo.nodos))
+
+    return tipos
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark del árbol en arena')
+    parser.add_argument('--nodos', type=int, default=100000,
+                        help='Cantidad aproximada de nodos del árbol')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.nodos))
+    explorador.explorar()
+    componentes = list(explorador.componentes)
+
+    memoria_nodos, analizador = medir_memoria(lambda: analizar(componentes))
+    raiz = analizador.ast.raiz
+    cantidad = contar_nodos(raiz)
+
+    memoria_arena, arena = medir_memoria(
+        lambda: ArenaNodos.desde_nodo(raiz))
+
+    tiempo_nodos = medir_tiempo(lambda: recorrer_nodos(raiz))
+    tiempo_arena = medir_tiempo(lambda: recorrer_arena(arena))
+    assert recorrer_nodos(raiz) == recorrer_arena(arena)
+
+    datos = arena.a_bytes()
+    tiempo_bytes = medir_tiempo(arena.a_bytes)
+    tiempo_reconstruir = medir_tiempo(lambda: ArenaNodos.desde_bytes(datos))
+
+    # El verificador recorre la arena por medio de NodoArena
+    Verificador(analizador.ast).verificar()
+    arbol_arena = ArbolArena(ArenaNodos.desde_nodo(analizar(componentes)
+                                                   .ast.raiz))
+    Verificador(arbol_arena).verificar()
+    mismos_tipos = tipos_verificados(raiz) == \
+        tipos_verificados(NodoArena(arbol_arena.arena, 0))
+
+    print(f'{cantidad:,} nodos')
+    print(f'{"":15} {"memoria":>12} {"por nodo":>10} {"preorden":>12}')
+    print(f'{"nodos":15} {memoria_nodos / 2**20:8.1f} MiB '
+          f'{memoria_nodos / cantidad:8.0f} B {tiempo_nodos:10.4f} s')
+    print(f'{"arena":15} {memoria_arena / 2**20:8.1f} MiB '
+          f'{memoria_arena / cantidad:8.0f} B {tiempo_arena:10.4f} s')
+    print(f'{"mejora":15} {memoria_nodos / memoria_arena:10.2f}x '
+          f'{"":10} {tiempo_nodos / tiempo_arena:11.2f}x')
+    print(f'{"bytes":15} {len(datos) / 2**20:8.1f} MiB '
+          f'{"a_bytes":>10} {tiempo_bytes:8.4f} s '
+          f'desde_bytes {tiempo_reconstruir:.4f} s')
+    print(f'{"mismos tipos":15} {"sí" if mismos_tipos else "no"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# Benchmark de la caché de artefactos
+#
+# Genera `--archivos` programas (las funciones de carrera_caracoles.cm
+# repetidas `--escala` veces) en un directorio temporal y ejecuta
+# cmamuth.py sobre cada uno tres veces: sin caché, con la caché vacía y
+# con la caché ya llena, como en una recompilación sin cambios. Mide el
+# tiempo total de reloj de cada ronda y revisa que la salida sea la misma.
+#
+#   $ python3 -m rendimiento.cache [--archivos 10] [--escala 100] [--modo=-g]
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+
+from rendimiento.analizador import generar_programa
+
+RUTA_CMAMUTH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            '..', 'cmamuth.py')
+
+
+def compilar(rutas: list, modo: str, directorio: str,
+             opciones: tuple = ()) -> tuple:
+    """
+    Ejecuta cmamuth.py sobre cada archivo desde `directorio`, con
+    `--cache` la caché queda junto a los archivos. Retorna el tiempo
+    total y las salidas
+    """
+
+    salidas = []
+    inicio = time.perf_counter()
+
+    for ruta in rutas:
+        proceso = subprocess.run(
+            [sys.executable, RUTA_CMAMUTH, modo, *opciones, ruta],
+            cwd=directorio, capture_output=True, text=True)
+        salidas.append(proceso.stdout + proceso.stderr)
+
+    return time.perf_counter() - inicio, salidas
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de la caché')
+    parser.add_argument('--archivos', type=int, default=10,
+                        help='Cantidad de archivos que se compilan')
+    parser.add_argument('--escala', type=int, default=100,
+                        help='Cantidad de veces que se repiten las funciones')
+    parser.add_argument('--modo', default='-g',
+                        help='Etapa que se ejecuta (-e, -a, -v o -g)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = []
+        for numero in range(args.archivos):
+            ruta = os.path.join(directorio, f'programa_{numero}.cm')
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                # Un comentario distinto para que cada archivo tenga su clave
+                archivo.write(f'muchoTexto: programa {numero}\n')
+                archivo.write(generar_programa(args.escala))
+            rutas.append(ruta)
+
+        sin_cache, esperadas = compilar(rutas, args.modo, directorio)
+        fria, salidas_fria = compilar(rutas, args.modo, directorio,
+                                      ('--cache',))
+        caliente, salidas_caliente = compilar(rutas, args.modo, directorio,
+                                              ('--cache',))
+
+        tamano = sum(entrada.stat().st_size for entrada in
+                     os.scandir(os.path.join(directorio, '.cmcache')))
+
+    print(f'{args.archivos} archivos, modo {args.modo}')
+    print(f'{"sin caché":15} {sin_cache:10.3f} s')
+    print(f'{"caché vacía":15} {fria:10.3f} s')
+    print(f'{"caché llena":15} {caliente:10.3f} s')
+    print(f'{"aceleración":15} {sin_cache / caliente:11.2f}x')
+    print(f'{"tamaño caché":15} {tamano / 2**20:10.1f} MiB')
+    print(f'{"misma salida":15} '
+          f'{"sí" if esperadas == salidas_fria == salidas_caliente else "no"}')
+
+
+if __name__ == '__main__':
+    main()
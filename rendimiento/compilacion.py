@@ -0,0 +1,95 @@
+# Benchmark de la compilación a objetos de código
+#
+# Genera un programa con `--funciones` funciones y compara el tiempo de
+# generar el texto y compilarlo con compile() contra generar los nodos
+# de `ast` y compilarlos directamente, y contra cargar el objeto de
+# código ya guardado como .pyc. Revisa que los dos objetos de código
+# tengan el mismo bytecode.
+#
+# Armar los nodos de `ast` en python tarda más que unir el texto, y
+# compile() de los nodos sólo ahorra el análisis del texto, que hace C.
+# Por eso --pyc y --ejecutar compilan el texto y los nodos sólo se usan
+# con --posiciones, para que los errores muestren las líneas del .cm.
+#
+#   $ python3 -m rendimiento.compilacion [--funciones 1000]
+
+import time
+from argparse import ArgumentParser
+from types import CodeType
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.bytecode import a_bytes, desde_bytes
+from Generador.generador import Generador
+from Verificador.verificador import Verificador
+from rendimiento.emision import generar_programa
+
+
+def firma(codigo: CodeType) -> tuple:
+    """
+    Bytecode, nombres y constantes del objeto de código y de los que
+    contiene, sin las posiciones
+    """
+
+    return (codigo.co_name, codigo.co_code, codigo.co_names,
+            codigo.co_varnames,
+            tuple(firma(constante) if isinstance(constante, CodeType)
+                  else (type(constante), constante)
+                  for constante in codigo.co_consts))
+
+
+def medir(funcion) -> tuple:
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de la compilación a '
+                                        'objetos de código')
+    parser.add_argument('--funciones', type=int, default=1000,
+                        help='Cantidad de funciones del programa')
+    parser.add_argument('--instrucciones', type=int, default=20,
+                        help='Ciclos en el cuerpo de cada función')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.funciones,
+                                             args.instrucciones))
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    arbol = analizador.ast
+    Verificador(arbol).verificar()
+    generador = Generador(arbol)
+
+    texto, tiempo_generar = medir(generador.generar_codigo)
+    por_texto, tiempo_compilar = medir(
+        lambda: compile(texto, '<cmamuth>', 'exec'))
+
+    modulo, tiempo_ast = medir(generador.generar_modulo)
+    por_ast, tiempo_compilar_ast = medir(
+        lambda: compile(modulo, '<cmamuth>', 'exec'))
+
+    datos = a_bytes(por_ast)
+    _, tiempo_cargar = medir(lambda: desde_bytes(datos))
+
+    total_texto = tiempo_generar + tiempo_compilar
+    total_ast = tiempo_ast + tiempo_compilar_ast
+
+    print(f'{args.funciones:,} funciones')
+    print(f'{"texto":8} generar {tiempo_generar * 1000:8.1f} ms '
+          f'compilar {tiempo_compilar * 1000:8.1f} ms '
+          f'total {total_texto * 1000:8.1f} ms')
+    print(f'{"ast":8} generar {tiempo_ast * 1000:8.1f} ms '
+          f'compilar {tiempo_compilar_ast * 1000:8.1f} ms '
+          f'total {total_ast * 1000:8.1f} ms '
+          f'{total_texto / total_ast:5.1f}x')
+    print(f'{"pyc":8} cargar  {tiempo_cargar * 1000:8.1f} ms '
+          f'{"":30}{total_texto / tiempo_cargar:5.1f}x '
+          f'({len(datos) / 2**20:.1f} MiB)')
+    print(f'{"bytecode":8} '
+          f'{"mismo" if firma(por_texto) == firma(por_ast) else "DISTINTO"}')
+
+
+if __name__ == '__main__':
+    main()
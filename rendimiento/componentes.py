@@ -0,0 +1,63 @@
+# Comparación de memoria entre una lista de ComponenteLexico y el
+# BufferComponentes sobre un archivo de alrededor de un millón de
+# componentes léxicos.
+#
+#   $ python3 -m rendimiento.componentes [--componentes 1000000]
+
+import gc
+import os
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+from Explorador.explorador import Explorador
+
+RUTA_EJEMPLO = os.path.join(os.path.dirname(__file__),
+                            '..', 'docs', 'ejemplos', 'fibonacci.cm')
+
+
+def medir(descripcion: str, construir) -> None:
+    """
+    Imprime la memoria retenida por el resultado de `construir`
+    y el tiempo que tomó construirlo
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+
+    resultado = construir()
+
+    duracion = time.perf_counter() - inicio
+    retenida, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{descripcion:25} {len(resultado):10,} componentes ' +
+          f'{retenida / 2**20:10.1f} MiB {duracion:8.2f} s')
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Memoria de los componentes léxicos')
+    parser.add_argument('--componentes', type=int, default=1_000_000,
+                        help='Cantidad aproximada de componentes del archivo')
+    args = parser.parse_args()
+
+    with open(RUTA_EJEMPLO, 'r', encoding='utf-8') as archivo:
+        ejemplo = archivo.read().rstrip('\n') + '\n'
+
+    por_copia = sum(1 for _ in Explorador(ejemplo).iterar_componentes())
+    texto = ejemplo * max(1, args.componentes // por_copia)
+
+    medir('List[ComponenteLexico]',
+          lambda: list(Explorador(texto).iterar_componentes()))
+
+    def construir_buffer():
+        explorador = Explorador(texto)
+        explorador.explorar()
+        return explorador.componentes
+
+    medir('BufferComponentes', construir_buffer)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# Benchmark de --ejecutar
+#
+# Genera un programa con `--funciones` funciones que la principal
+# invoca y compara el tiempo de reloj de ejecutarlo en dos pasos
+# (`cmamuth.py -g -o programa.py` y `python3 programa.py`, dos procesos)
+# contra `cmamuth.py --ejecutar`, con la caché vacía y con la caché ya
+# llena, donde se carga el objeto de código sin compilar. La generación
+# usa `--cache`, `--ejecutar` siempre guarda su objeto de código. Cada
+# forma usa su propio directorio y su propia caché. El código generado
+# importa la librería estándar, `Lib` tiene que poder importarse.
+#
+#   $ python3 -m rendimiento.ejecucion [--funciones 500] [--repeticiones 5]
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+
+RUTA_CMAMUTH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            '..', 'cmamuth.py')
+
+
+def generar_programa(funciones: int) -> str:
+    """
+    Funciones con un ciclo corto, todas invocadas desde la principal
+    para que ninguna se elimine
+    """
+
+    lineas = []
+
+    for funcion in range(funciones):
+        lineas += [f'POV f{funcion} (a) xD',
+                   'i anotado 0.',
+                   'whenCuando xD',
+                   'i anotado #i bobMar 1#.',
+                   'but (i chikito 10) v:',
+                   'i anotado #a bobMar i#.',
+                   'messirve i.',
+                   'v:']
+
+    lineas += ['maracuya() xD', 'r anotado 0.']
+    for funcion in range(funciones):
+        lineas.append(f'r anotado jutsu f{funcion}(r).')
+    lineas += ['messirve r.', 'v:']
+
+    return '\n'.join(lineas) + '\n'
+
+
+def ejecutar(comandos: list, directorio: str) -> float:
+    """
+    Ejecuta los comandos en orden desde `directorio`, donde queda la
+    caché. Retorna el tiempo total
+    """
+
+    inicio = time.perf_counter()
+    for comando in comandos:
+        subprocess.run([sys.executable, *comando], cwd=directorio,
+                       capture_output=True, check=True)
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de --ejecutar')
+    parser.add_argument('--funciones', type=int, default=500,
+                        help='Cantidad de funciones del programa')
+    parser.add_argument('--repeticiones', type=int, default=5,
+                        help='Ejecuciones con la caché llena')
+    args = parser.parse_args()
+
+    dos_pasos = [[RUTA_CMAMUTH, '--cache', '-g', '-o', 'programa.py',
+                  'programa.cm'],
+                 ['programa.py']]
+    en_proceso = [[RUTA_CMAMUTH, '--ejecutar', 'programa.cm']]
+
+    resultados = []
+    for nombre, comandos in (('dos procesos', dos_pasos),
+                             ('--ejecutar', en_proceso)):
+        with tempfile.TemporaryDirectory() as directorio:
+            with open(os.path.join(directorio, 'programa.cm'), 'w',
+                      encoding='utf-8') as archivo:
+                archivo.write(generar_programa(args.funciones))
+
+            fria = ejecutar(comandos, directorio)
+            llena = sum(ejecutar(comandos, directorio)
+                        for _ in range(args.repeticiones))
+            resultados.append((nombre, fria, llena / args.repeticiones))
+
+    print(f'{args.funciones:,} funciones')
+    _, _, base = resultados[0]
+    for nombre, fria, llena in resultados:
+        print(f'{nombre:14} caché vacía {fria * 1000:8.1f} ms '
+              f'caché llena {llena * 1000:8.1f} ms {base / llena:5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
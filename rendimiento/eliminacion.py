@@ -0,0 +1,98 @@
+# Benchmark de la eliminación de funciones no alcanzables
+#
+# Genera un programa con un preludio de `--funciones` funciones y
+# asignaciones globales del que la principal sólo usa unas pocas, y
+# compara el tamaño del código generado y el tiempo de cargarlo (compilar
+# y ejecutar el módulo, como al importarlo) con y sin la eliminación.
+#
+#   $ python3 -m rendimiento.eliminacion [--funciones 5000] [--usadas 10]
+
+import time
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.generador import Generador
+from Verificador.verificador import Verificador
+
+
+def generar_programa(funciones: int, usadas: int) -> str:
+    """
+    Cada función del preludio lee su global e invoca a la anterior, la
+    principal invoca a las primeras `usadas`
+    """
+
+    lineas = []
+
+    for funcion in range(funciones):
+        lineas.append(f'g{funcion} anotado {funcion}.')
+        lineas.append(f'POV f{funcion} (a) xD')
+        lineas.append(f'i anotado #a bobMar g{funcion}#.')
+        if funcion > 0:
+            lineas.append(f'i anotado jutsu f{funcion - 1}(i).')
+        lineas += ['messirve i.', 'v:']
+
+    lineas += ['maracuya() xD', 'total anotado 0.']
+    for funcion in range(min(usadas, funciones)):
+        lineas.append(f'total anotado jutsu f{funcion}(total).')
+    lineas += ['messirve total.', 'v:']
+
+    return '\n'.join(lineas) + '\n'
+
+
+def cargar(codigo: str) -> float:
+    """
+    Tiempo de compilar y ejecutar el módulo generado, sin la importación
+    de la librería estándar
+    """
+
+    codigo = codigo.split('\n', 1)[1]
+
+    inicio = time.perf_counter()
+    exec(compile(codigo, '<generado>', 'exec'), {'__name__': 'generado'})
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de la eliminación de '
+                                        'funciones no alcanzables')
+    parser.add_argument('--funciones', type=int, default=5000,
+                        help='Cantidad de funciones del preludio')
+    parser.add_argument('--usadas', type=int, default=10,
+                        help='Funciones que invoca la principal')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.funciones, args.usadas))
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    arbol = analizador.ast
+    Verificador(arbol).verificar()
+
+    print(f'{args.funciones:,} funciones, {args.usadas} usadas')
+    tamano_completo = tiempo_completo = None
+
+    for eliminar in (False, True):
+        inicio = time.perf_counter()
+        generador = Generador(arbol, eliminar)
+        codigo = generador.generar_codigo()
+        tiempo_generar = time.perf_counter() - inicio
+        tiempo_cargar = cargar(codigo)
+
+        nombre = 'con eliminación' if eliminar else 'sin eliminación'
+        linea = f'{nombre:16} {len(codigo):10,} bytes ' \
+                f'generar {tiempo_generar * 1000:8.1f} ms ' \
+                f'cargar {tiempo_cargar * 1000:8.1f} ms'
+
+        if eliminar:
+            linea += f' {len(generador.grafo.eliminadas()):6} eliminadas ' \
+                     f'{tamano_completo / len(codigo):6.1f}x menos código ' \
+                     f'{tiempo_completo / tiempo_cargar:6.1f}x al cargar'
+        else:
+            tamano_completo, tiempo_completo = len(codigo), tiempo_cargar
+
+        print(linea)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# Benchmark de la emisión del código generado por unidades
+#
+# Genera un programa con `--funciones` funciones que la principal
+# invoca, y compara la memoria máxima (medida con tracemalloc) y el
+# tiempo de generar todo el código en un texto para luego escribirlo
+# contra escribir cada unidad en el archivo en cuanto se genera. Revisa
+# que los dos archivos sean iguales.
+#
+#   $ python3 -m rendimiento.emision [--funciones 1000]
+
+import filecmp
+import os
+import tempfile
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.generador import Generador
+from Verificador.verificador import Verificador
+
+
+def generar_programa(funciones: int, instrucciones: int) -> str:
+    """
+    Funciones con `instrucciones` ciclos cada una, todas invocadas desde
+    la principal para que ninguna se elimine
+    """
+
+    lineas = ['total anotado 0.']
+
+    for funcion in range(funciones):
+        lineas.append(f'POV f{funcion} (a) xD')
+        lineas.append('i anotado a.')
+        for _ in range(instrucciones):
+            lineas += ['whenCuando xD',
+                       'i anotado #i bobMar 1 bobTiplicar total#.',
+                       'but (i chikito 10) v:']
+        lineas += ['messirve i.', 'v:']
+
+    lineas += ['maracuya() xD', 'r anotado 0.']
+    for funcion in range(funciones):
+        lineas.append(f'r anotado jutsu f{funcion}(r).')
+    lineas += ['messirve r.', 'v:']
+
+    return '\n'.join(lineas) + '\n'
+
+
+def medir(generador: Generador, ruta: str, por_unidades: bool) -> tuple:
+    """
+    Memoria máxima y tiempo de generar y escribir el código en `ruta`
+    """
+
+    tracemalloc.start()
+    inicio = time.perf_counter()
+
+    with open(ruta, 'w', encoding='utf-8') as salida:
+        if por_unidades:
+            generador.generar(salida)
+        else:
+            salida.write(generador.generar_codigo())
+
+    tiempo = time.perf_counter() - inicio
+    _, maximo = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return maximo, tiempo
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de la emisión del '
+                                        'código generado por unidades')
+    parser.add_argument('--funciones', type=int, default=1000,
+                        help='Cantidad de funciones del programa')
+    parser.add_argument('--instrucciones', type=int, default=20,
+                        help='Ciclos en el cuerpo de cada función')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.funciones,
+                                             args.instrucciones))
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    arbol = analizador.ast
+    Verificador(arbol).verificar()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = [os.path.join(directorio, 'texto.py'),
+                 os.path.join(directorio, 'unidades.py')]
+
+        print(f'{args.funciones:,} funciones')
+        resultados = []
+        for ruta, por_unidades in zip(rutas, (False, True)):
+            maximo, tiempo = medir(Generador(arbol), ruta, por_unidades)
+            resultados.append(maximo)
+
+            nombre = 'por unidades' if por_unidades else 'texto completo'
+            print(f'{nombre:16} {maximo / 2**20:8.1f} MiB '
+                  f'{tiempo * 1000:8.1f} ms')
+
+        tamano = os.path.getsize(rutas[0])
+        print(f'{"archivo":16} {tamano / 2**20:8.1f} MiB '
+              f'{resultados[0] / resultados[1]:8.1f}x menos memoria '
+              f'{"mismo código" if filecmp.cmp(*rutas, shallow=False) else "DISTINTO"}')
+
+
+if __name__ == '__main__':
+    main()
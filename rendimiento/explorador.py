@@ -0,0 +1,110 @@
+# Microbenchmark del explorador
+#
+# Compara los componentes por segundo de la exploración original (la
+# expresión maestra se arma y se busca en cada llamada y las palabras
+# reservadas se buscan recorriendo el diccionario de conjuntos) contra
+# la exploración con las tablas precompiladas.
+#
+#   $ python3 -m rendimiento.explorador [--escala 1000]
+
+import glob
+import os
+import re
+import time
+from argparse import ArgumentParser
+
+from Explorador.explorador import (ComponenteLexico, DescriptorComponente,
+                                   Explorador)
+
+RUTA_EJEMPLOS = os.path.join(os.path.dirname(__file__),
+                             '..', 'docs', 'ejemplos', '*.cm')
+
+
+def explorar_sin_tablas(texto: str) -> int:
+    """
+    Réplica de la exploración antes de las tablas precompiladas,
+    retorna la cantidad de componentes
+    """
+
+    componentes = []
+    num_linea = 1
+    inicio_linea = 0
+
+    regexps = '|'.join(str(desc)
+                       for desc in list(DescriptorComponente)
+                       if desc != DescriptorComponente.RESERVADOS)
+
+    for coincidencia in re.finditer(regexps, texto):
+        tipo_coincidencia = coincidencia.lastgroup
+        valor = coincidencia.group()
+        columna = coincidencia.start() - inicio_linea + 1
+
+        if tipo_coincidencia == 'NUEVALINEA':
+            inicio_linea = coincidencia.end()
+            num_linea += 1
+            continue
+
+        elif tipo_coincidencia == 'ESPACIO' or \
+                tipo_coincidencia == 'COMENTARIO':
+            continue
+
+        elif tipo_coincidencia == 'IDENTIFICADOR':
+            predeterminado = 'IDENTIFICADOR'
+            for tipo_id_resv, valores_resv in \
+                    DescriptorComponente.RESERVADOS.value.items():
+                if valor in valores_resv:
+                    predeterminado = tipo_id_resv
+                    break
+            tipo_coincidencia = predeterminado
+
+        componentes.append(
+            ComponenteLexico(tipo_coincidencia, valor, num_linea, columna))
+
+    return len(componentes)
+
+
+def explorar_con_tablas(texto: str) -> int:
+    """
+    Exploración actual, retorna la cantidad de componentes
+    """
+
+    explorador = Explorador(texto)
+    explorador.explorar()
+    return len(explorador.componentes)
+
+
+def medir(funcion, textos) -> float:
+    """
+    Retorna los componentes por segundo de `funcion` sobre los textos
+    """
+
+    cantidad = 0
+    inicio = time.perf_counter()
+    for texto in textos:
+        cantidad += funcion(texto)
+    return cantidad / (time.perf_counter() - inicio)
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Microbenchmark del explorador')
+    parser.add_argument('--escala', type=int, default=1000,
+                        help='Cantidad de veces que se repite cada ejemplo')
+    args = parser.parse_args()
+
+    textos = []
+    for ruta in sorted(glob.glob(RUTA_EJEMPLOS)):
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            # se asegura el cambio de línea entre repeticiones
+            textos.append((archivo.read().rstrip('\n') + '\n') * args.escala)
+
+    antes = medir(explorar_sin_tablas, textos)
+    despues = medir(explorar_con_tablas, textos)
+
+    print(f'Ejemplos x{args.escala}')
+    print(f'{"sin tablas":15} {antes:15,.0f} componentes/s')
+    print(f'{"con tablas":15} {despues:15,.0f} componentes/s')
+    print(f'{"aceleración":15} {despues / antes:15.2f}x')
+
+
+if __name__ == '__main__':
+    main()
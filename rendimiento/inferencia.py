@@ -0,0 +1,111 @@
+# Benchmark del código generado con la inferencia de tipos
+#
+# Genera un programa aritmético (fibonacci, la suma de los cuadrados de
+# muchos números y su promedio) y ejecuta el python generado sin la
+# inferencia de tipos y con ella, donde las variables llevan anotación.
+# `bobiDir` es `/` en los dos, así que ambos dan el mismo resultado y el
+# benchmark muestra lo que cuesta inferir y anotar.
+#
+#   $ python3 -m rendimiento.inferencia [--numeros 20000]
+
+import time
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.visitadores import VisitantePython
+from Verificador.inferencia import InferenciaTipos
+from Verificador.verificador import Verificador
+
+
+def generar_programa(numeros: int) -> str:
+    """
+    Suma los cuadrados de los números de 1 a `numeros`, los promedia y
+    calcula fibonacci de 90
+    """
+
+    return f'''POV cuadrado (n) xD
+    resultado anotado #n bobTiplicar n#.
+    messirve resultado.
+v:
+
+POV fibonacci (n) xD
+    siguiente anotado 1.
+    actual anotado 0.
+    x anotado 1.
+    whenCuando xD
+        tmp anotado actual.
+        actual anotado siguiente.
+        siguiente anotado #siguiente bobMar tmp#.
+        x anotado #x bobMar 1#.
+    but (x panachikito n) v:
+    messirve actual.
+v:
+
+maracuya() xD
+    total anotado 0.
+    numero anotado 1.
+    whenCuando xD
+        suma anotado jutsu cuadrado(numero).
+        total anotado #total bobMar suma#.
+        numero anotado #numero bobMar 1#.
+    but (numero panachikito {numeros}) v:
+    promedio anotado #total bobiDir numero#.
+    limite anotado 90.
+    fib anotado jutsu fibonacci(limite).
+    final anotado #promedio bobMar fib#.
+    messirve final.
+v:
+'''
+
+
+def ejecutar(codigo: str) -> tuple:
+    """
+    Tiempo y resultado de ejecutar la principal del código generado
+    """
+
+    espacio = {}
+    exec(compile(codigo, '<generado>', 'exec'), espacio)
+
+    inicio = time.perf_counter()
+    resultado = espacio['principal']()
+    return time.perf_counter() - inicio, resultado
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark del código generado '
+                                        'con la inferencia de tipos')
+    parser.add_argument('--numeros', type=int, default=20000,
+                        help='Cantidad de números de los que se suman '
+                             'los cuadrados')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.numeros))
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    arbol = analizador.ast
+    Verificador(arbol).verificar()
+
+    inicio = time.perf_counter()
+    inferencia = InferenciaTipos(arbol).inferir()
+    tiempo_inferencia = time.perf_counter() - inicio
+
+    sin_tipos = VisitantePython().visitar(arbol.raiz)
+    con_tipos = VisitantePython(inferencia).visitar(arbol.raiz)
+
+    tiempo_sin, resultado_sin = ejecutar(sin_tipos)
+    tiempo_con, resultado_con = ejecutar(con_tipos)
+
+    print(f'{args.numeros:,} números')
+    print(f'{"inferencia":16} {tiempo_inferencia * 1000:10.1f} ms')
+    print(f'{"sin inferencia":16} {tiempo_sin * 1000:10.1f} ms '
+          f'resultado {resultado_sin!r}')
+    print(f'{"con inferencia":16} {tiempo_con * 1000:10.1f} ms '
+          f'resultado {resultado_con!r} {tiempo_sin / tiempo_con:6.1f}x')
+    print(f'{"anotaciones":16} '
+          f'{con_tipos.count(": int") + con_tipos.count(": float"):10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# Benchmark del internado de nodos
+#
+# Analiza y verifica un programa repetitivo, como los que generan las
+# herramientas (contadores de ciclo, literales 0 y 1), de aproximadamente
+# `--nodos` nodos y compara la memoria que ocupa el árbol verificado
+# contra la del árbol internado, donde los literales, identificadores y
+# expresiones iguales son un único nodo. También revisa que ambos árboles
+# se impriman igual.
+#
+#   $ python3 -m rendimiento.internado [--nodos 100000]
+
+import gc
+import io
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.internado import InternadorNodos
+from Verificador.verificador import Verificador
+from rendimiento.nodos import contar_nodos
+
+
+def generar_programa(nodos: int) -> str:
+    """
+    Genera un programa con aproximadamente `nodos` nodos, cada
+    ciclo produce 22 nodos
+    """
+
+    lineas = ['maracuya() xD', 'i anotado 0.', 'total anotado 0.']
+    for _ in range(nodos // 22):
+        lineas += ['whenCuando xD',
+                   'total anotado #total bobMar 1#.',
+                   'i anotado #i bobMar 1#.',
+                   'but (i chikito 10) v:']
+    lineas += ['messirve total.', 'v:']
+
+    return '\n'.join(lineas) + '\n'
+
+
+def imprimir(arbol) -> str:
+    salida = io.StringIO()
+    with redirect_stdout(salida):
+        arbol.imprimir_preorden()
+    return salida.getvalue()
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark del internado de nodos')
+    parser.add_argument('--nodos', type=int, default=100000,
+                        help='Cantidad aproximada de nodos del árbol')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.nodos))
+    explorador.explorar()
+    componentes = list(explorador.componentes)
+
+    gc.collect()
+    tracemalloc.start()
+
+    analizador = Analizador(componentes)
+    analizador.analizar()
+    arbol = analizador.ast
+    Verificador(arbol).verificar()
+    del analizador
+
+    gc.collect()
+    memoria_arbol = tracemalloc.get_traced_memory()[0]
+
+    inicio = time.perf_counter()
+    internado = InternadorNodos().internar(arbol)
+    tiempo = time.perf_counter() - inicio
+
+    cantidad = contar_nodos(arbol.raiz)
+    esperado = imprimir(arbol)
+    del arbol
+
+    gc.collect()
+    memoria_internado = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    compartidos = len(internado.internador.tabla)
+
+    print(f'{cantidad:,} nodos, {compartidos:,} nodos compartidos, '
+          f'{len(internado.lineas):,} apariciones')
+    print(f'{"árbol":15} {memoria_arbol / 2**20:8.1f} MiB '
+          f'{memoria_arbol / cantidad:8.0f} B/nodo')
+    print(f'{"internado":15} {memoria_internado / 2**20:8.1f} MiB '
+          f'{memoria_internado / cantidad:8.0f} B/nodo')
+    print(f'{"reducción":15} {memoria_arbol / memoria_internado:10.2f}x')
+    print(f'{"internar":15} {tiempo:10.3f} s')
+    print(f'{"misma salida":15} '
+          f'{"sí" if imprimir(internado) == esperado else "no"}')
+
+
+if __name__ == '__main__':
+    main()
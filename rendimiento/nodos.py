@@ -0,0 +1,131 @@
+# Benchmark de los nodos del árbol
+#
+# Analiza un programa de aproximadamente `--nodos` nodos con el Nodo
+# actual (slots, línea y columna como campos, sin deepcopy) y con una
+# réplica del Nodo anterior (diccionario de atributos copiado con
+# deepcopy en cada construcción), y compara el tiempo de análisis y la
+# memoria que ocupa el árbol.
+#
+#   $ python3 -m rendimiento.nodos [--nodos 100000]
+
+import gc
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from copy import deepcopy
+
+import Analizador.analizador as modulo_analizador
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arbol import Nodo
+
+
+class NodoAnterior:
+    """
+    Réplica del Nodo antes de los slots, recibe la posición como
+    diccionario igual que cuando el analizador usaba get_atributos
+    """
+
+    def __init__(self, tipo, contenido=None, nodos=[], atributos={},
+                 linea=None, columna=None):
+        if linea is not None:
+            atributos = {'linea': linea, 'columna': columna}
+
+        self.tipo = tipo
+        self.contenido = contenido
+        self.nodos = nodos
+        self.atributos = deepcopy(atributos)
+
+
+def generar_programa(nodos: int) -> str:
+    """
+    Genera un programa con aproximadamente `nodos` nodos, cada
+    asignación con expresión matemática produce 9 nodos
+    """
+
+    lineas = ['maracuya() xD', 'i anotado 0.']
+    for _ in range(nodos // 9):
+        lineas.append('i anotado #i bobMar 1 bobTiplicar 2#.')
+    lineas += ['messirve i.', 'v:']
+
+    return '\n'.join(lineas) + '\n'
+
+
+def contar_nodos(raiz) -> int:
+    """
+    Cuenta los nodos del árbol sin recursión
+    """
+
+    cantidad = 0
+    pendientes = [raiz]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        cantidad += 1
+        pendientes.extend(nodo.nodos)
+
+    return cantidad
+
+
+def medir(clase_nodo, componentes, repeticiones: int = 3) -> tuple:
+    """
+    Analiza los componentes construyendo nodos de `clase_nodo`, retorna
+    el mejor tiempo, los bytes que ocupa el árbol y la raíz
+    """
+
+    modulo_analizador.Nodo = clase_nodo
+    try:
+        mejor = float('inf')
+        for _ in range(repeticiones):
+            analizador = Analizador(componentes)
+
+            gc.collect()
+            gc.disable()
+            inicio = time.perf_counter()
+            analizador.analizar()
+            mejor = min(mejor, time.perf_counter() - inicio)
+            gc.enable()
+
+        raiz = analizador.ast.raiz
+        del analizador
+
+        # Memoria del árbol: se construye de nuevo midiendo con tracemalloc
+        gc.collect()
+        tracemalloc.start()
+        analizador = Analizador(componentes)
+        antes = tracemalloc.get_traced_memory()[0]
+        analizador.analizar()
+        memoria = tracemalloc.get_traced_memory()[0] - antes
+        tracemalloc.stop()
+
+    finally:
+        modulo_analizador.Nodo = Nodo
+
+    return mejor, memoria, raiz
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de los nodos del árbol')
+    parser.add_argument('--nodos', type=int, default=100000,
+                        help='Cantidad aproximada de nodos del árbol')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.nodos))
+    explorador.explorar()
+    componentes = list(explorador.componentes)
+
+    tiempo_antes, memoria_antes, raiz = medir(NodoAnterior, componentes)
+    tiempo_despues, memoria_despues, _ = medir(Nodo, componentes)
+
+    print(f'{contar_nodos(raiz):,} nodos')
+    print(f'{"":15} {"análisis":>12} {"memoria":>12}')
+    print(f'{"nodo anterior":15} {tiempo_antes:10.3f} s '
+          f'{memoria_antes / 2**20:8.1f} MiB')
+    print(f'{"nodo con slots":15} {tiempo_despues:10.3f} s '
+          f'{memoria_despues / 2**20:8.1f} MiB')
+    print(f'{"mejora":15} {tiempo_antes / tiempo_despues:11.2f}x '
+          f'{memoria_antes / memoria_despues:10.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Benchmark del optimizador
+#
+# Genera un programa cuyo ciclo principal calcula expresiones con
+# constantes y revisa condiciones conocidas en cada iteración, y compara
+# el tiempo de ejecutar el código generado sin optimizar, con -O y con
+# -OO. Revisa que los tres retornen lo mismo. El programa no usa
+# funciones estándar, se ejecuta sin la línea que las importa.
+#
+#   $ python3 -m rendimiento.optimizacion [--iteraciones 200000]
+
+import time
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.generador import Generador
+from Optimizador.optimizador import PLEGAR_CONSTANTES, PODAR_RAMAS, Optimizador
+from Verificador.verificador import Verificador
+
+
+def generar_programa(iteraciones: int) -> str:
+    """
+    Ciclo de `iteraciones` vueltas con expresiones y condiciones que
+    sólo dependen de literales
+    """
+
+    return '\n'.join([
+        'maracuya() xD',
+        'i anotado 0.',
+        'total anotado 0.',
+        'whenCuando xD',
+        'paso anotado #2 bobTiplicar 3 bobMar i bobStar 4 bobTiplicar 5 bobTiplicar 6#.',
+        'siuuu (1 panas 1 aja 2 chikito 3) xD',
+        'total anotado #total bobMar paso#.',
+        'v:',
+        'nimodo xD',
+        'total anotado #total bobStar paso#.',
+        'v:',
+        'siuuu (10 chikito 5 ayno SIUA nolocrick SIUA) xD',
+        'total anotado 0.',
+        'v:',
+        'i anotado #i bobMar 1#.',
+        f'but (i chikito {iteraciones}) v:',
+        'messirve total.',
+        'v:',
+    ]) + '\n'
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark del optimizador')
+    parser.add_argument('--iteraciones', type=int, default=200000,
+                        help='Vueltas del ciclo del programa')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.iteraciones))
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    arbol = analizador.ast
+    Verificador(arbol).verificar()
+
+    print(f'{args.iteraciones:,} iteraciones')
+    resultados = []
+    tiempo_base = None
+
+    for nombre, nivel in (('sin optimizar', 0), ('-O', PLEGAR_CONSTANTES),
+                          ('-OO', PODAR_RAMAS)):
+        inicio = time.perf_counter()
+        optimizador = Optimizador(arbol, nivel)
+        optimizado = optimizador.optimizar()
+        tiempo_optimizar = time.perf_counter() - inicio
+
+        codigo = Generador(optimizado).generar_codigo()
+        espacio = {'__name__': 'rendimiento'}
+        exec(codigo.replace(Generador.LIB_ESTANDAR, ''), espacio)
+
+        inicio = time.perf_counter()
+        resultados.append(espacio['principal']())
+        tiempo = time.perf_counter() - inicio
+
+        linea = (f'{nombre:14} optimizar {tiempo_optimizar * 1000:7.2f} ms '
+                 f'ejecutar {tiempo * 1000:8.1f} ms '
+                 f'({optimizador.plegadas} plegadas, '
+                 f'{optimizador.podadas} podadas)')
+        if tiempo_base is None:
+            tiempo_base = tiempo
+        else:
+            linea += f' {tiempo_base / tiempo:5.1f}x'
+        print(linea)
+
+    print(f'{"resultado":14} '
+          f'{"mismo" if len(set(resultados)) == 1 else "DISTINTO"}')
+
+
+if __name__ == '__main__':
+    main()
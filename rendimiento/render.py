@@ -0,0 +1,112 @@
+# Benchmark de la escritura del árbol
+#
+# Analiza un programa de aproximadamente `--nodos` nodos y escribe el
+# árbol en un archivo temporal como lo hacía imprimir_preorden antes
+# (un print por nodo desde el recorrido) y con la capa de escritura por
+# bloques en texto, JSON y DOT, también con una profundidad máxima.
+# La versión anterior se mide con búfer de bloque y con búfer de línea,
+# que es el que usa la salida estándar en una terminal. Revisa que el
+# texto sea idéntico y que el JSON sea válido.
+#
+#   $ python3 -m rendimiento.render [--nodos 1000000]
+
+import json
+import os
+import tempfile
+import time
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.recorrido import recorrer
+from Utils.render import escribir_arbol
+from rendimiento.nodos import generar_programa
+
+
+def imprimir_anterior(arbol) -> None:
+    """
+    Réplica de imprimir_preorden antes de la capa de escritura
+    """
+
+    niveles = [0]
+
+    def entrar(nodo) -> None:
+        nivel = niveles[-1]
+        tabulado = ' ' * nivel * 3 + "|__" if arbol.raiz is not nodo else ""
+        print(f'{tabulado}{nodo}')
+        niveles.append(nivel + 1)
+
+    def salir(nodo, resultados: list) -> None:
+        niveles.pop()
+
+    recorrer(arbol.raiz, entrar, salir)
+
+
+def medir(escribir, ruta: str, bufer: int = -1) -> float:
+    """
+    Tiempo de escribir en el archivo `ruta`, `bufer` es el
+    parámetro buffering de open
+    """
+
+    with open(ruta, 'w', buffering=bufer, encoding='utf-8') as salida:
+        inicio = time.perf_counter()
+        escribir(salida)
+        salida.flush()
+        return time.perf_counter() - inicio
+
+
+def leer(ruta: str) -> str:
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        return archivo.read()
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de la escritura del árbol')
+    parser.add_argument('--nodos', type=int, default=1000000,
+                        help='Cantidad aproximada de nodos del árbol')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.nodos))
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    arbol = analizador.ast
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'arbol')
+
+        def anterior(salida) -> None:
+            with redirect_stdout(salida):
+                imprimir_anterior(arbol)
+
+        tiempo_linea = medir(anterior, ruta, bufer=1)
+        tiempo_anterior = medir(anterior, ruta)
+        esperado = leer(ruta)
+
+        tiempos = {}
+        for formato, profundidad in [('texto', None), ('json', None),
+                                     ('dot', None), ('texto', 3)]:
+            tiempos[formato, profundidad] = medir(
+                lambda salida: escribir_arbol(arbol, salida, formato,
+                                              profundidad), ruta)
+
+            if (formato, profundidad) == ('texto', None):
+                mismo_texto = leer(ruta) == esperado
+            if formato == 'json':
+                json.loads(leer(ruta))
+
+    print(f'{args.nodos:,} nodos')
+    print(f'{"print, búfer línea":20} {tiempo_linea:8.3f} s')
+    print(f'{"print, búfer bloque":20} {tiempo_anterior:8.3f} s '
+          f'{tiempo_linea / tiempo_anterior:6.2f}x')
+    for (formato, profundidad), tiempo in tiempos.items():
+        nombre = formato if profundidad is None \
+            else f'{formato} hasta {profundidad}'
+        print(f'{nombre:20} {tiempo:8.3f} s '
+              f'{tiempo_linea / tiempo:6.2f}x')
+    print(f'{"mismo texto":20} {"sí" if mismo_texto else "no"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+# Benchmark de la verificación incremental
+#
+# Genera el programa de rendimiento.verificacion con `--funciones`
+# funciones, lo verifica completo y luego edita una función del medio:
+# primero sin cambiar su tipo, después haciendo que retorne texto (así
+# también se verifican las funciones que la invocan). Cada edición
+# reemplaza sólo el nodo de la función en el árbol ya verificado, como
+# lo haría un editor, y se compara reverificar contra verificar todo el
+# programa editado. Al final se mide la edición sobre un árbol analizado
+# de nuevo, donde ningún nodo es el mismo y cada función se compara por
+# su huella, con el árbol de Nodo y con el árbol en arena (lo que ocurre
+# al usar la caché). Revisa que el resultado sea el mismo que el de la
+# verificación completa.
+#
+#   $ python3 -m rendimiento.reverificacion [--funciones 5000]
+
+import time
+from argparse import ArgumentParser
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arbol import ArbolSintaxisAbstracta, Nodo
+from Utils.arena import ArbolArena
+from Verificador.verificador import Verificador
+from rendimiento.verificacion import generar_programa
+
+
+def analizar(programa: str) -> ArbolSintaxisAbstracta:
+    explorador = Explorador(programa)
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    return analizador.ast
+
+
+def editar(programa: str, funcion: int, anterior: str, nuevo: str) -> str:
+    """
+    Cambia el primer `anterior` de la función `funcion` por `nuevo`
+    """
+
+    inicio = programa.index(f'POV f{funcion} (a) xD')
+    posicion = programa.index(anterior, inicio)
+    return programa[:posicion] + nuevo + \
+        programa[posicion + len(anterior):]
+
+
+def reemplazar_funcion(arbol: ArbolSintaxisAbstracta, programa: str,
+                       funcion: int) -> ArbolSintaxisAbstracta:
+    """
+    Árbol con los mismos nodos que `arbol` salvo el de la función
+    `funcion`, que se toma del análisis de `programa`
+    """
+
+    nuevo = analizar(programa).raiz.nodos
+    posicion = next(posicion for posicion, nodo in enumerate(nuevo)
+                    if nodo.contenido == f'f{funcion}')
+
+    editado = ArbolSintaxisAbstracta()
+    editado.raiz = Nodo(arbol.raiz.tipo, arbol.raiz.contenido,
+                        list(arbol.raiz.nodos))
+    editado.raiz.nodos[posicion] = nuevo[posicion]
+    return editado
+
+
+def resumen(arbol: ArbolSintaxisAbstracta, tabla) -> tuple:
+    """
+    Tipos del árbol y registros de la tabla, sin las posiciones
+    """
+
+    tipos = [(nodo.tipo, nodo.contenido, nodo.atributos.get('tipo'))
+             for nodo, _, _ in arbol.iterar_preorden()]
+    registros = [(registro.get_nombre(), registro.get_profundidad(),
+                  registro.get_referencia().atributos.get('tipo'))
+                 for registro in tabla.iterar_registros()]
+    return tipos, registros
+
+
+def medir(arbol: ArbolSintaxisAbstracta, anterior=None) -> tuple:
+    """
+    Tiempo de reverificar el árbol y el verificador usado
+    """
+
+    verificador = Verificador(arbol)
+    inicio = time.perf_counter()
+    verificador.reverificar(anterior)
+    return time.perf_counter() - inicio, verificador
+
+
+def completa(arbol: ArbolSintaxisAbstracta) -> tuple:
+    """
+    Tiempo y resumen de verificar todo el árbol
+    """
+
+    verificador = Verificador(arbol)
+    inicio = time.perf_counter()
+    tabla = verificador.verificar()
+    return time.perf_counter() - inicio, resumen(arbol, tabla)
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de la verificación '
+                                        'incremental')
+    parser.add_argument('--funciones', type=int, default=5000,
+                        help='Cantidad de funciones del programa')
+    parser.add_argument('--instrucciones', type=int, default=10,
+                        help='Instrucciones en el cuerpo de cada función')
+    args = parser.parse_args()
+
+    programa = generar_programa(args.funciones, args.instrucciones)
+    funcion = args.funciones // 2
+
+    arbol = analizar(programa)
+    tiempo, verificador = medir(arbol)
+    print(f'{args.funciones:,} funciones')
+    print(f'{"completa":24} {tiempo * 1000:10.1f} ms '
+          f'{len(verificador.reverificadas):6} unidades')
+
+    casos = [('mismo tipo', editar(programa, funcion, 'i anotado 0.',
+                                   'i anotado 1.')),
+             ('retorna texto', editar(programa, funcion, 'messirve i.',
+                                      'messirve ツxツ.'))]
+
+    for nombre, editado in casos:
+        arbol_editado = reemplazar_funcion(arbol, editado, funcion)
+        tiempo, siguiente = medir(arbol_editado, verificador.dependencias)
+        obtenido = resumen(arbol_editado, siguiente.tabla_simbolos)
+
+        tiempo_completa, esperado = completa(analizar(editado))
+        print(f'{nombre:24} {tiempo * 1000:10.1f} ms '
+              f'{len(siguiente.reverificadas):6} unidades '
+              f'{tiempo_completa / tiempo:8.0f}x '
+              f'{"mismo resultado" if obtenido == esperado else "DISTINTO"}')
+
+    # El programa editado analizado de nuevo, también como arena
+    for arena in (False, True):
+        arbol_editado = analizar(editado)
+        arbol_completo = analizar(editado)
+        if arena:
+            arbol_editado = ArbolArena.desde_arbol(arbol_editado)
+            arbol_completo = ArbolArena.desde_arbol(arbol_completo)
+
+        tiempo, siguiente = medir(arbol_editado, verificador.dependencias)
+        obtenido = resumen(arbol_editado, siguiente.tabla_simbolos)
+        tiempo_completa, esperado = completa(arbol_completo)
+
+        nombre = 'analizado, arena' if arena else 'analizado de nuevo'
+        print(f'{nombre:24} {tiempo * 1000:10.1f} ms '
+              f'{len(siguiente.reverificadas):6} unidades '
+              f'{tiempo_completa / tiempo:8.1f}x '
+              f'{"mismo resultado" if obtenido == esperado else "DISTINTO"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# Benchmark de la tabla de símbolos
+#
+# Genera un programa con aproximadamente `--declaraciones` declaraciones
+# repartidas en funciones, cada una usando las variables anteriores, y
+# mide la verificación con la tabla de símbolos por alcances y con una
+# réplica de la tabla anterior (una lista que se recorre en cada
+# búsqueda). La tabla anterior crece de forma cuadrática, por eso sólo
+# se mide hasta `--limite-anterior` declaraciones.
+#
+#   $ python3 -m rendimiento.tabla_simbolos [--declaraciones 100000]
+
+import time
+from argparse import ArgumentParser
+
+import Verificador.verificador as modulo_verificador
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.registro import Registro
+from Verificador.verificador import TablaSimbolos, Verificador
+
+# Declaraciones locales de cada función del programa generado
+LOCALES = 10
+
+
+class TablaAnterior(TablaSimbolos):
+    """
+    Réplica de la tabla de símbolos como lista de registros
+    """
+
+    def nuevo_bloque(self):
+        self.profundidad += 1
+
+    def eliminar_bloque(self) -> None:
+        for registro in self.simbolos:
+            if registro.get_profundidad() == self.profundidad:
+                self.simbolos.remove(registro)
+
+        self.profundidad -= 1
+
+    def nuevo_registro(self, nodo, visible: bool = True) -> Registro:
+        registro = Registro(self.profundidad, nodo)
+        self.simbolos.append(registro)
+        return registro
+
+    def activar_registro(self, registro: Registro) -> None:
+        pass
+
+    def verificar_existencia(self, nombre: str, nodo) -> Registro:
+        for registro in self.simbolos:
+            if registro.get_nombre() == nombre and \
+                    registro.get_profundidad() <= self.profundidad:
+                return registro
+
+        raise NameError(nombre)
+
+
+def generar_programa(declaraciones: int) -> str:
+    """
+    Genera funciones con LOCALES declaraciones cada una, todas con
+    los mismos nombres de variables para que se oculten entre sí
+    """
+
+    lineas = []
+    for funcion in range(max(declaraciones // LOCALES, 1)):
+        lineas += [f'POV f{funcion} (v0) xD']
+        for local in range(1, LOCALES):
+            lineas.append(f'v{local} anotado #v{local - 1} bobMar 1#.')
+        lineas += [f'messirve v{LOCALES - 1}.', 'v:', '']
+
+    lineas += ['maracuya() xD', 'messirve 0.', 'v:']
+    return '\n'.join(lineas) + '\n'
+
+
+def medir(clase_tabla, programa: str) -> float:
+    """
+    Tiempo de verificar el programa usando `clase_tabla`
+    """
+
+    explorador = Explorador(programa)
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+
+    modulo_verificador.TablaSimbolos = clase_tabla
+    try:
+        verificador = Verificador(analizador.ast)
+        inicio = time.perf_counter()
+        verificador.verificar()
+        return time.perf_counter() - inicio
+    finally:
+        modulo_verificador.TablaSimbolos = TablaSimbolos
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de la tabla de símbolos')
+    parser.add_argument('--declaraciones', type=int, default=100000,
+                        help='Cantidad aproximada de declaraciones')
+    parser.add_argument('--limite-anterior', type=int, default=20000,
+                        help='Máximo de declaraciones para la tabla anterior')
+    args = parser.parse_args()
+
+    tamanos = sorted({min(args.declaraciones, tamano)
+                      for tamano in (1000, 5000, 20000, args.declaraciones)})
+
+    print(f'{"declaraciones":>14} {"anterior":>10} {"alcances":>10}')
+    for tamano in tamanos:
+        programa = generar_programa(tamano)
+        nuevo = medir(TablaSimbolos, programa)
+
+        if tamano <= args.limite_anterior:
+            anterior = medir(TablaAnterior, programa)
+            print(f'{tamano:14,} {anterior:9.3f}s {nuevo:9.3f}s '
+                  f'{anterior / nuevo:6.1f}x')
+        else:
+            print(f'{tamano:14,} {"-":>10} {nuevo:9.3f}s')
+
+
+if __name__ == '__main__':
+    main()
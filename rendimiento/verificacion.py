@@ -0,0 +1,107 @@
+# Benchmark de la verificación en paralelo
+#
+# Genera un programa con `--funciones` funciones, cada una con un cuerpo
+# de `--instrucciones` instrucciones y que invoca a una función anterior,
+# y compara el tiempo de verificarlo en un proceso y en `--procesos`
+# procesos, con el árbol de Nodo y con el árbol en arena (el que usa la
+# caché). Revisa que la tabla de símbolos y el árbol verificado sean
+# iguales en ambos casos.
+#
+#   $ python3 -m rendimiento.verificacion [--funciones 2000] [--procesos 4]
+
+import io
+import os
+import time
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arena import ArbolArena
+from Verificador.verificador import Verificador
+
+
+def generar_programa(funciones: int, instrucciones: int) -> str:
+    """
+    Genera funciones independientes salvo por la invocación a la
+    función de 10 posiciones antes, así hay varias listas a la vez
+    """
+
+    lineas = ['total anotado 0.']
+
+    for funcion in range(funciones):
+        lineas.append(f'POV f{funcion} (a) xD')
+        lineas.append('i anotado 0.')
+        if funcion >= 10:
+            lineas.append(f'r anotado jutsu f{funcion - 10}(i).')
+
+        for _ in range(instrucciones // 2):
+            lineas += ['whenCuando xD',
+                       'i anotado #i bobMar 1 bobTiplicar total#.',
+                       'but (i chikito 10) v:']
+        lineas += ['messirve i.', 'v:']
+
+    lineas += ['maracuya() xD', 'messirve total.', 'v:']
+    return '\n'.join(lineas) + '\n'
+
+
+def verificar(componentes, procesos: int, arena: bool) -> tuple:
+    """
+    Retorna el tiempo de verificar y lo que imprime `-v`
+    """
+
+    analizador = Analizador(componentes)
+    analizador.analizar()
+
+    arbol = analizador.ast
+    if arena:
+        arbol = ArbolArena.desde_arbol(arbol)
+
+    verificador = Verificador(arbol)
+    inicio = time.perf_counter()
+    if procesos > 1:
+        tabla = verificador.verificar_paralelo(procesos)
+    else:
+        tabla = verificador.verificar()
+    tiempo = time.perf_counter() - inicio
+
+    salida = io.StringIO()
+    with redirect_stdout(salida):
+        print(tabla)
+        arbol.imprimir_preorden()
+
+    return tiempo, salida.getvalue()
+
+
+def main() -> None:
+    parser = ArgumentParser(description='Benchmark de la verificación '
+                                        'en paralelo')
+    parser.add_argument('--funciones', type=int, default=2000,
+                        help='Cantidad de funciones del programa')
+    parser.add_argument('--instrucciones', type=int, default=40,
+                        help='Instrucciones en el cuerpo de cada función')
+    parser.add_argument('--procesos', type=int, default=os.cpu_count(),
+                        help='Procesos para la verificación en paralelo')
+    args = parser.parse_args()
+
+    explorador = Explorador(generar_programa(args.funciones,
+                                             args.instrucciones))
+    explorador.explorar()
+    componentes = list(explorador.componentes)
+
+    print(f'{args.funciones:,} funciones, {os.cpu_count()} CPU')
+    for arena in (False, True):
+        tiempo_secuencial, esperado = verificar(componentes, 1, arena)
+        tiempo_paralelo, salida = verificar(componentes, args.procesos,
+                                            arena)
+
+        arbol = 'arena' if arena else 'nodos'
+        print(f'{arbol + ", 1 proceso":22} {tiempo_secuencial:8.3f} s')
+        print(f'{f"{arbol}, {args.procesos} procesos":22} '
+              f'{tiempo_paralelo:8.3f} s '
+              f'{tiempo_secuencial / tiempo_paralelo:6.2f}x '
+              f'{"misma salida" if salida == esperado else "DISTINTA"}')
+
+
+if __name__ == '__main__':
+    main()
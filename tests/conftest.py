@@ -0,0 +1,12 @@
+# Configuración de las pruebas, se corren desde la raíz del repositorio
+#
+#   $ python3 -m pytest tests
+
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
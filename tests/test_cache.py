@@ -0,0 +1,144 @@
+# Caché de artefactos: la salida con la caché, vacía o llena, es la
+# misma que sin ella
+
+import io
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arena import ArbolArena
+from Utils.cache import (DIRECTORIO_CACHE, CacheArtefactos, clave_archivo,
+                         directorio_cache)
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CMAMUTH = os.path.join(RAIZ, 'cmamuth.py')
+EJEMPLO = os.path.join(RAIZ, 'docs', 'ejemplos', 'factorial.cm')
+
+
+@pytest.fixture
+def fuente(tmp_path):
+    """
+    Copia del ejemplo en su propia carpeta, la caché queda junto a ella
+    """
+
+    carpeta = tmp_path / 'fuente'
+    carpeta.mkdir()
+    ruta = carpeta / 'factorial.cm'
+    shutil.copy(EJEMPLO, ruta)
+    return ruta
+
+
+def cmamuth(*opciones, cwd) -> str:
+    entorno = dict(os.environ)
+    entorno['PYTHONPATH'] = os.pathsep.join(
+        filter(None, [RAIZ, entorno.get('PYTHONPATH')]))
+
+    proceso = subprocess.run([sys.executable, CMAMUTH, *map(str, opciones)],
+                             cwd=cwd, env=entorno, capture_output=True,
+                             text=True)
+    return proceso.stdout + proceso.stderr
+
+
+def texto_arbol(arbol) -> str:
+    salida = io.StringIO()
+    arbol.imprimir_preorden(salida)
+    return salida.getvalue()
+
+
+def etapas(carpeta) -> set:
+    return {nombre.rsplit('.', 1)[1]
+            for nombre in os.listdir(carpeta / DIRECTORIO_CACHE)}
+
+
+@pytest.mark.parametrize('modo', ['-e', '-a', '-v', '-g'])
+def test_misma_salida_con_cache(modo, fuente, tmp_path):
+    esperada = cmamuth(modo, fuente, cwd=tmp_path)
+
+    assert cmamuth('--cache', modo, fuente, cwd=tmp_path) == esperada
+    assert cmamuth('--cache', modo, fuente, cwd=tmp_path) == esperada
+
+
+def test_sin_cache_no_escribe(fuente, tmp_path):
+    cmamuth('-g', fuente, cwd=tmp_path)
+
+    assert not (fuente.parent / DIRECTORIO_CACHE).exists()
+    assert not (tmp_path / DIRECTORIO_CACHE).exists()
+
+
+def test_cache_junto_al_archivo(fuente, tmp_path):
+    cmamuth('--cache', '-v', fuente, cwd=tmp_path)
+
+    assert not (tmp_path / DIRECTORIO_CACHE).exists()
+    assert directorio_cache(fuente) == str(fuente.parent / DIRECTORIO_CACHE)
+
+    # El árbol verificado se guarda cuando el árbol sale de la caché
+    assert etapas(fuente.parent) == {'componentes', 'arbol', 'dependencias'}
+    cmamuth('--cache', '-v', fuente, cwd=tmp_path)
+    assert 'verificado' in etapas(fuente.parent)
+
+
+def test_ejecutar_guarda_bytecode(fuente, tmp_path):
+    # Sin --cache sólo se guarda el objeto de código. El tiempo se
+    # muestra aunque el programa falle al importar la librería estándar
+    assert 'de la caché' not in cmamuth('-x', fuente, cwd=tmp_path)
+    assert etapas(fuente.parent) == {'bytecode'}
+
+    assert '(bytecode de la caché)' in cmamuth('-x', fuente, cwd=tmp_path)
+
+
+def test_archivo_cambiado(fuente, tmp_path):
+    cmamuth('--cache', '-g', fuente, cwd=tmp_path)
+
+    with open(fuente, 'a', encoding='utf-8') as archivo:
+        archivo.write('muchoTexto: otra version\n')
+    esperada = cmamuth('-g', fuente, cwd=tmp_path)
+
+    assert cmamuth('--cache', '-g', fuente, cwd=tmp_path) == esperada
+
+
+def test_guardar_y_cargar_arbol(fuente):
+    with open(fuente, encoding='utf-8') as archivo:
+        explorador = Explorador(archivo.read())
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    arbol = ArbolArena.desde_arbol(analizador.ast)
+
+    cache = CacheArtefactos(directorio_cache(fuente))
+    clave = clave_archivo(fuente)
+    cache.guardar(clave, 'arbol', arbol)
+    cargado = cache.cargar(clave, 'arbol')
+
+    assert texto_arbol(cargado) == texto_arbol(arbol)
+
+
+class Intruso:
+    """
+    Objeto que al cargarse crea un archivo
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+
+    def __reduce__(self):
+        return open, (str(self.ruta), 'w')
+
+
+def test_no_carga_otras_clases(fuente, tmp_path):
+    cache = CacheArtefactos(directorio_cache(fuente))
+    clave = clave_archivo(fuente)
+    marca = tmp_path / 'marca'
+
+    os.makedirs(cache.directorio)
+    ruta = os.path.join(cache.directorio, f'{clave}.arbol')
+    with open(ruta, 'wb') as archivo:
+        pickle.dump(Intruso(marca), archivo)
+
+    assert cache.cargar(clave, 'arbol') is None
+    assert not marca.exists()
@@ -0,0 +1,112 @@
+# Compilación a objetos de código con el módulo `ast`: el mismo bytecode
+# que compilar el texto generado, con las líneas del programa .cm
+
+import dis
+import os
+import subprocess
+import sys
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.bytecode import a_bytes, desde_bytes
+from Generador.generador import Generador
+from Optimizador.optimizador import PODAR_RAMAS, Optimizador
+from Utils.arbol import ArbolSintaxisAbstracta
+from Utils.arena import ArbolArena
+from Verificador.verificador import Verificador
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CMAMUTH = os.path.join(RAIZ, 'cmamuth.py')
+EJEMPLOS = os.path.join(RAIZ, 'docs', 'ejemplos')
+
+
+def analizar(nombre: str) -> ArbolSintaxisAbstracta:
+    with open(os.path.join(EJEMPLOS, nombre), encoding='utf-8') as archivo:
+        explorador = Explorador(archivo.read())
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    Verificador(analizador.ast).verificar()
+    return analizador.ast
+
+
+def instrucciones(codigo) -> list:
+    """
+    Instrucciones de un objeto de código y de los que contiene, sin las
+    posiciones: el texto tiene las líneas del código generado y el
+    módulo de `ast` las del programa .cm. Los NOP sólo marcan líneas
+    """
+
+    resultado = [codigo.co_name, codigo.co_varnames, codigo.co_names]
+    for instruccion in dis.get_instructions(codigo):
+        if instruccion.opname == 'NOP':
+            continue
+        if hasattr(instruccion.argval, 'co_code'):
+            resultado.append(instrucciones(instruccion.argval))
+        else:
+            resultado.append((instruccion.opname, instruccion.argrepr))
+    return resultado
+
+
+@pytest.mark.parametrize('nombre', ['factorial.cm', 'carrera_caracoles.cm'])
+@pytest.mark.parametrize('forma', ['nodo', 'arena', 'optimizado'])
+def test_mismo_bytecode_que_el_texto(nombre, forma):
+    arbol = analizar(nombre)
+    if forma == 'arena':
+        arbol = ArbolArena.desde_arbol(arbol)
+    if forma == 'optimizado':
+        arbol = Optimizador(arbol, PODAR_RAMAS).optimizar()
+
+    generador = Generador(arbol)
+    texto = compile(generador.generar_codigo(), nombre, 'exec')
+
+    assert instrucciones(generador.compilar(nombre, posiciones=True)) == \
+        instrucciones(texto)
+
+
+def test_lineas_del_programa_original():
+    arbol = analizar('factorial.cm')
+    codigo = Generador(arbol).compilar('factorial.cm', posiciones=True)
+    funciones = {constante.co_name: constante.co_firstlineno
+                 for constante in codigo.co_consts
+                 if hasattr(constante, 'co_code')}
+
+    # La línea de la función es la de su identificador
+    factorial = arbol.raiz.nodos[0]
+    assert funciones['factorial'] == factorial.nodos[0].linea
+
+
+def test_bytes_pyc():
+    codigo = Generador(analizar('factorial.cm')).compilar()
+    datos = a_bytes(codigo)
+
+    assert desde_bytes(datos) == codigo
+    with pytest.raises(ValueError):
+        desde_bytes(b'\0' * 4 + datos[4:])
+
+
+@pytest.mark.parametrize('opciones, error', [
+    ([], 'too many levels of indentation'),
+    (['--posiciones'], 'demasiados niveles anidados'),
+])
+def test_anidamiento_profundo(opciones, error, tmp_path):
+    niveles = 3000
+    ruta = tmp_path / 'anidado.cm'
+    ruta.write_text('\n'.join(['maracuya() xD', 'x anotado 1.',
+                               *['siuuu (x panas 1) xD'] * niveles,
+                               'x anotado 2.', *['v:'] * niveles,
+                               'messirve x.', 'v:']) + '\n',
+                    encoding='utf-8')
+
+    entorno = dict(os.environ)
+    entorno['PYTHONPATH'] = os.pathsep.join(
+        filter(None, [RAIZ, entorno.get('PYTHONPATH')]))
+    proceso = subprocess.run(
+        [sys.executable, CMAMUTH, *opciones, '--pyc', tmp_path / 'a.pyc',
+         ruta], env=entorno, capture_output=True, text=True)
+
+    assert proceso.returncode == 1
+    assert error in proceso.stderr
+    assert 'Traceback' not in proceso.stderr
@@ -0,0 +1,60 @@
+# Eliminación de las funciones y globales que la principal no alcanza
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.generador import Generador
+from Utils.arbol import ArbolSintaxisAbstracta
+from Verificador.grafo import GrafoLlamadas
+from Verificador.verificador import Verificador
+
+PROGRAMA = '\n'.join([
+    'g anotado 1.',
+    'm anotado 2.',
+    'POV usada(a) xD', 'messirve a.', 'v:',
+    'POV registrar(a) xD', 'messirve a.', 'v:',
+    # Invoca una función del programa al cargarlo, se conserva aunque
+    # nadie lea `h`
+    'h anotado jutsu registrar(m).',
+    'POV muerta(a) xD', 'messirve a.', 'v:',
+    # Sólo la invoca una función muerta
+    'POV otra(a) xD', 'b anotado jutsu muerta(a).', 'messirve b.', 'v:',
+    'maracuya() xD', 'r anotado jutsu usada(g).', 'messirve r.', 'v:',
+]) + '\n'
+
+
+def arbol(texto: str) -> ArbolSintaxisAbstracta:
+    """
+    Árbol verificado del programa
+    """
+
+    explorador = Explorador(texto)
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    Verificador(analizador.ast).verificar()
+
+    return analizador.ast
+
+
+def test_unidades_eliminadas():
+    generador = Generador(arbol(PROGRAMA))
+
+    assert [GrafoLlamadas.nombre(unidad)
+            for unidad in generador.grafo.eliminadas()] == ['muerta', 'otra']
+
+
+def test_codigo_sin_unidades_eliminadas():
+    codigo = Generador(arbol(PROGRAMA)).generar_codigo()
+
+    assert 'def usada(a)' in codigo
+    assert 'def registrar(a)' in codigo
+    assert 'h: int = registrar(m)' in codigo
+    assert 'def muerta(a)' not in codigo
+    assert 'def otra(a)' not in codigo
+
+
+def test_sin_eliminar():
+    codigo = Generador(arbol(PROGRAMA), eliminar=False).generar_codigo()
+
+    assert 'def muerta(a)' in codigo
+    assert 'def otra(a)' in codigo
@@ -0,0 +1,102 @@
+# Reporte de varios errores de sintaxis y recuperación en modo pánico
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Analizador.validador import Validador
+from Explorador.explorador import Explorador
+from Utils.arbol import TipoNodo
+
+# Un error en cada función y uno en la principal
+PROGRAMA_ERRORES = '''POV uno (a) xD
+x anotado 1
+messirve x.
+v:
+POV dos (a) xD
+y anotado #a bobMar#.
+messirve y.
+v:
+POV tres (a) xD
+siuuu (a chikito) xD
+messirve a.
+v:
+messirve a.
+v:
+maracuya() xD
+r anotado jutsu uno(.
+messirve r.
+v:
+'''
+
+PROGRAMA_CORRECTO = '''POV uno (a) xD
+x anotado #a bobMar 1#.
+messirve x.
+v:
+maracuya() xD
+r anotado jutsu uno(r).
+messirve r.
+v:
+'''
+
+
+def explorar(texto: str) -> list:
+    explorador = Explorador(texto)
+    explorador.explorar()
+    return explorador.componentes
+
+
+def validar(componentes, limite):
+    Validador(componentes, limite).validar()
+
+
+def analizar(componentes, limite):
+    Analizador(componentes, limite).analizar()
+
+
+ANALIZADORES = [analizar, validar]
+
+
+@pytest.mark.parametrize('analizador', ANALIZADORES)
+def test_reporta_todos_los_errores(analizador, capsys):
+    with pytest.raises(SyntaxError, match='4 errores de sintaxis'):
+        analizador(explorar(PROGRAMA_ERRORES), 20)
+
+    assert len(capsys.readouterr().out.splitlines()) == 4
+
+
+@pytest.mark.parametrize('analizador', ANALIZADORES)
+def test_limite_errores(analizador, capsys):
+    with pytest.raises(SyntaxError, match='límite de 2 errores'):
+        analizador(explorar(PROGRAMA_ERRORES), 2)
+
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+@pytest.mark.parametrize('analizador', ANALIZADORES)
+def test_programa_correcto(analizador, capsys):
+    analizador(explorar(PROGRAMA_CORRECTO), 20)
+
+    assert capsys.readouterr().out == ''
+
+
+def test_mismos_diagnosticos_con_y_sin_arbol(capsys):
+    componentes = explorar(PROGRAMA_ERRORES)
+
+    analizador = Analizador(componentes)
+    validador = Validador(componentes)
+    for revisar in (analizador.analizar, validador.validar):
+        with pytest.raises(SyntaxError):
+            revisar()
+
+    assert analizador.diagnosticos == validador.diagnosticos
+    assert analizador.diagnosticos[0].linea == 3
+
+
+def test_arbol_parcial_con_errores(capsys):
+    analizador = Analizador(explorar(PROGRAMA_ERRORES))
+    with pytest.raises(SyntaxError):
+        analizador.analizar()
+
+    errores = [nodo for nodo, _, _ in analizador.ast.iterar_preorden()
+               if nodo.tipo == TipoNodo.ERROR]
+    assert len(errores) == 4
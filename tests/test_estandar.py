@@ -0,0 +1,69 @@
+# Ambiente estándar y funciones nativas declaradas en manifiestos
+
+import json
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.generador import Generador
+from Utils.arbol import ArbolSintaxisAbstracta
+from Utils.tipo_datos import TipoDato
+from Verificador.estandar import (FuncionNativa, ambiente_estandar,
+                                  leer_manifiesto)
+from Verificador.verificador import Verificador
+
+
+def analizar(texto: str) -> ArbolSintaxisAbstracta:
+    explorador = Explorador(texto)
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    return analizador.ast
+
+
+def principal(*instrucciones: str) -> str:
+    return '\n'.join(['maracuya() xD', *instrucciones, 'v:']) + '\n'
+
+
+def test_aridad_de_nativa(capsys):
+    arbol = analizar(principal('a anotado 1.', 'n anotado jutsu nel(a, a).',
+                               'messirve n.'))
+
+    with pytest.raises(TypeError):
+        Verificador(arbol).verificar()
+
+    assert "'nel' recibe 1 argumentos y se invoca con 2" in \
+        capsys.readouterr().out
+
+
+def test_nativa_de_otro_modulo(tmp_path):
+    manifiesto = tmp_path / 'nativas.json'
+    manifiesto.write_text(json.dumps({
+        'modulo': 'mis_nativas',
+        'funciones': [{'nombre': 'cuadrado', 'tipo': 'ENTERO', 'aridad': 1,
+                       'pura': True}]}), encoding='utf-8')
+
+    funciones = leer_manifiesto(str(manifiesto))
+    assert funciones == [FuncionNativa('cuadrado', TipoDato.ENTERO, 1, True,
+                                       'mis_nativas')]
+
+    # Sin registrarlas, el ambiente del proceso no cambia
+    ambiente = ambiente_estandar().extender(funciones)
+    arbol = analizar(principal('a anotado 2.', 'c anotado jutsu cuadrado(a).',
+                               'messirve c.'))
+    Verificador(arbol, ambiente).verificar()
+    codigo = Generador(arbol, ambiente=ambiente).generar_codigo()
+
+    assert ambiente_estandar().nativa('cuadrado') is None
+    assert 'from mis_nativas import cuadrado\n' in codigo
+    assert 'c: int = cuadrado(a)' in codigo
+
+
+def test_manifiesto_invalido(tmp_path):
+    manifiesto = tmp_path / 'nativas.json'
+    manifiesto.write_text('{"funciones": [{"nombre": "x"}]}',
+                          encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        leer_manifiesto(str(manifiesto))
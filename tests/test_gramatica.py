@@ -0,0 +1,77 @@
+# El analizador y el validador se generan desde la misma gramática,
+# deben aceptar y rechazar los mismos programas con los mismos errores
+
+import glob
+import os
+import random
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Analizador.validador import Validador
+from Explorador.explorador import Explorador
+
+EJEMPLOS = sorted(glob.glob(os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'docs', 'ejemplos', '*.cm')))
+
+# Textos con los que se reemplazan componentes en las variantes
+REEMPLAZOS = ['.', 'v:', 'xD', '#', '(', ')', 'x', '1', 'siuuu', 'POV']
+
+
+def explorar(texto: str) -> list:
+    explorador = Explorador(texto)
+    explorador.explorar()
+    return explorador.componentes
+
+
+def variantes(texto: str, cantidad: int = 5):
+    """
+    Programas que resultan de borrar, duplicar o reemplazar algunos
+    componentes del programa, siempre los mismos para cada texto
+    """
+
+    aleatorio = random.Random(texto)
+    valores = [componente.valor for componente in explorar(texto)]
+
+    for _ in range(cantidad):
+        variante = list(valores)
+        for _ in range(aleatorio.randint(1, 3)):
+            indice = aleatorio.randrange(len(variante))
+            cambio = aleatorio.choice('bdr')
+            if cambio == 'b':
+                del variante[indice]
+            elif cambio == 'd':
+                variante.insert(indice, variante[indice])
+            else:
+                variante[indice] = aleatorio.choice(REEMPLAZOS)
+        yield '\n'.join(variante) + '\n'
+
+
+def revisar(revisor, capsys) -> tuple:
+    """
+    Retorna si el programa se aceptó y lo que se reportó
+    """
+
+    try:
+        revisor()
+        aceptado = True
+    except SyntaxError as error:
+        aceptado, mensaje = False, str(error)
+    salida = capsys.readouterr().out
+
+    return aceptado, salida if aceptado else salida + mensaje
+
+
+@pytest.mark.parametrize('ruta', EJEMPLOS, ids=os.path.basename)
+def test_analizador_y_validador_coinciden(ruta, capsys):
+    with open(ruta, encoding='utf-8') as archivo:
+        texto = archivo.read()
+
+    for programa in [texto, *variantes(texto)]:
+        componentes = explorar(programa)
+
+        analizado = revisar(Analizador(componentes).analizar, capsys)
+        validado = revisar(Validador(componentes).validar, capsys)
+
+        assert analizado == validado, programa
@@ -0,0 +1,55 @@
+# Inferencia de tipos: anotaciones en el código generado, las divisiones
+# siempre son `/` y dan flotantes
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.generador import Generador
+from Verificador.verificador import Verificador
+
+
+def generar(texto: str) -> str:
+    """
+    Código de python del programa
+    """
+
+    explorador = Explorador(texto)
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    Verificador(analizador.ast).verificar()
+
+    return Generador(analizador.ast).generar_codigo()
+
+
+def programa(argumento: str) -> str:
+    """
+    `f` divide su parámetro y la principal la invoca con `argumento`
+    """
+
+    return '\n'.join([
+        'POV f(a) xD', 'b anotado #a bobiDir 2#.', 'messirve b.', 'v:',
+        'maracuya() xD', 'n anotado 4.', f'r anotado jutsu f({argumento}).',
+        'messirve r.', 'v:']) + '\n'
+
+
+@pytest.mark.parametrize('valor, resultado', [('7', 3.5), ('-7', -3.5)])
+def test_division_entre_enteros(valor, resultado):
+    codigo = generar(f'maracuya() xD\na anotado {valor}.\n'
+                     'y anotado #a bobiDir 2#.\nmessirve y.\nv:\n')
+    espacio = {}
+    exec(codigo.replace('from Lib.estandar import *\n', ''), espacio)
+
+    assert 'y: float = a / 2\n' in codigo
+    assert espacio['principal']() == resultado
+
+
+@pytest.mark.parametrize('argumento, esperada', [
+    # Todas las invocaciones pasan un entero
+    ('n', 'b: float = a / 2\n'),
+    # `x` no se declara, el parámetro puede ser de cualquier tipo
+    ('x', 'b = a / 2\n'),
+])
+def test_division_con_parametro(argumento, esperada):
+    assert esperada in generar(programa(argumento))
@@ -0,0 +1,94 @@
+# Plegado de constantes (-O) y poda de ramas (-OO)
+
+import symtable
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Generador.generador import Generador
+from Optimizador.optimizador import (PLEGAR_CONSTANTES, PODAR_RAMAS,
+                                     Optimizador)
+from Verificador.verificador import Verificador
+
+
+def generar(texto: str, nivel: int = 0) -> str:
+    """
+    Código de python del programa, optimizado con `nivel`
+    """
+
+    explorador = Explorador(texto)
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    Verificador(analizador.ast).verificar()
+
+    arbol = analizador.ast
+    if nivel:
+        arbol = Optimizador(arbol, nivel).optimizar()
+
+    return Generador(arbol).generar_codigo()
+
+
+def principal(*instrucciones: str) -> str:
+    return '\n'.join(['maracuya() xD', *instrucciones, 'v:']) + '\n'
+
+
+@pytest.mark.parametrize('expresion, esperada', [
+    ('#2 bobTiplicar 3 bobMar x#', '6 + x'),
+    ('#1 bobMar 2 bobTiplicar 3#', '7'),
+    ('#x bobMar 2 bobTiplicar 3#', 'x + 6'),
+])
+def test_plegar_expresion(expresion, esperada):
+    codigo = generar(principal('x anotado 1.', f'y anotado {expresion}.',
+                               'messirve y.'), PLEGAR_CONSTANTES)
+
+    assert f' = {esperada}\n' in codigo
+
+
+@pytest.mark.parametrize('expresion', [
+    # La división se genera con `/` y da un flotante, también entre
+    # literales enteros y con operandos negativos
+    '#7 bobiDir 2#',
+    '#-7 bobiDir 2#',
+    '#x bobiDir 2#',
+    # La división por cero falla al ejecutar, igual que sin optimizar
+    '#1 bobiDir 0#',
+])
+def test_division_sin_plegar(expresion):
+    programa = principal('x anotado 1.', f'y anotado {expresion}.',
+                         'messirve y.')
+
+    assert generar(programa, PLEGAR_CONSTANTES) == generar(programa)
+
+
+def test_comparacion_entre_literales():
+    codigo = generar(principal('siuuu (1 chikito 2) xD', 'messirve 1.',
+                               'v:', 'messirve 0.'), PLEGAR_CONSTANTES)
+
+    assert 'if True' in codigo
+
+
+def test_podar_rama_y_despues_de_messirve():
+    codigo = generar(principal('siuuu (1 tapotente 2) xD', 'messirve 1.',
+                               'v:', 'messirve 0.', 'messirve 2.'),
+                     PODAR_RAMAS)
+
+    assert 'return 1' not in codigo
+    assert 'return 2' not in codigo
+    assert 'return 0' in codigo
+
+
+def locales(codigo: str, funcion: str) -> set:
+    tabla = symtable.symtable(codigo, '<cmamuth>', 'exec')
+    return set(tabla.lookup(funcion).get_namespace().get_locals())
+
+
+def test_podar_conserva_locales():
+    # `x` sólo se asigna después del messirve, sin optimizar la lectura
+    # falla porque `x` es local y todavía no tiene valor
+    programa = 'x anotado 1.\n' + principal('y anotado x.', 'messirve y.',
+                                              'x anotado 2.')
+
+    assert 'x' in locales(generar(programa), 'principal')
+    assert 'x' in locales(generar(programa, PODAR_RAMAS), 'principal')
@@ -0,0 +1,80 @@
+# Reexploración incremental: una edición da los mismos componentes que
+# explorar el texto completo
+
+import os
+
+import pytest
+
+from Explorador.explorador import Explorador
+
+RUTA_EJEMPLO = os.path.join(os.path.dirname(__file__), '..', 'docs',
+                            'ejemplos', 'fibonacci.cm')
+
+
+def explorar(texto: str) -> Explorador:
+    explorador = Explorador(texto)
+    explorador.explorar()
+    return explorador
+
+
+@pytest.fixture(scope='module')
+def texto() -> str:
+    with open(RUTA_EJEMPLO, encoding='utf-8') as archivo:
+        return archivo.read()
+
+
+# (posición relativa al largo del texto, caracteres eliminados, insertado)
+EDICIONES = [
+    (0.0, 0, 'x anotado 1.\n'),
+    (0.3, 0, ' '),
+    (0.3, 4, ''),
+    (0.5, 0, '\nmuchoTexto: comentario\n'),
+    (0.5, 10, 'messirve 1.'),
+    (0.7, 1, '\n\n'),
+    (1.0, 0, '\ny anotado ツholaツ.\n'),
+]
+
+
+@pytest.mark.parametrize('relativa, eliminados, insertado', EDICIONES)
+def test_reexplorar_igual_que_explorar(texto, relativa, eliminados,
+                                       insertado):
+    explorador = explorar(texto)
+    desplazamiento = int(len(texto) * relativa)
+    editado = texto[:desplazamiento] + insertado + \
+        texto[desplazamiento + eliminados:]
+    anteriores = list(explorador.componentes)
+    esperados = list(explorar(editado).componentes)
+
+    cambio = explorador.reexplorar(desplazamiento, eliminados, insertado)
+    nuevos = list(explorador.componentes)
+
+    assert explorador.texto == editado
+    assert nuevos == esperados
+
+    # Fuera del rango que cambió los componentes son los anteriores,
+    # los del final sólo se mueven de línea
+    assert nuevos[:cambio.inicio] == anteriores[:cambio.inicio]
+    assert [componente.valor for componente in nuevos[cambio.fin_nuevo:]] == \
+        [componente.valor for componente in anteriores[cambio.fin_anterior:]]
+
+
+def test_varias_ediciones_seguidas(texto):
+    explorador = explorar(texto)
+    editado = texto
+
+    for relativa, eliminados, insertado in EDICIONES:
+        desplazamiento = int(len(editado) * relativa)
+        editado = editado[:desplazamiento] + insertado + \
+            editado[desplazamiento + eliminados:]
+        explorador.reexplorar(desplazamiento, eliminados, insertado)
+
+    assert list(explorador.componentes) == list(explorar(editado).componentes)
+
+
+def test_reexplorar_con_error(texto, capsys):
+    explorador = explorar(texto)
+
+    with pytest.raises(SyntaxError):
+        explorador.reexplorar(len(texto) // 2, 0, '¬')
+
+    assert 'Componente no identificado' in capsys.readouterr().out
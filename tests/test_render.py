@@ -0,0 +1,85 @@
+# Volcados del árbol y de la tabla de símbolos en JSON y DOT
+
+import io
+import json
+import os
+import re
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arbol import ArbolSintaxisAbstracta, Nodo
+from Utils.arena import ArbolArena
+from Utils.render import escribir_arbol, escribir_verificacion
+from Verificador.verificador import Verificador
+
+RUTA_EJEMPLO = os.path.join(os.path.dirname(__file__), '..', 'docs',
+                            'ejemplos', 'factorial.cm')
+
+
+@pytest.fixture
+def arbol() -> ArbolSintaxisAbstracta:
+    with open(RUTA_EJEMPLO, encoding='utf-8') as archivo:
+        explorador = Explorador(archivo.read())
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    return analizador.ast
+
+
+def volcar(funcion, *argumentos, **opciones) -> str:
+    salida = io.StringIO()
+    funcion(*argumentos, salida, **opciones)
+    return salida.getvalue()
+
+
+def estructura(nodo: Nodo) -> tuple:
+    return (nodo.tipo.name, nodo.contenido,
+            tuple(estructura(hijo) for hijo in nodo.nodos))
+
+
+def estructura_json(objeto: dict) -> tuple:
+    return (objeto['tipo'], objeto.get('contenido'),
+            tuple(estructura_json(hijo) for hijo in objeto.get('nodos', [])))
+
+
+@pytest.mark.parametrize('arena', [False, True])
+def test_json_igual_al_arbol(arbol, arena):
+    esperada = estructura(arbol.raiz)
+    if arena:
+        arbol = ArbolArena.desde_arbol(arbol)
+
+    objeto = json.loads(volcar(escribir_arbol, arbol, formato='json'))
+
+    assert estructura_json(objeto) == esperada
+
+
+def test_json_con_profundidad(arbol):
+    objeto = json.loads(volcar(escribir_arbol, arbol, formato='json',
+                               profundidad=1))
+
+    assert [hijo['omitidos'] for hijo in objeto['nodos']] == \
+        [len(hijo.nodos) for hijo in arbol.raiz.nodos]
+
+
+def test_dot_un_padre_por_nodo(arbol):
+    texto = volcar(escribir_arbol, arbol, formato='dot')
+    nodos = re.findall(r'^  (n\d+) \[label=', texto, re.MULTILINE)
+    aristas = re.findall(r'^  n\d+ -> (n\d+);', texto, re.MULTILINE)
+
+    assert texto.startswith('digraph arbol {\n')
+    assert texto.endswith('}\n')
+    assert len(nodos) == sum(1 for _ in arbol.iterar_preorden())
+    assert sorted(aristas) == sorted(nodos[1:])
+
+
+def test_verificacion_json(arbol):
+    tabla = Verificador(arbol).verificar()
+
+    objeto = json.loads(volcar(escribir_verificacion, tabla, arbol,
+                               formato='json'))
+
+    assert [registro['nombre'] for registro in objeto['tabla_simbolos']] == \
+        [registro.get_nombre() for registro in tabla.iterar_registros()]
+    assert estructura_json(objeto['arbol']) == estructura(arbol.raiz)
@@ -0,0 +1,81 @@
+# Verificación incremental: reverificar después de una edición da lo
+# mismo que verificar el programa completo
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arbol import ArbolSintaxisAbstracta
+from Utils.arena import ArbolArena
+from Verificador.verificador import Verificador
+
+PROGRAMA = '\n'.join([
+    'total anotado 0.',
+    'POV doble(a) xD', 'r anotado #a bobTiplicar 2#.', 'messirve r.', 'v:',
+    'POV usa_doble(a) xD', 'r anotado jutsu doble(a).', 'messirve r.', 'v:',
+    'POV aparte(a) xD', 'i anotado 0.', 'messirve i.', 'v:',
+    'maracuya() xD', 'r anotado jutsu usa_doble(total).', 'messirve r.',
+    'v:',
+]) + '\n'
+
+
+def analizar(texto: str) -> ArbolSintaxisAbstracta:
+    explorador = Explorador(texto)
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    return analizador.ast
+
+
+def resumen(arbol: ArbolSintaxisAbstracta, tabla) -> tuple:
+    """
+    Tipos del árbol y registros de la tabla
+    """
+
+    tipos = [(nodo.tipo, nodo.contenido, nodo.atributos.get('tipo'))
+             for nodo, _, _ in arbol.iterar_preorden()]
+    registros = [(registro.get_nombre(), registro.get_profundidad(),
+                  registro.get_referencia().atributos.get('tipo'))
+                 for registro in tabla.iterar_registros()]
+    return tipos, registros
+
+
+@pytest.fixture
+def anterior() -> dict:
+    verificador = Verificador(analizar(PROGRAMA))
+    verificador.reverificar()
+    return verificador.dependencias
+
+
+@pytest.mark.parametrize('anterior_texto, nuevo_texto, reverificadas', [
+    # Sin cambios no se verifica nada
+    ('total anotado 0.', 'total anotado 0.', set()),
+    # El mismo tipo de retorno, sólo la función editada
+    ('i anotado 0.', 'i anotado 1.', {'aparte'}),
+    # `doble` pasa a retornar texto, también se verifican las que la
+    # invocan
+    ('messirve r.', 'messirve ツxツ.', {'doble', 'usa_doble', None}),
+])
+@pytest.mark.parametrize('arena', [False, True])
+def test_reverificar_igual_que_verificar(anterior, anterior_texto,
+                                         nuevo_texto, reverificadas, arena):
+    editado = PROGRAMA.replace(anterior_texto, nuevo_texto, 1)
+    arbol = analizar(editado)
+    completo = analizar(editado)
+    if arena:
+        arbol = ArbolArena.desde_arbol(arbol)
+        completo = ArbolArena.desde_arbol(completo)
+
+    verificador = Verificador(arbol)
+    tabla = verificador.reverificar(anterior)
+
+    assert {clave[1] for clave in verificador.reverificadas} == reverificadas
+    assert resumen(arbol, tabla) == \
+        resumen(completo, Verificador(completo).verificar())
+
+
+def test_sin_anterior_verifica_todo():
+    verificador = Verificador(analizar(PROGRAMA))
+    verificador.reverificar()
+
+    assert len(verificador.reverificadas) == len(verificador.dependencias)
@@ -0,0 +1,87 @@
+# Alcances de la tabla de símbolos del verificador
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Utils.arbol import Nodo, TipoNodo
+from Verificador.verificador import TablaSimbolos, Verificador
+
+
+def identificador(nombre: str) -> Nodo:
+    return Nodo(TipoNodo.IDENTIFICADOR, nombre)
+
+
+def verificar(texto: str) -> None:
+    explorador = Explorador(texto)
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+    Verificador(analizador.ast).verificar()
+
+
+def test_bloque_interno_oculta_al_externo():
+    tabla = TablaSimbolos()
+    externo = identificador('x')
+    interno = identificador('x')
+
+    tabla.nuevo_registro(externo)
+    tabla.nuevo_bloque()
+    tabla.nuevo_registro(interno)
+    assert tabla.verificar_existencia('x', interno).get_referencia() is interno
+
+    tabla.eliminar_bloque()
+    assert tabla.verificar_existencia('x', externo).get_referencia() is externo
+
+
+def test_primera_declaracion_del_bloque():
+    tabla = TablaSimbolos()
+    primera = identificador('x')
+
+    tabla.nuevo_registro(primera)
+    tabla.nuevo_registro(identificador('x'))
+
+    assert tabla.verificar_existencia('x', primera).get_referencia() is primera
+
+
+def test_registro_no_visible_hasta_activarlo(capsys):
+    tabla = TablaSimbolos()
+    nodo = identificador('i')
+
+    registro = tabla.nuevo_registro(nodo, visible=False)
+    with pytest.raises(NameError):
+        tabla.verificar_existencia('i', nodo)
+
+    tabla.activar_registro(registro)
+    assert tabla.verificar_existencia('i', nodo) is registro
+
+
+def test_eliminar_bloque_anidado(capsys):
+    tabla = TablaSimbolos()
+    nodo = identificador('y')
+
+    tabla.nuevo_bloque()
+    tabla.nuevo_registro(identificador('y'))
+    tabla.nuevo_bloque()
+    tabla.nuevo_registro(identificador('z'))
+    tabla.eliminar_bloque()
+    tabla.eliminar_bloque()
+
+    assert tabla.simbolos == []
+    with pytest.raises(NameError):
+        tabla.verificar_existencia('y', nodo)
+
+
+@pytest.mark.parametrize('instrucciones', [
+    # La variable del siuuu no existe fuera de él
+    ['siuuu (1 chikito 2) xD', 'z anotado 3.', 'v:', 'messirve z.'],
+    # El valor se verifica antes de declarar la variable
+    ['i anotado #i bobMar 1#.', 'messirve i.'],
+])
+def test_identificador_fuera_de_alcance(instrucciones, capsys):
+    programa = '\n'.join(['maracuya() xD', *instrucciones, 'v:']) + '\n'
+
+    with pytest.raises(NameError):
+        verificar(programa)
+
+    assert 'no está declarado' in capsys.readouterr().out
@@ -0,0 +1,71 @@
+# Verificación en varios procesos: el mismo resultado que en uno solo
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from Analizador.analizador import Analizador
+from Explorador.explorador import Explorador
+from Verificador.verificador import MINIMO_FUNCIONES_PARALELO, Verificador
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CMAMUTH = os.path.join(RAIZ, 'cmamuth.py')
+
+
+def programa(global_antes: bool) -> str:
+    """
+    Suficientes funciones para verificar en paralelo y `usa`, que lee la
+    global `x`. `usa` espera a `f0`, que se verifica en otro proceso,
+    mientras `x` ya se verificó en este
+    """
+
+    lineas = []
+    for funcion in range(MINIMO_FUNCIONES_PARALELO + 4):
+        lineas += [f'POV f{funcion} (a) xD', 'i anotado 0.', 'messirve i.',
+                   'v:']
+
+    usa = ['POV usa (a) xD', 'c anotado jutsu f0(a).', 'b anotado x.',
+           'messirve b.', 'v:']
+    if global_antes:
+        lineas += ['x anotado 1.', *usa]
+    else:
+        lineas += [*usa, 'x anotado 1.']
+
+    lineas += ['maracuya() xD', 'messirve 0.', 'v:']
+    return '\n'.join(lineas) + '\n'
+
+
+def cmamuth(*opciones) -> subprocess.CompletedProcess:
+    entorno = dict(os.environ)
+    entorno['PYTHONPATH'] = os.pathsep.join(
+        filter(None, [RAIZ, entorno.get('PYTHONPATH')]))
+
+    return subprocess.run([sys.executable, CMAMUTH, *map(str, opciones)],
+                          env=entorno, capture_output=True, text=True)
+
+
+@pytest.mark.parametrize('global_antes', [True, False])
+def test_misma_salida_con_procesos(global_antes, tmp_path):
+    ruta = tmp_path / 'programa.cm'
+    ruta.write_text(programa(global_antes), encoding='utf-8')
+
+    secuencial = cmamuth('-v', ruta)
+    paralelo = cmamuth('-p', 4, '-v', ruta)
+
+    assert (paralelo.returncode, paralelo.stdout) == \
+        (secuencial.returncode, secuencial.stdout)
+    assert ('no está declarado' in secuencial.stdout) != global_antes
+
+
+def test_reverificar_con_procesos(capsys):
+    explorador = Explorador(programa(global_antes=False))
+    explorador.explorar()
+    analizador = Analizador(explorador.componentes)
+    analizador.analizar()
+
+    with pytest.raises(NameError):
+        Verificador(analizador.ast).reverificar(procesos=4)
+
+    assert "'x' (Linea: " in capsys.readouterr().out
@@ -1,7 +1,8 @@
-from copy import deepcopy
+import sys
 from enum import Enum, auto
-from typing import List
+from typing import Iterator, Optional, Sequence, TextIO, Tuple
 
+from Utils.archivos import escribir_bloques
 from Utils.tipo_datos import TipoDato
 
 
@@ -35,49 +36,112 @@ class TipoNodo(Enum):
     OPERADOR_LOGICO = auto()
     COMPARADOR = auto()
     INVOCACION = auto()
+    ERROR = auto()
+
+
+# Nombre de cada tipo de nodo, más rápido que pedir `name` al Enum
+NOMBRES_TIPO_NODO = {tipo: tipo.name for tipo in TipoNodo}
 
 
 class Nodo:
     """
     Clase que almacena la informacion de un componente lexico
     para que puedan ser agregados al arbol de sintaxis abstracta.
+
+    La línea y columna se guardan como campos. Los demás atributos
+    (como el tipo que asigna el verificador) van en un diccionario
+    que se crea hasta que se usa, la mayoría de nodos nunca lo necesita.
+    Los nodos sin hijos comparten una tupla vacía en lugar de una lista
     """
 
+    __slots__ = ('tipo', 'contenido', 'nodos', 'linea', 'columna',
+                 '__atributos')
+
     tipo: TipoNodo
-    nodos: List['Nodo']
+    nodos: Sequence['Nodo']
     contenido: str
-    atributos: dict
+    linea: Optional[int]
+    columna: Optional[int]
 
-    def __init__(self, tipo, contenido=None, nodos=[], atributos={}):
+    def __init__(self, tipo, contenido=None, nodos=(), atributos=None,
+                 linea=None, columna=None):
         self.tipo = tipo
         self.contenido = contenido
         self.nodos = nodos
-        self.atributos = deepcopy(atributos)
-    
+        self.linea = linea
+        self.columna = columna
+        self.__atributos = None
+
+        # La línea y columna también se aceptan en los atributos
+        if atributos:
+            atributos = dict(atributos)
+            self.linea = atributos.pop('linea', linea)
+            self.columna = atributos.pop('columna', columna)
+            self.__atributos = atributos or None
+
+    @property
+    def atributos(self) -> dict:
+        """
+        Atributos adicionales del nodo, el diccionario se crea
+        la primera vez que se pide
+        """
+
+        if self.__atributos is None:
+            self.__atributos = {}
+        return self.__atributos
+
     # Metodo pendiente a revisar
     def visitar(self, visitante):
         return visitante.visitar(self)
 
+    def iterar_atributos(self):
+        """
+        Itera los atributos adicionales sin crear el diccionario
+        """
+
+        if self.__atributos:
+            return iter(self.__atributos.items())
+        return iter(())
+
     def __str__(self):
         """
         Formato para imprimir el nodo y su contenido
         """
 
-        # Colocar la información del nombre del nodo
-        res = f'{self.tipo.name}'
+        return formatear_nodo(self)
+
+
+def formatear_nodo(nodo, posicion: Optional[tuple] = None) -> str:
+    """
+    Formato para imprimir un nodo y su contenido, sirve para
+    cualquier nodo con tipo, contenido, posición y atributos.
+    Con `posicion` se usa esa línea y columna en lugar de las del nodo
+    """
+
+    linea, columna = (nodo.linea, nodo.columna) if posicion is None \
+        else posicion
+
+    # Colocar la información del nombre del nodo
+    res = NOMBRES_TIPO_NODO[nodo.tipo]
+
+    # Colocar el contenido de texto del nodo
+    if nodo.contenido is not None:
+        res = f'{res}  {nodo.contenido!r}'
+
+    # Coloca la posición y los atributos de forma (llave : valor)
+    atributos = ''
+    if linea is not None:
+        atributos = f' (linea : {linea})  (columna : {columna}) '
 
-        # Colocar el contenido de texto del nodo
-        if self.contenido is not None:
-            res += f'  {self.contenido!r}'
+    for llave, valor in nodo.iterar_atributos():
+        if isinstance(valor, TipoDato):
+            valor = valor.name
+        atributos += ' (%s : %s) ' % (llave, valor)
 
-        # Coloca los atributos de forma (llave : valor)
-        if self.atributos != {}:
-            for (llave,valor) in self.atributos.items():
-                if isinstance(valor,TipoDato): valor = valor.name
-                res += ' (%s : %s) ' % (llave,valor)
-            res += '\n'          
+    if atributos:
+        res = f'{res}{atributos}\n'
 
-        return res
+    return res
 
 
 class ArbolSintaxisAbstracta:
@@ -88,30 +152,59 @@ class ArbolSintaxisAbstracta:
 
     raiz: Nodo
 
-    def imprimir_preorden(self) -> None:
+    def imprimir_preorden(self, salida: Optional[TextIO] = None,
+                          profundidad: Optional[int] = None) -> None:
         """
-        Imprimir el preorden siempre toma la raiz del arbol
-        """
-        
-        self.__preorden(self.raiz)
+        Imprimir los nodos con un tabulado especifico
+            <Nodo Padre>
+                    |_  <Nodo Hijo 1>
+                    |_  <Nodo Hijo N>
 
-    def imprimir_nodo(self, nodo: Nodo, nivel: int) -> None:
-        """
-        Mostrar el nodo con un tabulado dado por el nivel
+        Las líneas se escriben por bloques en `salida` (la salida
+        estándar si no se indica). Con `profundidad` los nodos más
+        profundos se omiten y se indica cuántos hijos se omitieron
         """
 
-        tabulado = ' ' * nivel * 3 + "|__" if self.raiz is not nodo else ""
-        print(f'{tabulado}{nodo}')
+        salida = sys.stdout if salida is None else salida
+
+        if self.raiz is None:
+            salida.write('None\n')
+            return
+
+        escribir_bloques(salida, self.__lineas_preorden(profundidad))
+
+    def __lineas_preorden(self, profundidad: Optional[int]) -> Iterator[str]:
+        tabulados = [""]
+
+        for nodo, nivel, posicion in self.iterar_preorden(profundidad):
+            while len(tabulados) <= nivel:
+                tabulados.append(' ' * len(tabulados) * 3 + "|__")
 
-    def __preorden(self, nodo: Nodo, nivel=0) -> None:
+            yield f'{tabulados[nivel]}{formatear_nodo(nodo, posicion)}\n'
+
+            if nivel == profundidad and nodo.nodos:
+                tabulado = ' ' * (nivel + 1) * 3 + "|__"
+                yield f'{tabulado}... ({len(nodo.nodos)} hijos omitidos)\n'
+
+    def iterar_preorden(self, profundidad: Optional[int] = None
+                        ) -> Iterator[Tuple[Nodo, int, Optional[tuple]]]:
         """
-        Imprimir los nodos con un tabulado especifico
-            <Nodo Padre>
-                    |_  <Nodo Hijo 1>
-                    |_  <Nodo Hijo N>
+        Recorre el árbol en preorden sin recursión, para soportar árboles
+        con cualquier profundidad de anidamiento. Genera el nodo, su
+        nivel y su posición (None si es la del propio nodo), sin bajar
+        de `profundidad`
         """
-        self.imprimir_nodo(nodo, nivel)
 
-        if nodo is not None:
-            for nodo in nodo.nodos:
-                self.__preorden(nodo, nivel=nivel+1)
+        if self.raiz is None:
+            return
+
+        pendientes = [(self.raiz, 0)]
+
+        while pendientes:
+            nodo, nivel = pendientes.pop()
+            yield nodo, nivel, None
+
+            if nodo.nodos and (profundidad is None or nivel < profundidad):
+                nivel += 1
+                pendientes.extend([(hijo, nivel)
+                                   for hijo in reversed(nodo.nodos)])
@@ -1,5 +1,8 @@
 # Manejar los archivos .cm
 
+from typing import Iterable, Iterator, TextIO
+
+
 def cargar_archivo(ruta) -> str:
     """
     Carga una ruta de archivo y retorna
@@ -8,3 +11,36 @@ def cargar_archivo(ruta) -> str:
     with open(ruta, "r") as archivo:
         contenido = archivo.read()
     return contenido
+
+
+def cargar_bloques(ruta, tamano_bloque=1 << 16) -> Iterator[str]:
+    """
+    Carga una ruta de archivo y retorna su contenido por bloques
+    de aproximadamente `tamano_bloque` caracteres, alineados
+    al final de una línea.
+    """
+    with open(ruta, "r") as archivo:
+        while True:
+            lineas = archivo.readlines(tamano_bloque)
+            if not lineas:
+                break
+            yield ''.join(lineas)
+
+
+def escribir_bloques(salida: TextIO, partes: Iterable[str],
+                     tamano_bloque=1 << 16) -> None:
+    """
+    Escribe las partes en la salida uniéndolas en bloques de
+    aproximadamente `tamano_bloque` caracteres, en lugar de una
+    escritura por parte.
+    """
+    bloque = []
+    largo = 0
+    for parte in partes:
+        bloque.append(parte)
+        largo += len(parte)
+        if largo >= tamano_bloque:
+            salida.write(''.join(bloque))
+            bloque.clear()
+            largo = 0
+    salida.write(''.join(bloque))
@@ -0,0 +1,491 @@
+import struct
+import sys
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from Utils.arbol import ArbolSintaxisAbstracta, TipoNodo, formatear_nodo
+from Utils.tipo_datos import TipoDato
+
+# Tipos de nodo y de dato por su valor, el 0 queda libre para indicar
+# que no hay tipo de dato
+TIPOS_NODO = {tipo.value: tipo for tipo in TipoNodo}
+TIPOS_DATO = {tipo.value: tipo for tipo in TipoDato}
+
+SIN_NODO = -1
+
+# Encabezado de la arena serializada: firma, orden de bytes,
+# cantidad de nodos y cantidad de cadenas
+ENCABEZADO = struct.Struct('<4scII')
+FIRMA = b'CMAR'
+
+
+class ArenaNodos:
+    """
+    Guarda un árbol completo en arreglos paralelos, un nodo es una
+    posición en los arreglos:
+
+        tipos            valor del TipoNodo
+        contenidos       índice en la tabla de cadenas o -1
+        primeros_hijos   índice del primer hijo o -1
+        siguientes       índice del siguiente hermano o -1
+        padres           índice del padre o -1
+        lineas/columnas  posición en el código fuente, 0 si no tiene
+        tipos_dato       valor del TipoDato que asigna el verificador,
+                         0 si no tiene
+
+    Los nodos se guardan en preorden, así un subárbol ocupa un rango
+    continuo de posiciones. Las cadenas de contenido se internalizan en
+    una tabla, un identificador que se repite se guarda una sola vez.
+    """
+
+    tipos: array
+    contenidos: array
+    primeros_hijos: array
+    siguientes: array
+    padres: array
+    lineas: array
+    columnas: array
+    tipos_dato: array
+    cadenas: List[str]
+    indices_cadenas: Dict[str, int]
+    extras: Dict[int, dict]
+    adaptadores: Dict[int, 'NodoArena']
+
+    def __init__(self):
+        self.tipos = array('B')
+        self.contenidos = array('i')
+        self.primeros_hijos = array('i')
+        self.siguientes = array('i')
+        self.padres = array('i')
+        self.lineas = array('i')
+        self.columnas = array('i')
+        self.tipos_dato = array('B')
+        self.cadenas = []
+        self.indices_cadenas = {}
+
+        # Atributos que no caben en las columnas, por nodo
+        self.extras = {}
+
+        # NodoArena ya creados, sólo existen para los nodos que se
+        # recorren por medio del adaptador
+        self.adaptadores = {}
+
+    def __len__(self) -> int:
+        return len(self.tipos)
+
+    def __getstate__(self) -> dict:
+        estado = self.__dict__.copy()
+        estado['adaptadores'] = {}
+        return estado
+
+    def nodo(self, indice: int) -> 'NodoArena':
+        """
+        Devuelve el NodoArena de la posición, siempre el mismo objeto
+        para que los recorridos repetidos no creen adaptadores nuevos
+        """
+
+        adaptador = self.adaptadores.get(indice)
+        if adaptador is None:
+            adaptador = NodoArena(self, indice)
+            self.adaptadores[indice] = adaptador
+
+        return adaptador
+
+    @classmethod
+    def desde_nodo(cls, raiz) -> 'ArenaNodos':
+        """
+        Construye la arena a partir de un árbol de Nodo (o de NodoArena)
+        sin recursión
+        """
+
+        arena = cls()
+        ultimos_hijos = array('i')
+
+        # Métodos locales, se llaman una vez por nodo
+        agregar_tipo = arena.tipos.append
+        agregar_contenido = arena.contenidos.append
+        agregar_linea = arena.lineas.append
+        agregar_columna = arena.columnas.append
+        agregar_padre = arena.padres.append
+        internar = arena.internar
+        primeros_hijos = arena.primeros_hijos
+        siguientes = arena.siguientes
+
+        pendientes = [(raiz, SIN_NODO)]
+        indice = 0
+
+        while pendientes:
+            nodo, padre = pendientes.pop()
+
+            agregar_tipo(nodo.tipo.value)
+            agregar_contenido(internar(nodo.contenido))
+            agregar_linea(nodo.linea or 0)
+            agregar_columna(nodo.columna or 0)
+            agregar_padre(padre)
+            primeros_hijos.append(SIN_NODO)
+            siguientes.append(SIN_NODO)
+            arena.tipos_dato.append(0)
+            ultimos_hijos.append(SIN_NODO)
+
+            for llave, valor in nodo.iterar_atributos():
+                arena.asignar_atributo(indice, llave, valor)
+
+            # Se enlaza como primer hijo o como siguiente hermano
+            if padre != SIN_NODO:
+                anterior = ultimos_hijos[padre]
+                if anterior == SIN_NODO:
+                    primeros_hijos[padre] = indice
+                else:
+                    siguientes[anterior] = indice
+                ultimos_hijos[padre] = indice
+
+            hijos = nodo.nodos
+            if hijos:
+                pendientes.extend([(hijo, indice) for hijo in reversed(hijos)])
+
+            indice += 1
+
+        return arena
+
+    def internar(self, cadena: Optional[str]) -> int:
+        """
+        Devuelve el índice de la cadena en la tabla, la agrega si no está
+        """
+
+        if cadena is None:
+            return SIN_NODO
+
+        indice = self.indices_cadenas.get(cadena)
+        if indice is None:
+            indice = len(self.cadenas)
+            self.cadenas.append(cadena)
+            self.indices_cadenas[cadena] = indice
+
+        return indice
+
+    def hijos(self, indice: int) -> Iterator[int]:
+        """
+        Itera los índices de los hijos de un nodo
+        """
+
+        hijo = self.primeros_hijos[indice]
+        while hijo != SIN_NODO:
+            yield hijo
+            hijo = self.siguientes[hijo]
+
+    def fin_subarbol(self, indice: int) -> int:
+        """
+        Posición siguiente al último nodo del subárbol de `indice`
+        """
+
+        while indice != SIN_NODO and self.siguientes[indice] == SIN_NODO:
+            indice = self.padres[indice]
+
+        if indice == SIN_NODO:
+            return len(self.tipos)
+
+        return self.siguientes[indice]
+
+    def preorden(self, inicio: int = 0, profundidad: Optional[int] = None
+                 ) -> Iterator[Tuple[int, int]]:
+        """
+        Itera (índice, nivel) del subárbol de `inicio` en preorden,
+        como los nodos ya están en preorden es un recorrido de índices.
+        Con `profundidad` se salta el resto del subárbol de los nodos
+        en ese nivel
+        """
+
+        fin = self.fin_subarbol(inicio)
+        padres = self.padres
+        niveles = array('i', bytes(4 * (fin - inicio)))
+
+        indice = inicio
+        while indice < fin:
+            nivel = niveles[padres[indice] - inicio] + 1 \
+                if indice != inicio else 0
+            niveles[indice - inicio] = nivel
+            yield indice, nivel
+
+            if nivel == profundidad:
+                indice = self.fin_subarbol(indice)
+            else:
+                indice += 1
+
+    def obtener_atributo(self, indice: int, llave: str, predeterminado=None):
+        """
+        Devuelve un atributo del nodo, el tipo se lee de su columna
+        """
+
+        if llave == 'tipo' and self.tipos_dato[indice]:
+            return TIPOS_DATO[self.tipos_dato[indice]]
+
+        return self.extras.get(indice, {}).get(llave, predeterminado)
+
+    def asignar_atributo(self, indice: int, llave: str, valor) -> None:
+        """
+        Asigna un atributo al nodo, un TipoDato como tipo va en su columna
+        """
+
+        if llave == 'tipo' and isinstance(valor, TipoDato):
+            self.tipos_dato[indice] = valor.value
+            self.eliminar_atributo(indice, llave, columna=False)
+            return
+
+        if llave == 'tipo':
+            self.tipos_dato[indice] = 0
+        self.extras.setdefault(indice, {})[llave] = valor
+
+    def eliminar_atributo(self, indice: int, llave: str,
+                          columna: bool = True) -> None:
+        """
+        Elimina un atributo del nodo
+        """
+
+        if columna and llave == 'tipo':
+            self.tipos_dato[indice] = 0
+
+        extras = self.extras.get(indice)
+        if extras:
+            extras.pop(llave, None)
+            if not extras:
+                del self.extras[indice]
+
+    def iterar_atributos(self, indice: int) -> Iterator[Tuple[str, object]]:
+        """
+        Itera los atributos del nodo, primero el tipo
+        """
+
+        if self.tipos_dato[indice]:
+            yield 'tipo', TIPOS_DATO[self.tipos_dato[indice]]
+
+        yield from self.extras.get(indice, {}).items()
+
+    def subarbol(self, indice: int) -> 'ArenaNodos':
+        """
+        Copia el subárbol de `indice` en una arena nueva donde
+        es la raíz
+        """
+
+        fin = self.fin_subarbol(indice)
+        arena = ArenaNodos()
+
+        def reubicar(referencias: array) -> array:
+            return array('i', (referencia - indice
+                               if indice <= referencia < fin else SIN_NODO
+                               for referencia in referencias[indice:fin]))
+
+        arena.tipos = self.tipos[indice:fin]
+        arena.contenidos = array('i', (
+            arena.internar(self.cadenas[contenido])
+            if contenido != SIN_NODO else SIN_NODO
+            for contenido in self.contenidos[indice:fin]))
+        arena.primeros_hijos = reubicar(self.primeros_hijos)
+        arena.siguientes = reubicar(self.siguientes)
+        arena.padres = reubicar(self.padres)
+        arena.lineas = self.lineas[indice:fin]
+        arena.columnas = self.columnas[indice:fin]
+        arena.tipos_dato = self.tipos_dato[indice:fin]
+        arena.extras = {nodo - indice: dict(extras)
+                        for nodo, extras in self.extras.items()
+                        if indice <= nodo < fin}
+
+        return arena
+
+    def a_bytes(self) -> bytes:
+        """
+        Serializa la arena para enviarla a otro proceso o guardarla.
+        Los atributos fuera de las columnas no se incluyen
+        """
+
+        cadenas = [cadena.encode('utf-8') for cadena in self.cadenas]
+        largos = array('I', (len(cadena) for cadena in cadenas))
+
+        partes = [ENCABEZADO.pack(FIRMA, sys.byteorder[0].encode(),
+                                  len(self.tipos), len(cadenas))]
+        partes += [columna.tobytes() for columna in self.__columnas()]
+        partes += [largos.tobytes()] + cadenas
+
+        return b''.join(partes)
+
+    @classmethod
+    def desde_bytes(cls, datos: bytes) -> 'ArenaNodos':
+        """
+        Reconstruye una arena serializada con `a_bytes`
+        """
+
+        firma, orden, cantidad, cantidad_cadenas = \
+            ENCABEZADO.unpack_from(datos)
+        if firma != FIRMA:
+            raise ValueError('Los datos no son una arena de nodos')
+
+        arena = cls()
+        desplazamiento = ENCABEZADO.size
+        voltear = orden != sys.byteorder[0].encode()
+
+        def leer(columna: array, elementos: int) -> None:
+            nonlocal desplazamiento
+            largo = elementos * columna.itemsize
+            columna.frombytes(datos[desplazamiento:desplazamiento + largo])
+            if voltear:
+                columna.byteswap()
+            desplazamiento += largo
+
+        for columna in arena.__columnas():
+            leer(columna, cantidad)
+
+        largos = array('I')
+        leer(largos, cantidad_cadenas)
+
+        for largo in largos:
+            cadena = datos[desplazamiento:desplazamiento + largo]
+            arena.internar(cadena.decode('utf-8'))
+            desplazamiento += largo
+
+        return arena
+
+    def __columnas(self) -> List[array]:
+        return [self.tipos, self.contenidos, self.primeros_hijos,
+                self.siguientes, self.padres, self.lineas, self.columnas,
+                self.tipos_dato]
+
+
+class AtributosArena(MutableMapping):
+    """
+    Diccionario de atributos de un nodo de la arena, lee y escribe
+    directamente en sus columnas
+    """
+
+    __slots__ = ('arena', 'indice')
+
+    def __init__(self, arena: ArenaNodos, indice: int):
+        self.arena = arena
+        self.indice = indice
+
+    def __getitem__(self, llave: str):
+        valor = self.arena.obtener_atributo(self.indice, llave, KeyError)
+        if valor is KeyError:
+            raise KeyError(llave)
+        return valor
+
+    def __setitem__(self, llave: str, valor) -> None:
+        self.arena.asignar_atributo(self.indice, llave, valor)
+
+    def __delitem__(self, llave: str) -> None:
+        if llave not in self:
+            raise KeyError(llave)
+        self.arena.eliminar_atributo(self.indice, llave)
+
+    def __iter__(self) -> Iterator[str]:
+        return (llave for llave, _ in
+                self.arena.iterar_atributos(self.indice))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.arena.iterar_atributos(self.indice))
+
+
+class NodoArena:
+    """
+    Adaptador que presenta una posición de la arena como un Nodo, para
+    que los visitantes del verificador y del generador recorran la
+    arena sin cambios
+    """
+
+    __slots__ = ('arena', 'indice', 'hijos')
+
+    arena: ArenaNodos
+    indice: int
+    hijos: Optional[List['NodoArena']]
+
+    def __init__(self, arena: ArenaNodos, indice: int):
+        self.arena = arena
+        self.indice = indice
+        self.hijos = None
+
+    def __reduce__(self):
+        # Se serializa sólo la posición, no los hijos ya adaptados
+        return self.arena.nodo, (self.indice,)
+
+    @property
+    def tipo(self) -> TipoNodo:
+        return TIPOS_NODO[self.arena.tipos[self.indice]]
+
+    @property
+    def contenido(self) -> Optional[str]:
+        contenido = self.arena.contenidos[self.indice]
+        if contenido == SIN_NODO:
+            return None
+        return self.arena.cadenas[contenido]
+
+    @property
+    def linea(self) -> Optional[int]:
+        return self.arena.lineas[self.indice] or None
+
+    @property
+    def columna(self) -> Optional[int]:
+        return self.arena.columnas[self.indice] or None
+
+    @property
+    def nodos(self) -> List['NodoArena']:
+        if self.hijos is None:
+            self.hijos = [self.arena.nodo(hijo)
+                          for hijo in self.arena.hijos(self.indice)]
+        return self.hijos
+
+    @property
+    def atributos(self) -> AtributosArena:
+        return AtributosArena(self.arena, self.indice)
+
+    def iterar_atributos(self) -> Iterator[Tuple[str, object]]:
+        return self.arena.iterar_atributos(self.indice)
+
+    def visitar(self, visitante):
+        return visitante.visitar(self)
+
+    def __eq__(self, otro) -> bool:
+        return isinstance(otro, NodoArena) and \
+            self.arena is otro.arena and self.indice == otro.indice
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.indice))
+
+    def __str__(self):
+        return formatear_nodo(self)
+
+
+class ArbolArena(ArbolSintaxisAbstracta):
+    """
+    Árbol de sintaxis abstracta guardado en una ArenaNodos, la raíz es
+    un NodoArena para que el verificador y el generador lo recorran
+    igual que un árbol de Nodo
+    """
+
+    arena: ArenaNodos
+
+    def __init__(self, arena: ArenaNodos):
+        self.arena = arena
+        self.raiz = arena.nodo(0) if len(arena) else None
+
+    @classmethod
+    def desde_arbol(cls, arbol: ArbolSintaxisAbstracta) -> 'ArbolArena':
+        """
+        Convierte un árbol de Nodo en un árbol en arena
+        """
+
+        if arbol.raiz is None:
+            return cls(ArenaNodos())
+
+        return cls(ArenaNodos.desde_nodo(arbol.raiz))
+
+    def iterar_preorden(self, profundidad: Optional[int] = None
+                        ) -> Iterator[Tuple[NodoArena, int, None]]:
+        """
+        Recorre el árbol con un ciclo sobre los índices de la arena, los
+        adaptadores se crean sólo para el recorrido
+        """
+
+        if self.raiz is None:
+            return
+
+        for indice, nivel in self.arena.preorden(profundidad=profundidad):
+            yield NodoArena(self.arena, indice), nivel, None
@@ -0,0 +1,244 @@
+# Caché en disco de los resultados de cada etapa del compilador
+
+import hashlib
+import os
+import pickle
+import sys
+from enum import Enum
+from typing import Optional, Sequence, Tuple
+
+from Utils.arena import ArenaNodos
+
+# Se cambia con cada versión del compilador que cambie el formato de
+# algún artefacto o el resultado de alguna etapa, es lo que invalida
+# los artefactos guardados
+VERSION_COMPILADOR = '2'
+
+DIRECTORIO_CACHE = '.cmcache'
+
+# Tamaño máximo de la caché, al superarlo se eliminan los artefactos
+# usados hace más tiempo
+TAMANO_MAXIMO_CACHE = 64 * 2**20
+
+# Etapas en orden, cada una parte del artefacto de la anterior
+ETAPAS = ('componentes', 'arbol', 'verificado', 'python')
+
+# Artefacto guardado por ruta con lo que la verificación incremental
+# recuerda de cada unidad
+DEPENDENCIAS = 'dependencias'
+
+# Artefacto con el objeto de código compilado que ejecuta --ejecutar,
+# sale del árbol verificado igual que el código generado
+BYTECODE = 'bytecode'
+
+# Clases que pueden aparecer en un artefacto, al cargar no se crea
+# ningún otro objeto. Así un archivo dentro de la caché no puede
+# ejecutar código como lo permite pickle
+CLASES_ARTEFACTOS = frozenset({
+    ('array', 'array'),
+    ('array', '_array_reconstructor'),
+    ('Explorador.componentes', 'BufferComponentes'),
+    ('Explorador.componentes', 'ComponenteLexico'),
+    ('Utils.arena', 'ArbolArena'),
+    ('Utils.arena', 'ArenaNodos'),
+    ('Utils.arena', 'NodoArena'),
+    ('Utils.registro', 'Registro'),
+    ('Utils.tipo_datos', 'TipoDato'),
+    ('Verificador.estandar', 'FuncionNativa'),
+    ('Verificador.estandar', '_reconstruir'),
+    ('Verificador.verificador', 'DependenciasUnidad'),
+    ('Verificador.verificador', 'ResultadoUnidad'),
+    ('Verificador.verificador', 'TablaSimbolos'),
+})
+
+
+def firma_compilador() -> str:
+    """
+    Versión del compilador y de python que guardó los artefactos, no
+    depende de los archivos del compilador así que no se recorren en
+    cada ejecución
+    """
+
+    return f'{VERSION_COMPILADOR}-{sys.implementation.cache_tag}'
+
+
+def directorio_cache(ruta) -> str:
+    """
+    Directorio de la caché de un archivo fuente, junto al archivo y no
+    en el directorio desde el que se ejecuta el compilador
+    """
+
+    return os.path.join(os.path.dirname(os.path.realpath(ruta)),
+                        DIRECTORIO_CACHE)
+
+
+def _obtener_atributo(objeto, nombre: str):
+    """
+    Reemplaza a getattr al cargar un artefacto, pickle lo usa para los
+    miembros de las enumeraciones y para los NodoArena, que se guardan
+    como el método `nodo` de su arena
+    """
+
+    if isinstance(objeto, type) and issubclass(objeto, Enum) and \
+            nombre in objeto.__members__:
+        return objeto[nombre]
+
+    if isinstance(objeto, ArenaNodos) and nombre == 'nodo':
+        return objeto.nodo
+
+    raise pickle.UnpicklingError(f'Atributo no permitido {nombre!r}')
+
+
+class _CargadorArtefactos(pickle.Unpickler):
+    """
+    Unpickler que sólo crea las clases de CLASES_ARTEFACTOS
+    """
+
+    def find_class(self, modulo: str, nombre: str):
+        if (modulo, nombre) == ('builtins', 'getattr'):
+            return _obtener_atributo
+
+        if (modulo, nombre) not in CLASES_ARTEFACTOS:
+            raise pickle.UnpicklingError(
+                f'Clase no permitida en la caché {modulo}.{nombre}')
+
+        return super().find_class(modulo, nombre)
+
+
+def clave_archivo(ruta, opciones: Sequence[str] = (),
+                  tamano_bloque=1 << 16) -> str:
+    """
+    Clave de un archivo fuente: hash de su contenido, de la versión del
+    compilador y de las opciones que cambian el resultado
+    """
+
+    clave = hashlib.sha256(firma_compilador().encode())
+    for opcion in opciones:
+        clave.update(f'\0{opcion}'.encode())
+    clave.update(b'\0')
+
+    with open(ruta, 'rb') as archivo:
+        while bloque := archivo.read(tamano_bloque):
+            clave.update(bloque)
+
+    return clave.hexdigest()
+
+
+def clave_ruta(ruta, opciones: Sequence[str] = ()) -> str:
+    """
+    Clave de la ruta de un archivo fuente sin importar su contenido,
+    para los artefactos que sirven entre versiones del mismo archivo
+    como las dependencias de la verificación incremental
+    """
+
+    clave = hashlib.sha256(firma_compilador().encode())
+    for opcion in opciones:
+        clave.update(f'\0{opcion}'.encode())
+    clave.update(f'\0{os.path.realpath(ruta)}'.encode())
+
+    return clave.hexdigest()
+
+
+class CacheArtefactos:
+    """
+    Guarda en disco el artefacto de cada etapa (componentes, árbol,
+    árbol verificado con su tabla de símbolos y código generado)
+    direccionado por la clave del archivo fuente
+
+    Cada artefacto es un archivo `<clave>.<etapa>` dentro del directorio
+    de la caché, junto al archivo fuente. Al cargar un artefacto sólo se
+    crean las clases de los artefactos y se actualiza su fecha de
+    modificación, al guardar se eliminan los de fecha más antigua hasta
+    que la caché quepa en `tamano_maximo`, es decir, se descartan los
+    menos usados recientemente
+    """
+
+    directorio: str
+    tamano_maximo: int
+
+    def __init__(self, directorio: str,
+                 tamano_maximo: int = TAMANO_MAXIMO_CACHE):
+        self.directorio = directorio
+        self.tamano_maximo = tamano_maximo
+
+    def cargar(self, clave: str, etapa: str):
+        """
+        Devuelve el artefacto de la etapa o None si no está guardado
+        o no se puede leer
+        """
+
+        ruta = self.__ruta(clave, etapa)
+
+        try:
+            with open(ruta, 'rb') as archivo:
+                artefacto = _CargadorArtefactos(archivo).load()
+            os.utime(ruta)
+        except (OSError, pickle.UnpicklingError, EOFError,
+                AttributeError, ImportError):
+            return None
+
+        return artefacto
+
+    def cargar_mas_profundo(self, clave: str,
+                            etapa: str) -> Tuple[Optional[str], object]:
+        """
+        Busca el artefacto de la etapa o, si no está, el de la etapa
+        anterior más cercana. Devuelve la etapa encontrada y su artefacto,
+        o (None, None) si no hay ninguno
+        """
+
+        for anterior in reversed(ETAPAS[:ETAPAS.index(etapa) + 1]):
+            artefacto = self.cargar(clave, anterior)
+            if artefacto is not None:
+                return anterior, artefacto
+
+        return None, None
+
+    def guardar(self, clave: str, etapa: str, artefacto) -> None:
+        """
+        Guarda el artefacto de la etapa, los errores al escribir
+        se ignoran porque la caché es opcional
+        """
+
+        ruta = self.__ruta(clave, etapa)
+        temporal = f'{ruta}.{os.getpid()}.tmp'
+
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            with open(temporal, 'wb') as archivo:
+                pickle.dump(artefacto, archivo, pickle.HIGHEST_PROTOCOL)
+
+            # Se reemplaza de una vez para no dejar artefactos a medias
+            os.replace(temporal, ruta)
+        except OSError:
+            return
+
+        self.desalojar()
+
+    def desalojar(self) -> None:
+        """
+        Elimina los artefactos usados hace más tiempo hasta que
+        la caché no supere el tamaño máximo
+        """
+
+        try:
+            entradas = [entrada for entrada in os.scandir(self.directorio)
+                        if entrada.is_file()]
+            estados = [(entrada.path, entrada.stat()) for entrada in entradas]
+        except OSError:
+            return
+
+        tamano = sum(estado.st_size for _, estado in estados)
+
+        for ruta, estado in sorted(estados, key=lambda e: e[1].st_mtime_ns):
+            if tamano <= self.tamano_maximo:
+                break
+
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            tamano -= estado.st_size
+
+    def __ruta(self, clave: str, etapa: str) -> str:
+        return os.path.join(self.directorio, f'{clave}.{etapa}')
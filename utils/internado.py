@@ -0,0 +1,179 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from Utils.arbol import ArbolSintaxisAbstracta, Nodo, TipoNodo
+from Utils.recorrido import recorrer
+
+# Hojas que se comparten entre todas sus apariciones
+HOJAS_COMPARTIDAS = frozenset({
+    TipoNodo.ENTERO, TipoNodo.FLOTANTE, TipoNodo.TEXTO, TipoNodo.BOOLEANO,
+    TipoNodo.IDENTIFICADOR, TipoNodo.OPERADOR, TipoNodo.COMPARADOR,
+    TipoNodo.OPERADOR_LOGICO})
+
+# Expresiones que se comparten si todos sus hijos se comparten, la
+# gramática no permite anidarlas más de dos niveles
+EXPRESIONES_COMPARTIDAS = frozenset({
+    TipoNodo.EXPRESION_MATEMATICA, TipoNodo.COMPARACION,
+    TipoNodo.EXPRESION_CONDICIONAL})
+
+
+def es_compartible(nodo) -> bool:
+    """
+    Indica si el subárbol del nodo se puede compartir: una hoja de las
+    HOJAS_COMPARTIDAS o una expresión formada sólo por ellas
+    """
+
+    if nodo.tipo in HOJAS_COMPARTIDAS:
+        return not nodo.nodos
+
+    if nodo.tipo in EXPRESIONES_COMPARTIDAS:
+        return all(es_compartible(hijo) for hijo in nodo.nodos)
+
+    return False
+
+
+def hash_estructural(raiz) -> int:
+    """
+    Hash del subárbol según el tipo, contenido y atributos de cada nodo,
+    sin tomar en cuenta la posición. Dos subárboles con la misma
+    estructura tienen el mismo hash
+    """
+
+    def salir(nodo, hashes: List[int]) -> int:
+        return hash((nodo.tipo, nodo.contenido,
+                     tuple(nodo.iterar_atributos()), tuple(hashes)))
+
+    return recorrer(raiz, salir=salir)
+
+
+class InternadorNodos:
+    """
+    Construye un árbol donde los subárboles compartibles (literales,
+    identificadores, operadores y las expresiones formadas por ellos)
+    estructuralmente iguales son un único Nodo
+
+    Los nodos compartidos no guardan posición, la posición de cada
+    aparición queda en una tabla aparte dentro del ArbolInternado. Los
+    nodos compartidos no se deben modificar, por eso el internado se
+    aplica a árboles que ya no cambian: el del analizador cuando sólo se
+    imprime o el del verificador ya decorado con los tipos
+
+    La tabla se conserva entre llamadas, así varios árboles internados
+    con el mismo internador también comparten nodos entre sí
+    """
+
+    tabla: Dict[tuple, Nodo]
+    hashes: Dict[int, int]
+
+    def __init__(self):
+        self.tabla = {}
+
+        # Hash estructural de cada nodo compartido, por id del nodo
+        self.hashes = {}
+
+    def internar(self, arbol: ArbolSintaxisAbstracta) -> 'ArbolInternado':
+        """
+        Retorna el árbol internado, el árbol original no se modifica
+        """
+
+        internado = ArbolInternado(self)
+
+        if arbol.raiz is None:
+            return internado
+
+        lineas = internado.lineas
+        columnas = internado.columnas
+
+        # La posición de cada aparición se guarda en preorden, el mismo
+        # orden en que se imprime el árbol
+        def entrar(nodo) -> None:
+            if es_compartible(nodo):
+                lineas.append(nodo.linea or 0)
+                columnas.append(nodo.columna or 0)
+
+        internado.raiz = recorrer(arbol.raiz, entrar, self.__salir)
+
+        return internado
+
+    def __salir(self, nodo, hijos: List[Nodo]) -> Nodo:
+        """
+        Retorna el nodo que reemplaza a `nodo` con sus hijos ya internados
+        """
+
+        atributos = tuple(nodo.iterar_atributos())
+
+        if not es_compartible(nodo):
+            # Si los hijos no cambiaron se conserva el nodo original
+            if all(hijo is original
+                   for hijo, original in zip(hijos, nodo.nodos)):
+                return nodo
+
+            return Nodo(nodo.tipo, nodo.contenido, tuple(hijos),
+                        dict(atributos) or None, nodo.linea, nodo.columna)
+
+        # Los hijos ya son los nodos compartidos, basta su identidad
+        clave = (nodo.tipo, nodo.contenido, atributos,
+                 tuple(id(hijo) for hijo in hijos))
+
+        compartido = self.tabla.get(clave)
+        if compartido is None:
+            compartido = Nodo(nodo.tipo, nodo.contenido, tuple(hijos),
+                              dict(atributos) or None)
+            self.tabla[clave] = compartido
+            self.hashes[id(compartido)] = hash((
+                nodo.tipo, nodo.contenido, atributos,
+                tuple(self.hashes[id(hijo)] for hijo in hijos)))
+
+        return compartido
+
+    def compartido(self, nodo) -> bool:
+        """
+        Indica si el nodo es uno de los nodos compartidos
+        """
+
+        return id(nodo) in self.hashes
+
+    def hash_nodo(self, nodo) -> Optional[int]:
+        """
+        Hash estructural de un nodo compartido, dos nodos compartidos
+        son iguales si y sólo si son el mismo objeto
+        """
+
+        return self.hashes.get(id(nodo))
+
+
+class ArbolInternado(ArbolSintaxisAbstracta):
+    """
+    Árbol con subárboles compartidos, la posición de cada aparición de
+    un nodo compartido se guarda en preorden en `lineas` y `columnas`
+    (0 si no tiene posición)
+    """
+
+    internador: InternadorNodos
+    lineas: array
+    columnas: array
+
+    def __init__(self, internador: InternadorNodos):
+        self.raiz = None
+        self.internador = internador
+        self.lineas = array('I')
+        self.columnas = array('I')
+
+    def iterar_preorden(self, profundidad: Optional[int] = None
+                        ) -> Iterator[Tuple[Nodo, int, Optional[tuple]]]:
+        """
+        Recorre el árbol tomando la posición de cada aparición de los
+        nodos compartidos de la tabla de posiciones. Se recorre el árbol
+        completo para no perder la cuenta de las apariciones
+        """
+
+        compartido = self.internador.compartido
+        posiciones = zip(self.lineas, self.columnas)
+
+        for nodo, nivel, posicion in super().iterar_preorden():
+            if compartido(nodo):
+                linea, columna = next(posiciones)
+                posicion = (linea or None, columna or None)
+
+            if profundidad is None or nivel <= profundidad:
+                yield nodo, nivel, posicion
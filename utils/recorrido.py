@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from Utils.arbol import Nodo
+
+
+def recorrer(raiz: 'Nodo',
+             entrar: Optional[Callable[['Nodo'], None]] = None,
+             salir: Optional[Callable[['Nodo', List[Any]], Any]] = None) -> Any:
+    """
+    Recorre el árbol en profundidad usando una pila explícita en lugar
+    de recursión, así la profundidad del árbol sólo está limitada por
+    la memoria
+
+    `entrar(nodo)` se llama antes de visitar los hijos del nodo y
+    `salir(nodo, resultados)` después, con la lista de lo que retornó
+    `salir` para cada hijo. Se retorna el resultado de salir de la raíz
+    """
+
+    if entrar is not None:
+        entrar(raiz)
+
+    # Cada marco guarda el nodo, el iterador de sus hijos y
+    # los resultados de los hijos ya visitados
+    pila = [(raiz, iter(raiz.nodos), [])]
+
+    while True:
+        nodo, hijos, resultados = pila[-1]
+
+        hijo = next(hijos, None)
+        if hijo is not None:
+            if entrar is not None:
+                entrar(hijo)
+            pila.append((hijo, iter(hijo.nodos), []))
+            continue
+
+        pila.pop()
+        resultado = salir(nodo, resultados) if salir is not None else None
+
+        if not pila:
+            return resultado
+
+        pila[-1][2].append(resultado)
+
+
+def preorden(raiz: 'Nodo') -> Iterator['Nodo']:
+    """
+    Nodos del subárbol en preorden sin recursión, el mismo orden de la
+    arena
+    """
+
+    pendientes = [raiz]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        yield nodo
+        pendientes.extend(reversed(nodo.nodos))
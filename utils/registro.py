@@ -6,6 +6,8 @@ class Registro:
     con el fin de revisar su alcance en el programa. 
     """
 
+    __slots__ = ('nombre', 'profundidad', 'referencia')
+
     nombre: str
     profundidad: int
     referencia: Nodo
@@ -0,0 +1,207 @@
+# Escritura del árbol y de la tabla de símbolos en texto, JSON o DOT
+
+from json.encoder import encode_basestring
+from typing import Iterator, Optional, TextIO
+
+from Utils.arbol import ArbolSintaxisAbstracta
+from Utils.archivos import escribir_bloques
+from Utils.tipo_datos import TipoDato
+
+FORMATOS = ('texto', 'json', 'dot')
+
+
+def valor_atributo(valor) -> str:
+    """
+    Texto de un atributo, los tipos de dato se escriben por nombre
+    """
+
+    return valor.name if isinstance(valor, TipoDato) else str(valor)
+
+
+def nodo_json(nodo, posicion: Optional[tuple] = None) -> str:
+    """
+    Objeto JSON de un nodo sin sus hijos, sin cerrar la llave para
+    que se puedan agregar los hijos
+    """
+
+    linea, columna = (nodo.linea, nodo.columna) if posicion is None \
+        else posicion
+
+    partes = [f'{{"tipo": "{nodo.tipo.name}"']
+    if nodo.contenido is not None:
+        partes.append(f', "contenido": {encode_basestring(nodo.contenido)}')
+    if linea is not None:
+        partes.append(f', "linea": {linea}, "columna": {columna}')
+
+    atributos = ', '.join(
+        f'{encode_basestring(llave)}: '
+        f'{encode_basestring(valor_atributo(valor))}'
+        for llave, valor in nodo.iterar_atributos())
+    if atributos:
+        partes.append(f', "atributos": {{{atributos}}}')
+
+    return ''.join(partes)
+
+
+def etiqueta_dot(texto: str) -> str:
+    """
+    Escapa un texto para usarlo dentro de comillas en DOT
+    """
+
+    return texto.replace('\\', '\\\\').replace('"', '\\"') \
+        .replace('\n', '\\n')
+
+
+def iterar_json(arbol: ArbolSintaxisAbstracta,
+                profundidad: Optional[int] = None) -> Iterator[str]:
+    """
+    Genera el árbol como JSON por partes, cada nodo es un objeto con
+    sus hijos en "nodos". Los nodos en `profundidad` con hijos
+    indican en "omitidos" cuántos hijos no se escribieron
+    """
+
+    if arbol.raiz is None:
+        yield 'null'
+        return
+
+    # Niveles de los nodos cuya lista de hijos sigue abierta
+    abiertos = []
+    primero = True
+
+    for nodo, nivel, posicion in arbol.iterar_preorden(profundidad):
+        while abiertos and abiertos[-1] >= nivel:
+            abiertos.pop()
+            yield ']}'
+            primero = False
+
+        if not primero:
+            yield ', '
+        yield nodo_json(nodo, posicion)
+
+        hijos = len(nodo.nodos)
+        if hijos and nivel != profundidad:
+            yield ', "nodos": ['
+            abiertos.append(nivel)
+            primero = True
+        else:
+            if hijos:
+                yield f', "omitidos": {hijos}'
+            yield '}'
+            primero = False
+
+    yield ']}' * len(abiertos)
+
+
+def iterar_dot(arbol: ArbolSintaxisAbstracta,
+               profundidad: Optional[int] = None) -> Iterator[str]:
+    """
+    Genera las declaraciones de nodos y aristas del árbol en DOT,
+    sin el encabezado del grafo
+    """
+
+    # Identificador del último nodo escrito en cada nivel, el padre
+    # de un nodo es el último del nivel anterior
+    ultimos = []
+
+    for numero, (nodo, nivel, posicion) in \
+            enumerate(arbol.iterar_preorden(profundidad)):
+
+        linea, _ = (nodo.linea, nodo.columna) if posicion is None \
+            else posicion
+
+        etiqueta = nodo.tipo.name
+        if nodo.contenido is not None:
+            etiqueta += f'\n{nodo.contenido}'
+        if linea is not None:
+            etiqueta += f'\n({linea})'
+        tipo = dict(nodo.iterar_atributos()).get('tipo')
+        if tipo is not None:
+            etiqueta += f'\n: {valor_atributo(tipo)}'
+
+        yield f'  n{numero} [label="{etiqueta_dot(etiqueta)}"];\n'
+
+        del ultimos[nivel:]
+        if ultimos:
+            yield f'  n{ultimos[-1]} -> n{numero};\n'
+        ultimos.append(numero)
+
+        if nivel == profundidad and nodo.nodos:
+            yield (f'  n{numero}_omitidos [label="... '
+                   f'{len(nodo.nodos)} hijos", shape=plaintext];\n')
+            yield f'  n{numero} -> n{numero}_omitidos;\n'
+
+
+def iterar_tabla_json(tabla) -> Iterator[str]:
+    """
+    Genera la tabla de símbolos como una lista JSON de registros
+    """
+
+    yield '['
+    for numero, registro in enumerate(tabla.iterar_registros()):
+        yield ', ' if numero else ''
+        yield (f'{{"nombre": {encode_basestring(registro.get_nombre())}, '
+               f'"profundidad": {registro.get_profundidad()}, '
+               f'"referencia": {nodo_json(registro.get_referencia())}}}}}')
+    yield ']'
+
+
+def tabla_dot(tabla) -> str:
+    """
+    Nodo DOT con los registros de la tabla de símbolos
+    """
+
+    lineas = ['TABLA DE SIMBOLOS'] + [
+        f'{"   " * registro.get_profundidad()}{registro.get_nombre()} '
+        f'({registro.get_profundidad()})'
+        for registro in tabla.iterar_registros()]
+    etiqueta = ''.join(f'{etiqueta_dot(linea)}\\l' for linea in lineas)
+
+    return f'  tabla [shape=box, label="{etiqueta}"];\n'
+
+
+def escribir_arbol(arbol: ArbolSintaxisAbstracta, salida: TextIO,
+                   formato: str = 'texto',
+                   profundidad: Optional[int] = None) -> None:
+    """
+    Escribe el árbol en el formato indicado, por bloques
+    """
+
+    if formato == 'json':
+        escribir_bloques(salida, iterar_json(arbol, profundidad))
+        salida.write('\n')
+
+    elif formato == 'dot':
+        salida.write('digraph arbol {\n  node [shape=box];\n')
+        escribir_bloques(salida, iterar_dot(arbol, profundidad))
+        salida.write('}\n')
+
+    elif arbol.raiz is None:
+        salida.write('[]\n')
+
+    else:
+        arbol.imprimir_preorden(salida, profundidad)
+
+
+def escribir_verificacion(tabla, arbol: ArbolSintaxisAbstracta,
+                          salida: TextIO, formato: str = 'texto',
+                          profundidad: Optional[int] = None) -> None:
+    """
+    Escribe la tabla de símbolos y el árbol verificado
+    """
+
+    if formato == 'json':
+        salida.write('{"tabla_simbolos": ')
+        escribir_bloques(salida, iterar_tabla_json(tabla))
+        salida.write(', "arbol": ')
+        escribir_bloques(salida, iterar_json(arbol, profundidad))
+        salida.write('}\n')
+
+    elif formato == 'dot':
+        salida.write('digraph arbol {\n  node [shape=box];\n')
+        salida.write(tabla_dot(tabla))
+        escribir_bloques(salida, iterar_dot(arbol, profundidad))
+        salida.write('}\n')
+
+    else:
+        salida.write(f'{tabla}\n')
+        escribir_arbol(arbol, salida, formato, profundidad)
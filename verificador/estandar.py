@@ -0,0 +1,158 @@
+# Ambiente estándar del lenguaje cmamuth, declarado en un manifiesto
+
+import json
+import os
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from Utils.arbol import Nodo, TipoNodo
+from Utils.registro import Registro
+from Utils.tipo_datos import TipoDato
+
+# Manifiesto con las funciones estándar del lenguaje
+MANIFIESTO_ESTANDAR = os.path.join(os.path.dirname(os.path.realpath(
+    __file__)), 'estandar.json')
+
+# Módulo de python del que importa el código generado las funciones
+# de un manifiesto que no indica otro
+MODULO_ESTANDAR = 'Lib.estandar'
+
+
+class FuncionNativa(NamedTuple):
+    """
+    Función implementada en python: su tipo de retorno, cuántos
+    argumentos recibe (None si no se revisa), si es pura (no tiene
+    efectos y sólo depende de sus argumentos) y el módulo de python del
+    que la importa el código generado
+    """
+
+    nombre: str
+    tipo: TipoDato
+    aridad: Optional[int] = None
+    pura: bool = False
+    modulo: str = MODULO_ESTANDAR
+
+
+class AmbienteEstandar:
+    """
+    Alcance inmutable con las funciones nativas, se construye una vez y
+    toda TablaSimbolos lo usa como base sin copiarlo. Sus registros se
+    ven como declarados en la profundidad 0 antes que los de la tabla.
+
+    Para agregar funciones se crea otro ambiente con `extender`, así los
+    que ya se usan nunca cambian
+    """
+
+    __slots__ = ('funciones', 'registros', 'simbolos')
+
+    funciones: Mapping[str, FuncionNativa]
+    registros: Mapping[str, Registro]
+    simbolos: Tuple[Registro, ...]
+
+    def __init__(self, funciones: Iterable[FuncionNativa] = ()) -> None:
+        nativas = {}
+        for funcion in funciones:
+            nativas[funcion.nombre] = funcion
+
+        self.funciones = MappingProxyType(nativas)
+        self.simbolos = tuple(
+            Registro(0, Nodo(TipoNodo.FUNCION, contenido=funcion.nombre,
+                             atributos={'tipo': funcion.tipo}))
+            for funcion in nativas.values())
+        self.registros = MappingProxyType(
+            {registro.get_nombre(): registro for registro in self.simbolos})
+
+    def __reduce__(self) -> tuple:
+        # Se guarda sólo el manifiesto, los registros se vuelven a crear
+        return _reconstruir, (tuple(self.funciones.values()),)
+
+    def buscar(self, nombre: str) -> Optional[Registro]:
+        """
+        Retorna el registro de la función nativa con ese nombre, si existe
+        """
+
+        return self.registros.get(nombre)
+
+    def nativa(self, nombre: str) -> Optional[FuncionNativa]:
+        return self.funciones.get(nombre)
+
+    def extender(self, funciones: Iterable[FuncionNativa]
+                 ) -> 'AmbienteEstandar':
+        """
+        Ambiente nuevo con las funciones de este y `funciones`, una
+        función con el nombre de otra la reemplaza
+        """
+
+        return AmbienteEstandar([*self.funciones.values(), *funciones])
+
+
+def leer_manifiesto(ruta: str) -> List[FuncionNativa]:
+    """
+    Funciones de un manifiesto JSON: un objeto con la lista `funciones`,
+    cada una con `nombre`, `tipo` (el nombre de un TipoDato) y
+    opcionalmente `aridad`, `pura` y `modulo`. El `modulo` del objeto
+    es el de las funciones que no lo indican
+    """
+
+    with open(ruta, encoding='utf-8') as archivo:
+        manifiesto = json.load(archivo)
+
+    modulo = manifiesto.get('modulo', MODULO_ESTANDAR)
+
+    try:
+        return [FuncionNativa(funcion['nombre'], TipoDato[funcion['tipo']],
+                              funcion.get('aridad'),
+                              funcion.get('pura', False),
+                              funcion.get('modulo', modulo))
+                for funcion in manifiesto['funciones']]
+    except (KeyError, TypeError) as error:
+        raise ValueError(f'Manifiesto de funciones invalido {ruta!r}: '
+                         f'{error}') from error
+
+
+_ambiente: Optional[AmbienteEstandar] = None
+
+
+def ambiente_estandar() -> AmbienteEstandar:
+    """
+    Ambiente con las funciones estándar y las registradas, el manifiesto
+    estándar se lee sólo la primera vez
+    """
+
+    global _ambiente
+    if _ambiente is None:
+        _ambiente = AmbienteEstandar(leer_manifiesto(MANIFIESTO_ESTANDAR))
+    return _ambiente
+
+
+def registrar_nativas(funciones: Iterable[FuncionNativa]
+                      ) -> AmbienteEstandar:
+    """
+    Agrega funciones nativas al ambiente que usan el verificador y el
+    generador a partir de ahora, retorna el ambiente nuevo
+    """
+
+    global _ambiente
+    _ambiente = ambiente_estandar().extender(funciones)
+    return _ambiente
+
+
+def cargar_nativas(ruta: str) -> AmbienteEstandar:
+    """
+    Registra las funciones nativas de un manifiesto con el formato del
+    estándar
+    """
+
+    return registrar_nativas(leer_manifiesto(ruta))
+
+
+def _reconstruir(funciones: Tuple[FuncionNativa, ...]) -> AmbienteEstandar:
+    """
+    Ambiente serializado con esas funciones, si son las del ambiente de
+    este proceso se usa el mismo en lugar de crear otro
+    """
+
+    ambiente = ambiente_estandar()
+    if tuple(ambiente.funciones.values()) == funciones:
+        return ambiente
+    return AmbienteEstandar(funciones)
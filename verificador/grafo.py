@@ -0,0 +1,150 @@
+# Grafo de llamadas del programa para no generar lo que no se usa
+
+from typing import Dict, List, Optional, Set
+
+from Utils.arbol import ArbolSintaxisAbstracta, Nodo, TipoNodo
+from Utils.recorrido import preorden
+from Verificador.estandar import AmbienteEstandar, ambiente_estandar
+
+
+class GrafoLlamadas:
+    """
+    Grafo de las unidades del programa (los hijos de PROGRAMA): cada una
+    apunta a las funciones que invoca y a las globales que lee. Se
+    recorre desde la principal, así las funciones y asignaciones globales
+    a las que no se llega desde ella no se tienen que generar.
+
+    Las invocaciones a nombres que no declara el programa son del
+    ambiente estándar y no agregan unidades. Una asignación global que
+    invoca alguna función que no es nativa y pura también es raíz,
+    porque esa invocación se ejecuta al cargar el programa aunque nadie
+    lea la variable
+    """
+
+    arbol: ArbolSintaxisAbstracta
+    ambiente: AmbienteEstandar
+    unidades: List[Nodo]
+    definiciones: Dict[str, List[int]]
+    referencias: List[Set[str]]
+    raices: List[int]
+    alcanzables: Set[int]
+
+    def __init__(self, arbol: ArbolSintaxisAbstracta,
+                 ambiente: Optional[AmbienteEstandar] = None) -> None:
+        self.arbol = arbol
+        self.ambiente = ambiente or ambiente_estandar()
+        self.unidades = []
+        self.definiciones = {}
+        self.referencias = []
+        self.raices = []
+        self.alcanzables = set()
+
+    @staticmethod
+    def nombre(unidad: Nodo) -> Optional[str]:
+        """
+        Nombre que declara una unidad, None para la principal
+        """
+
+        if unidad.tipo == TipoNodo.FUNCION:
+            return unidad.contenido
+        if unidad.tipo == TipoNodo.ASIGNACION:
+            return unidad.nodos[0].contenido
+        return None
+
+    def construir(self) -> 'GrafoLlamadas':
+        """
+        Recolecta las referencias de cada unidad y marca las alcanzables
+        desde las raíces
+        """
+
+        if self.arbol.raiz is None:
+            return self
+
+        self.unidades = list(self.arbol.raiz.nodos)
+
+        for posicion, unidad in enumerate(self.unidades):
+            nombre = self.nombre(unidad)
+            if nombre is not None:
+                self.definiciones.setdefault(nombre, []).append(posicion)
+
+            self.referencias.append(self.__referencias(unidad))
+
+        for posicion, unidad in enumerate(self.unidades):
+            if unidad.tipo == TipoNodo.PRINCIPAL or \
+                    (unidad.tipo == TipoNodo.ASIGNACION and
+                     self.__tiene_efectos(unidad)):
+                self.raices.append(posicion)
+
+        pendientes = list(self.raices)
+        self.alcanzables.update(pendientes)
+
+        while pendientes:
+            posicion = pendientes.pop()
+            for nombre in self.referencias[posicion]:
+                for destino in self.definiciones.get(nombre, ()):
+                    if destino not in self.alcanzables:
+                        self.alcanzables.add(destino)
+                        pendientes.append(destino)
+
+        return self
+
+    def generadas(self) -> List[Nodo]:
+        """
+        Unidades alcanzables, en el orden del programa
+        """
+
+        return [unidad for posicion, unidad in enumerate(self.unidades)
+                if posicion in self.alcanzables]
+
+    def eliminadas(self) -> List[Nodo]:
+        """
+        Unidades a las que no se llega desde ninguna raíz, en el orden
+        del programa
+        """
+
+        return [unidad for posicion, unidad in enumerate(self.unidades)
+                if posicion not in self.alcanzables]
+
+    def __tiene_efectos(self, unidad: Nodo) -> bool:
+        """
+        Indica si la unidad invoca alguna función del programa o alguna
+        nativa que no es pura
+        """
+
+        for nodo in preorden(unidad):
+            if nodo.tipo == TipoNodo.INVOCACION:
+                nativa = self.ambiente.nativa(nodo.contenido)
+                if nodo.contenido in self.definiciones or \
+                        nativa is None or not nativa.pura:
+                    return True
+
+        return False
+
+    def __referencias(self, unidad: Nodo) -> Set[str]:
+        """
+        Nombres que la unidad invoca o lee y que no son locales
+        """
+
+        locales = set()
+        if unidad.tipo == TipoNodo.FUNCION and \
+                unidad.nodos[1].tipo == TipoNodo.PARAMETROS_FUNCION:
+            locales.update(parametro.contenido
+                           for parametro in unidad.nodos[1].nodos)
+
+        if unidad.tipo in {TipoNodo.FUNCION, TipoNodo.PRINCIPAL}:
+            # Como en python, lo que se asigna en la función es local
+            for nodo in preorden(unidad):
+                if nodo.tipo == TipoNodo.ASIGNACION:
+                    locales.add(nodo.nodos[0].contenido)
+
+        referencias = set()
+
+        for nodo in preorden(unidad):
+            if nodo.tipo == TipoNodo.INVOCACION:
+                referencias.add(nodo.contenido)
+
+            elif nodo.tipo == TipoNodo.IDENTIFICADOR and \
+                    nodo.contenido not in locales:
+                referencias.add(nodo.contenido)
+
+        return referencias
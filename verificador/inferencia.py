@@ -0,0 +1,351 @@
+# Inferencia de tipos por punto fijo para generar código especializado
+
+from typing import Dict, Hashable, Iterator, List, Optional, Set
+
+from Utils.arbol import ArbolSintaxisAbstracta, Nodo, TipoNodo
+from Utils.recorrido import preorden
+from Utils.tipo_datos import TipoDato
+from Verificador.estandar import AmbienteEstandar, ambiente_estandar
+
+# Tipos numéricos, cualquiera de ellos unido con otro distinto es NUMERO
+NUMERICOS = frozenset({TipoDato.ENTERO, TipoDato.FLOTANTE, TipoDato.NUMERO})
+
+# Literales y el tipo que tienen siempre
+TIPOS_LITERAL = {
+    TipoNodo.ENTERO: TipoDato.ENTERO, TipoNodo.FLOTANTE: TipoDato.FLOTANTE,
+    TipoNodo.TEXTO: TipoDato.TEXTO, TipoNodo.BOOLEANO: TipoDato.BOOLEANO
+}
+
+# Alcance de las asignaciones globales, el de una función es su nombre
+# y el de la principal su tipo de nodo, que no choca con ningún nombre
+GLOBAL = None
+
+
+def unir(tipo: Optional[TipoDato], otro: Optional[TipoDato]
+         ) -> Optional[TipoDato]:
+    """
+    Tipo que abarca a los dos: None es el de algo que todavía no recibe
+    ningún valor, dos tipos numéricos distintos dan NUMERO y dos tipos
+    distintos cualesquiera dan CUALQUIERA
+    """
+
+    if tipo is None or tipo == otro:
+        return otro
+    if otro is None:
+        return tipo
+    if tipo in NUMERICOS and otro in NUMERICOS:
+        return TipoDato.NUMERO
+    return TipoDato.CUALQUIERA
+
+
+def tipo_expresion(operandos: List[Optional[TipoDato]],
+                   division: bool) -> Optional[TipoDato]:
+    """
+    Tipo de una expresión matemática según el de sus operandos, una
+    división se genera con `/` y siempre da un flotante
+    """
+
+    if None in operandos:
+        return None
+
+    tipos = set(operandos)
+    if not tipos <= NUMERICOS:
+        return TipoDato.CUALQUIERA
+    if division or TipoDato.FLOTANTE in tipos:
+        return TipoDato.FLOTANTE
+    if tipos == {TipoDato.ENTERO}:
+        return TipoDato.ENTERO
+    return TipoDato.NUMERO
+
+
+class Restriccion:
+    """
+    El valor de `fuente`, evaluado en `alcance`, es uno de los que
+    puede tomar `destino` (una variable o el retorno de una función).
+    Sin `fuente` el valor es `constante`
+    """
+
+    __slots__ = ('destino', 'fuente', 'alcance', 'constante')
+
+    destino: Hashable
+    fuente: Optional[Nodo]
+    alcance: Hashable
+    constante: Optional[TipoDato]
+
+    def __init__(self, destino: Hashable, fuente: Optional[Nodo],
+                 alcance: Hashable,
+                 constante: Optional[TipoDato] = None) -> None:
+        self.destino = destino
+        self.fuente = fuente
+        self.alcance = alcance
+        self.constante = constante
+
+
+class InferenciaTipos:
+    """
+    Deduce el tipo que tiene siempre cada variable, parámetro y retorno
+    del programa generado en python.
+
+    Cada asignación, cada argumento de una invocación y cada `messirve`
+    es una restricción: el tipo del valor es uno de los que puede tomar
+    la variable, el parámetro o el retorno. Se parte de que nada tiene
+    tipo y se evalúan las restricciones hasta llegar a un punto fijo,
+    volviendo a evaluar sólo las que leen algo que cambió. Como los tipos
+    sólo suben (nada, un tipo, NUMERO, CUALQUIERA) siempre termina.
+
+    Las variables siguen el alcance de python: una variable asignada o
+    recibida como parámetro en cualquier parte de una función es local
+    en toda la función, y las demás son globales.
+
+    Con `unidades` sólo se toman en cuenta esos hijos de PROGRAMA, por
+    ejemplo los que se van a generar. Las funciones nativas retornan el
+    tipo que indica su manifiesto
+    """
+
+    arbol: ArbolSintaxisAbstracta
+    unidades: List[Nodo]
+    tipos: Dict[Hashable, TipoDato]
+    locales: Dict[Hashable, Set[str]]
+    parametros: Dict[str, List[List[str]]]
+    restricciones: List[Restriccion]
+    lectores: Dict[Hashable, List[Restriccion]]
+    estandar: Dict[str, TipoDato]
+
+    def __init__(self, arbol: ArbolSintaxisAbstracta,
+                 unidades: Optional[List[Nodo]] = None,
+                 ambiente: Optional[AmbienteEstandar] = None) -> None:
+        self.arbol = arbol
+        self.unidades = unidades
+        self.tipos = {}
+        self.locales = {GLOBAL: set()}
+        self.parametros = {}
+        self.restricciones = []
+        self.lectores = {}
+        self.estandar = {nombre: funcion.tipo for nombre, funcion in
+                         (ambiente or ambiente_estandar()).funciones.items()}
+
+    @staticmethod
+    def alcance(unidad: Nodo) -> Hashable:
+        """
+        Alcance de las variables de un hijo de PROGRAMA
+        """
+
+        if unidad.tipo == TipoNodo.FUNCION:
+            return unidad.contenido
+        if unidad.tipo == TipoNodo.PRINCIPAL:
+            return TipoNodo.PRINCIPAL
+        return GLOBAL
+
+    def inferir(self) -> 'InferenciaTipos':
+        """
+        Recolecta las restricciones y busca el punto fijo
+        """
+
+        if self.arbol.raiz is None:
+            return self
+        if self.unidades is None:
+            self.unidades = list(self.arbol.raiz.nodos)
+
+        self.__recolectar_locales()
+        self.__recolectar_restricciones()
+        self.__resolver()
+        return self
+
+    def tipo_variable(self, alcance: Hashable, nombre: str) -> TipoDato:
+        """
+        Tipo que tiene siempre la variable `nombre` vista desde `alcance`,
+        CUALQUIERA si no se pudo probar
+        """
+
+        return self.tipos.get(self.__resolver_nombre(alcance, nombre)) or \
+            TipoDato.CUALQUIERA
+
+    def tipo_retorno(self, funcion: str) -> TipoDato:
+        """
+        Tipo que retorna siempre la función, CUALQUIERA si no se pudo probar
+        """
+
+        return self.tipos.get(_retorno(funcion)) or TipoDato.CUALQUIERA
+
+    def __recolectar_locales(self) -> None:
+        """
+        Nombres locales de cada alcance: los parámetros y las variables
+        asignadas en cualquier parte de la función
+        """
+
+        for unidad in self.unidades:
+            alcance = self.alcance(unidad)
+            locales = self.locales.setdefault(alcance, set())
+
+            if unidad.tipo == TipoNodo.FUNCION:
+                parametros = []
+                if unidad.nodos[1].tipo == TipoNodo.PARAMETROS_FUNCION:
+                    parametros = [nodo.contenido
+                                  for nodo in unidad.nodos[1].nodos]
+                self.parametros.setdefault(unidad.contenido, []) \
+                    .append(parametros)
+                locales.update(parametros)
+
+            for nodo in preorden(unidad):
+                if nodo.tipo == TipoNodo.ASIGNACION:
+                    locales.add(nodo.nodos[0].contenido)
+
+    def __recolectar_restricciones(self) -> None:
+        """
+        Una restricción por asignación, argumento y retorno
+        """
+
+        for unidad in self.unidades:
+            alcance = self.alcance(unidad)
+
+            if unidad.tipo == TipoNodo.FUNCION:
+                instrucciones = unidad.nodos[-1].nodos
+
+                # Si la última instrucción no retorna, la función puede
+                # terminar sin retornar nada
+                if not instrucciones or not instrucciones[-1].nodos or \
+                        instrucciones[-1].nodos[0].tipo != TipoNodo.RETORNO:
+                    self.__agregar(_retorno(alcance), None, alcance,
+                                   TipoDato.NINGUNO)
+
+            for nodo in preorden(unidad):
+                if nodo.tipo == TipoNodo.ASIGNACION:
+                    variable = self.__resolver_nombre(
+                        alcance, nodo.nodos[0].contenido)
+                    self.__agregar(variable, nodo.nodos[1], alcance)
+
+                elif nodo.tipo == TipoNodo.RETORNO and \
+                        unidad.tipo == TipoNodo.FUNCION:
+                    if nodo.nodos:
+                        self.__agregar(_retorno(alcance), nodo.nodos[0],
+                                       alcance)
+                    else:
+                        self.__agregar(_retorno(alcance), None, alcance,
+                                       TipoDato.NINGUNO)
+
+                elif nodo.tipo == TipoNodo.INVOCACION:
+                    for hijo in nodo.nodos:
+                        if hijo.tipo == TipoNodo.PARAMETROS_FUNCION:
+                            self.__agregar_argumentos(nodo.contenido,
+                                                      hijo.nodos, alcance)
+
+    def __agregar_argumentos(self, funcion: str, argumentos: List[Nodo],
+                             alcance: Hashable) -> None:
+        """
+        Cada argumento es un valor que puede tomar el parámetro en la
+        misma posición de cada función con ese nombre
+        """
+
+        for parametros in self.parametros.get(funcion, []):
+            for parametro, argumento in zip(parametros, argumentos):
+                self.__agregar((funcion, parametro), argumento, alcance)
+
+    def __agregar(self, destino: Hashable, fuente: Optional[Nodo],
+                  alcance: Hashable,
+                  constante: Optional[TipoDato] = None) -> None:
+        """
+        Agrega una restricción y la registra como lectora de todo lo que
+        lee su fuente
+        """
+
+        restriccion = Restriccion(destino, fuente, alcance, constante)
+        self.restricciones.append(restriccion)
+
+        if fuente is not None:
+            for lectura in self.__lecturas(fuente, alcance):
+                self.lectores.setdefault(lectura, []).append(restriccion)
+
+    def __lecturas(self, fuente: Nodo, alcance: Hashable
+                   ) -> Iterator[Hashable]:
+        """
+        Variables y retornos de los que depende el tipo de `fuente`
+        """
+
+        if fuente.tipo == TipoNodo.INVOCACION:
+            yield _retorno(fuente.contenido)
+
+        operandos = fuente.nodos \
+            if fuente.tipo == TipoNodo.EXPRESION_MATEMATICA else [fuente]
+
+        for operando in operandos:
+            if operando.tipo == TipoNodo.IDENTIFICADOR:
+                variable = self.__resolver_nombre(alcance, operando.contenido)
+                if variable is not None:
+                    yield variable
+
+    def __resolver(self) -> None:
+        """
+        Evalúa las restricciones hasta que ningún tipo cambia
+        """
+
+        pendientes = list(reversed(self.restricciones))
+
+        while pendientes:
+            restriccion = pendientes.pop()
+
+            if restriccion.fuente is None:
+                valor = restriccion.constante
+            else:
+                valor = self.__evaluar(restriccion.fuente,
+                                       restriccion.alcance)
+
+            anterior = self.tipos.get(restriccion.destino)
+            nuevo = unir(anterior, valor)
+            if nuevo != anterior:
+                self.tipos[restriccion.destino] = nuevo
+                pendientes.extend(self.lectores.get(restriccion.destino, ()))
+
+    def __evaluar(self, nodo: Nodo, alcance: Hashable) -> Optional[TipoDato]:
+        """
+        Tipo del valor de `nodo` con los tipos encontrados hasta ahora
+        """
+
+        tipo = TIPOS_LITERAL.get(nodo.tipo)
+        if tipo is not None:
+            return tipo
+
+        if nodo.tipo == TipoNodo.IDENTIFICADOR:
+            destino = self.__resolver_nombre(alcance, nodo.contenido)
+            if destino is None:
+                return TipoDato.CUALQUIERA
+            return self.tipos.get(destino)
+
+        if nodo.tipo == TipoNodo.INVOCACION:
+            # Una función del programa oculta a la estándar
+            if nodo.contenido in self.parametros:
+                return self.tipos.get(_retorno(nodo.contenido))
+            return self.estandar.get(nodo.contenido, TipoDato.CUALQUIERA)
+
+        if nodo.tipo == TipoNodo.EXPRESION_MATEMATICA:
+            operandos = []
+            division = False
+            for operando in nodo.nodos:
+                if operando.tipo == TipoNodo.OPERADOR:
+                    division = division or operando.contenido == 'bobiDir'
+                else:
+                    operandos.append(self.__evaluar(operando, alcance))
+            return tipo_expresion(operandos, division)
+
+        return TipoDato.CUALQUIERA
+
+    def __resolver_nombre(self, alcance: Hashable,
+                          nombre: str) -> Optional[Hashable]:
+        """
+        Variable a la que se refiere `nombre` en `alcance`, la local si
+        existe o la global. None si no es una variable
+        """
+
+        if nombre in self.locales.get(alcance, ()):
+            return (alcance, nombre)
+        if nombre in self.locales[GLOBAL]:
+            return (GLOBAL, nombre)
+        return None
+
+
+def _retorno(funcion: str) -> tuple:
+    """
+    Clave del tipo de retorno de una función, el tipo de nodo evita que
+    choque con la de una variable
+    """
+
+    return (TipoNodo.RETORNO, funcion)
@@ -1,8 +1,64 @@
-from typing import List, NoReturn
+import gc
+import hashlib
+import io
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from heapq import heappop, heappush
+from queue import SimpleQueue
+from typing import (Dict, Iterator, List, NamedTuple, NoReturn, Optional,
+                    Set, Tuple, Union)
 
 from Utils.arbol import ArbolSintaxisAbstracta, Nodo, TipoNodo
+from Utils.arena import SIN_NODO, TIPOS_DATO, ArenaNodos, NodoArena
+from Utils.recorrido import preorden, recorrer
 from Utils.registro import Registro
 from Utils.tipo_datos import TipoDato
+from Verificador.estandar import (AmbienteEstandar, FuncionNativa,
+                                  ambiente_estandar)
+
+# Cantidad mínima de funciones (contando la principal) para verificar en
+# paralelo, con menos no vale la pena iniciar los procesos
+MINIMO_FUNCIONES_PARALELO = 16
+
+# Valor de cada TipoDato, el 0 indica que el nodo no tiene tipo
+VALORES_TIPO_DATO = {tipo: tipo.value for tipo in TipoDato}
+
+# Contenido de los nodos sin contenido en la huella de una unidad
+SIN_CONTENIDO = '\1'
+
+
+class AlcanceBase:
+    """
+    Declaraciones del nivel superior que ve una parte del programa
+    verificada por separado: las funciones estándar, las asignaciones
+    globales y las funciones declaradas antes que ella, ya con su tipo.
+    No cambia mientras se verifica esa parte. `ambiente` da las
+    funciones nativas para revisar sus invocaciones
+    """
+
+    # Los registros ya se declararon en otra parte, no se imprimen
+    simbolos = ()
+
+    registros: Dict[str, Registro]
+    ambiente: Optional[AmbienteEstandar]
+
+    def __init__(self, registros: Dict[str, Registro],
+                 ambiente: Optional[AmbienteEstandar] = None) -> None:
+        self.registros = registros
+        self.ambiente = ambiente
+
+    def buscar(self, nombre: str) -> Optional[Registro]:
+        """
+        Retorna el registro visible con ese nombre, si existe
+        """
+
+        return self.registros.get(nombre)
+
+    def nativa(self, nombre: str) -> Optional[FuncionNativa]:
+        return self.ambiente.nativa(nombre) \
+            if self.ambiente is not None else None
 
 
 class TablaSimbolos:
@@ -10,18 +66,36 @@ class TablaSimbolos:
     Almacena información auxiliar para decorar el árbol de sintáxis
     abstracta con información de tipo y alcance.
 
-    La estructura de simbolos es una lista de registros
+    La tabla es una pila de alcances. `simbolos` tiene los registros
+    vivos en el orden en que se declararon, los de un bloque siempre
+    quedan al final, y `alcances` guarda por nombre la pila de registros
+    visibles con ese nombre, uno por bloque, donde el último es el del
+    bloque más interno. Dentro de un mismo bloque la primera declaración
+    es la que cuenta. Al terminar un bloque se deshacen los registros
+    declarados desde que inició, así buscar, agregar y cerrar un bloque
+    no recorren la tabla
     """
 
     simbolos: List[Registro]
+    alcances: Dict[str, List[Registro]]
+    inicios_bloque: List[int]
     profundidad: int
+    base: Optional[Union[AlcanceBase, AmbienteEstandar]]
 
-    def __init__(self) -> None:
+    def __init__(self, base: Optional[Union[AlcanceBase,
+                                            AmbienteEstandar]] = None
+                 ) -> None:
         """
-        Constructor para inicializar la clase TablaSimbolos
+        Constructor para inicializar la clase TablaSimbolos, con `base`
+        los registros de ese alcance se ven como declarados antes que
+        todos los de la tabla en la profundidad 0. La base no se copia
+        ni se modifica, el ambiente estándar es el mismo para todas
         """
 
+        self.base = base
         self.simbolos = []
+        self.alcances = {}
+        self.inicios_bloque = []
         self.profundidad = 0
 
     def nuevo_bloque(self):
@@ -30,6 +104,7 @@ class TablaSimbolos:
         """
 
         self.profundidad += 1
+        self.inicios_bloque.append(len(self.simbolos))
 
     def eliminar_bloque(self) -> None:
         """
@@ -37,42 +112,93 @@ class TablaSimbolos:
         registros de la tabla que corresponden a ese bloque
         """
 
-        for registro in self.simbolos:
-            if registro.get_profundidad() == self.profundidad:
-                self.simbolos.remove(registro)
+        inicio = self.inicios_bloque.pop()
+
+        for registro in reversed(self.simbolos[inicio:]):
+            registros = self.alcances.get(registro.get_nombre())
+
+            # Sólo la primera declaración del bloque está en la pila
+            if registros and registros[-1] is registro:
+                registros.pop()
+                if not registros:
+                    del self.alcances[registro.get_nombre()]
+
+        del self.simbolos[inicio:]
 
         self.profundidad -= 1
 
-    def nuevo_registro(self, nodo: Nodo) -> None:
+    def nuevo_registro(self, nodo: Nodo, visible: bool = True) -> Registro:
         """
-        Introduce un nuevo registro a la tabla de simbolos
+        Introduce un nuevo registro a la tabla de simbolos, si no es
+        `visible` no se encuentra hasta llamar a `activar_registro`
         """
 
         registro = Registro(self.profundidad, nodo)
 
         self.simbolos.append(registro)
+        if visible:
+            self.activar_registro(registro)
+
+        return registro
 
-    def verificar_existencia(self, nombre: str, atributos: dict) -> Registro:
+    def activar_registro(self, registro: Registro) -> None:
         """
-        Verifica si un identificador existe como variable/función local
+        Hace visible un registro agregado con `visible=False`, si el
+        nombre ya se declaró en el mismo bloque se mantiene el anterior
         """
-        for registro in self.simbolos:
 
-            # si es local
-            if registro.get_nombre() == nombre and \
-                    registro.get_profundidad() <= self.profundidad:
+        registros = self.alcances.get(registro.get_nombre())
+        anterior = registros[-1] if registros else \
+            self.__buscar_base(registro.get_nombre())
+
+        if anterior is None or \
+                anterior.get_profundidad() < registro.get_profundidad():
+            self.alcances.setdefault(registro.get_nombre(), []) \
+                .append(registro)
 
-                return registro
+    def verificar_existencia(self, nombre: str, nodo: Nodo) -> Registro:
+        """
+        Verifica si un identificador existe como variable/función,
+        retorna el registro visible: el del bloque más interno
+        """
 
-        self.__error_identificador_inexistente(nombre, atributos)
+        registros = self.alcances.get(nombre)
+        if registros:
+            return registros[-1]
 
-    def __error_identificador_inexistente(self,nombre : str, atributos: dict) -> NoReturn:
+        registro = self.__buscar_base(nombre)
+        if registro is not None:
+            return registro
+
+        self.__error_identificador_inexistente(nombre, nodo)
+
+    def nativa(self, nombre: str) -> Optional[FuncionNativa]:
+        """
+        Función nativa con ese nombre en la base, si existe
+        """
+
+        return self.base.nativa(nombre) if self.base is not None else None
+
+    def iterar_registros(self) -> Iterator[Registro]:
+        """
+        Registros en el orden en que se declararon, primero los de la
+        base que se declaran en la tabla (las funciones estándar)
+        """
+
+        if self.base is not None:
+            yield from self.base.simbolos
+        yield from self.simbolos
+
+    def __buscar_base(self, nombre: str) -> Optional[Registro]:
+        return self.base.buscar(nombre) if self.base is not None else None
+
+    def __error_identificador_inexistente(self,nombre : str, nodo: Nodo) -> NoReturn:
         """
         Encargado de tirar error si el identificador no existe con anterioridad
         """
 
         print(f'El siguiente identificador no está declarado: {nombre!r} ' +
-              f'(Linea: {atributos.get("linea")}, Columna: {atributos.get("columna")})')
+              f'(Linea: {nodo.linea}, Columna: {nodo.columna})')
 
         raise NameError('Error de existencia de identificador en el verificador')
 
@@ -85,13 +211,10 @@ class TablaSimbolos:
         #f'{self.tipo:30} --> {self.valor:10} \
         #(Linea: {self.linea} , Columna: {self.columna})'
 
-        resultado = f'TABLA DE SIMBOLOS\n\n'
-        for registro in self.simbolos:
-            tabulacion = "   "*registro.get_profundidad()
-            resultado += f'{tabulacion}|__{str(registro)}\n'
-            
+        lineas = [f'{"   " * registro.get_profundidad()}|__{registro}\n'
+                  for registro in self.iterar_registros()]
 
-        return resultado
+        return 'TABLA DE SIMBOLOS\n\n' + ''.join(lineas)
 
 
 class Visitante:
@@ -103,6 +226,9 @@ class Visitante:
 
     tabla_simbolos: TablaSimbolos
     dic_tipos_nodo: dict
+    dic_entradas: dict
+    registros_invocacion: List[Registro]
+    registros_asignacion: List[Registro]
 
     def __init__(self, tabla_simbolos):
         """
@@ -110,6 +236,17 @@ class Visitante:
         """
 
         self.tabla_simbolos = tabla_simbolos
+        self.registros_invocacion = []
+        self.registros_asignacion = []
+
+        #diccionario con lo que se revisa antes de visitar los hijos del nodo
+        self.dic_entradas = {
+            TipoNodo.ASIGNACION: self.__entrar_asignacion, TipoNodo.EXPRESION_MATEMATICA: self.__entrar_expresion_matematica,
+            TipoNodo.FUNCION: self.__entrar_funcion, TipoNodo.INVOCACION: self.__entrar_invocacion,
+            TipoNodo.COMPARACION: self.__entrar_comparacion, TipoNodo.PARAMETROS_INVOCACION: self.__entrar_parametros_invocacion,
+            TipoNodo.PARAMETROS_FUNCION: self.__entrar_parametros_funcion, TipoNodo.REPETIR: self.__entrar_bloque,
+            TipoNodo.SIUUU: self.__entrar_bloque, TipoNodo.NIMODO: self.__entrar_bloque
+        }
 
         #diccionario para asignar el tipo de nodo con su respectiva función
         self.dic_tipos_nodo = {
@@ -128,41 +265,71 @@ class Visitante:
 
     def visitar(self, nodo: Nodo) -> None:
         """
-        Se utiliza el diccionario para visitar al sector del árbol correspondiente,
-        dependiendo del nodo que le entre, a esa función se llama
+        Recorre el sector del árbol que inicia en el nodo sin recursión. Se
+        utilizan los diccionarios para llamar a la función correspondiente
+        al tipo de cada nodo, antes (dic_entradas) y después
+        (dic_tipos_nodo) de visitar sus hijos
 
         self.dic_tipos_nodo[TipoNodo.PROGRAMA] = self.__visitar_programa
         """
 
+        recorrer(nodo, self.__entrar, self.__salir)
+
+    def __entrar(self, nodo: Nodo) -> None:
+        """
+        Revisiones que se hacen antes de visitar los hijos del nodo
+        """
+
+        entrada = self.dic_entradas.get(nodo.tipo)
+        if entrada is not None:
+            entrada(nodo)
+
+    def __salir(self, nodo: Nodo, resultados: list) -> None:
+        """
+        Visita el nodo una vez visitados todos sus hijos
+        """
+
         self.dic_tipos_nodo[nodo.tipo](nodo)
 
+    def __entrar_bloque(self, nodo_actual: Nodo) -> None:
+        """
+        Repetir, Siuuu y Nimodo inician un bloque de alcance
+        """
+
+        self.tabla_simbolos.nuevo_bloque()
+
     def __visitar_programa(self, nodo_actual: Nodo) -> None:
         """
         Programa ::= Comentario Asignación* (Comentario | Funcion)* Principal
         """
 
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
-
-    def __visitar_asignacion(self, nodo_actual: Nodo) -> None:
+    def __entrar_asignacion(self, nodo_actual: Nodo) -> None:
         """
         Asignación ::= Identificador anotado (Valor | Invocación | ExpresionMatematica)
         """
 
         if nodo_actual.nodos[1].tipo == TipoNodo.IDENTIFICADOR:
             registro = self.tabla_simbolos.verificar_existencia(
-                    nodo_actual.nodos[1].contenido, nodo_actual.nodos[1].atributos)
+                    nodo_actual.nodos[1].contenido, nodo_actual.nodos[1])
 
-        self.tabla_simbolos.nuevo_registro(nodo_actual.nodos[0])
+        # La variable se declara pero es visible hasta tener su valor,
+        # así en `i anotado #i bobMar 1#` la `i` del valor es la anterior
+        self.registros_asignacion.append(
+            self.tabla_simbolos.nuevo_registro(nodo_actual.nodos[0],
+                                               visible=False))
 
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
+    def __visitar_asignacion(self, nodo_actual: Nodo) -> None:
+        """
+        Asignación ::= Identificador anotado (Valor | Invocación | ExpresionMatematica)
+        """
 
         nodo_actual.atributos['tipo'] = nodo_actual.nodos[1].atributos['tipo']
 
         nodo_actual.nodos[0].atributos['tipo'] = nodo_actual.nodos[1].atributos['tipo']
 
-    def __visitar_expresion_matematica(self, nodo_actual: Nodo) -> None:
+        self.tabla_simbolos.activar_registro(self.registros_asignacion.pop())
+
+    def __entrar_expresion_matematica(self, nodo_actual: Nodo) -> None:
         """
         ExpresionMatematica::= #Valor (Operador Valor)*#
         """
@@ -171,19 +338,21 @@ class Visitante:
 
             if nodo.tipo == TipoNodo.IDENTIFICADOR:
                 registro = self.tabla_simbolos.verificar_existencia(
-                    nodo.contenido, nodo.atributos)
+                    nodo.contenido, nodo)
                 if registro.get_referencia().atributos.get("tipo") != TipoDato.NUMERO and registro.get_referencia().atributos.get('tipo') != TipoDato.CUALQUIERA:
                     self.__error_expresion_matematica_identificador(registro)
             else:
                 if nodo.tipo != TipoNodo.ENTERO and nodo.tipo != TipoNodo.OPERADOR:
                    self.__error_expresion_matematica_literal(nodo)
 
+    def __visitar_expresion_matematica(self, nodo_actual: Nodo) -> None:
+        """
+        ExpresionMatematica::= #Valor (Operador Valor)*#
+        """
 
-            self.visitar(nodo)
-        
         nodo_actual.atributos['tipo'] = TipoDato.NUMERO
 
-    def __visitar_funcion(self, nodo_actual: Nodo) -> None:
+    def __entrar_funcion(self, nodo_actual: Nodo) -> None:
         """
         Función ::= POV Identificador(Parámetros?) xD ConjuntoInstrucciones v:
         """
@@ -192,30 +361,47 @@ class Visitante:
 
         self.tabla_simbolos.nuevo_bloque()
 
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
+    def __visitar_funcion(self, nodo_actual: Nodo) -> None:
+        """
+        Función ::= POV Identificador(Parámetros?) xD ConjuntoInstrucciones v:
+        """
 
         self.tabla_simbolos.eliminar_bloque()
 
         nodo_actual.atributos['tipo'] = nodo_actual.nodos[2].atributos['tipo']
 
-    def __visitar_invocacion(self, nodo_actual: Nodo) -> None:
+    def __entrar_invocacion(self, nodo_actual: Nodo) -> None:
         """
         Invocación ::= jutsu Identificador(Parámetros?)
         """
         registro = self.tabla_simbolos.verificar_existencia(
-            nodo_actual.nodos[0].contenido, nodo_actual.nodos[0].atributos)
+            nodo_actual.nodos[0].contenido, nodo_actual.nodos[0])
             
         if registro.get_referencia().tipo != TipoNodo.FUNCION:
             self.__error_invocacion(registro)
 
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
+        # En la profundidad 0 una función nativa no se puede ocultar
+        nativa = self.tabla_simbolos.nativa(registro.get_nombre())
+        if nativa is not None and nativa.aridad is not None and \
+                registro.get_profundidad() == 0:
+            argumentos = len(nodo_actual.nodos[1].nodos) \
+                if len(nodo_actual.nodos) > 1 else 0
+            if argumentos != nativa.aridad:
+                self.__error_aridad(nativa, argumentos)
+
+        self.registros_invocacion.append(registro)
+
+    def __visitar_invocacion(self, nodo_actual: Nodo) -> None:
+        """
+        Invocación ::= jutsu Identificador(Parámetros?)
+        """
+
+        registro = self.registros_invocacion.pop()
 
         nodo_actual.atributos['tipo'] = registro.get_referencia(
         ).atributos['tipo']
 
-    def __visitar_parametros_invocacion(self, nodo_actual: Nodo) -> None:
+    def __entrar_parametros_invocacion(self, nodo_actual: Nodo) -> None:
         """
         Parámetros::= Valor (, Valor)*
         """
@@ -224,21 +410,28 @@ class Visitante:
 
             if nodo.tipo == TipoNodo.IDENTIFICADOR:
                 registro = self.tabla_simbolos.verificar_existencia(
-                    nodo.contenido, nodo.atributos)
+                    nodo.contenido, nodo)
 
             elif nodo.tipo == TipoNodo.FUNCION:
                 self.__error_parametros(nodo.contenido)
 
-            self.visitar(nodo)
+    def __visitar_parametros_invocacion(self, nodo_actual: Nodo) -> None:
+        """
+        Parámetros::= Valor (, Valor)*
+        """
 
-    def __visitar_parametros_funcion(self, nodo_actual: Nodo) -> None:
+    def __entrar_parametros_funcion(self, nodo_actual: Nodo) -> None:
         """
         Parámetros::= Identificador (, Identificador)*
         """
 
         for nodo in nodo_actual.nodos:
             self.tabla_simbolos.nuevo_registro(nodo)
-            self.visitar(nodo)
+
+    def __visitar_parametros_funcion(self, nodo_actual: Nodo) -> None:
+        """
+        Parámetros::= Identificador (, Identificador)*
+        """
 
     def __visitar_instruccion(self, nodo_actual: Nodo) -> None:
         """
@@ -246,7 +439,6 @@ class Visitante:
         """
 
         for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
             nodo_actual.atributos['tipo'] = nodo.atributos['tipo']
 
     def __visitar_repetir(self, nodo_actual: Nodo) -> None:
@@ -254,11 +446,6 @@ class Visitante:
         Repetir ::= whenCuando   xD ConjuntoInstrucciones but (ExpCondicional) v:
         """
 
-        self.tabla_simbolos.nuevo_bloque()
-
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
-
         self.tabla_simbolos.eliminar_bloque()
 
         nodo_actual.atributos['tipo'] = nodo_actual.nodos[0].atributos['tipo']
@@ -268,9 +455,6 @@ class Visitante:
         Condicional::= Siuuu Nimodo?
         """
 
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
-
         nodo_actual.atributos['tipo'] = TipoDato.CUALQUIERA
 
     def __visitar_siuuu(self, nodo_actual: Nodo) -> None:
@@ -278,11 +462,6 @@ class Visitante:
         Siuuu::= siuuu (ExpCondicional) xD Conjunto Instrucciones v:
         """
 
-        self.tabla_simbolos.nuevo_bloque()
-
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
-
         self.tabla_simbolos.eliminar_bloque()
 
         nodo_actual.atributos['tipo'] = nodo_actual.nodos[1].atributos['tipo']
@@ -292,10 +471,6 @@ class Visitante:
         Nimodo::=  nimodo xD ConjuntoInstrucciones v:
         """
 
-        self.tabla_simbolos.nuevo_bloque()
-
-        self.visitar(nodo_actual.nodos[0])
-
         self.tabla_simbolos.eliminar_bloque()
 
         nodo_actual.atributos['tipo'] = nodo_actual.nodos[0].atributos['tipo']
@@ -304,12 +479,10 @@ class Visitante:
         """
         ExpCondicional ::= Comparación(OperadorLogico Comparación)? 
         """
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
 
         nodo_actual.atributos['tipo'] = TipoDato.BOOLEANO
 
-    def __visitar_comparacion(self, nodo_actual: Nodo) -> None:
+    def __entrar_comparacion(self, nodo_actual: Nodo) -> None:
         """
         Comparación::= Valor Comparador Valor
         """
@@ -317,9 +490,12 @@ class Visitante:
         for nodo in nodo_actual.nodos:
             if nodo.tipo == TipoNodo.IDENTIFICADOR:
                 registro = self.tabla_simbolos.verificar_existencia(
-                    nodo.contenido, nodo.atributos)
+                    nodo.contenido, nodo)
 
-            self.visitar(nodo)
+    def __visitar_comparacion(self, nodo_actual: Nodo) -> None:
+        """
+        Comparación::= Valor Comparador Valor
+        """
 
         valor_izquierda = nodo_actual.nodos[0]
         comparador = nodo_actual.nodos[1]
@@ -345,22 +521,17 @@ class Visitante:
         Retorno: := messirve Valor?
         """
 
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
-
-        if nodo_actual.nodos == []:
+        if not nodo_actual.nodos:
             nodo_actual.atributos['tipo'] = TipoDato.NINGUNO
 
         else:
 
             for nodo in nodo_actual.nodos:
 
-                self.visitar(nodo)
-
                 if nodo.tipo == TipoNodo.IDENTIFICADOR:
                     # Se verifica que el identificador exista
                     registro = self.tabla_simbolos.verificar_existencia(
-                        nodo.contenido, nodo.atributos)
+                        nodo.contenido, nodo)
 
                     # se guarda el tipo de dato del retorno
                     nodo_actual.atributos['tipo'] = registro.get_referencia(
@@ -374,8 +545,6 @@ class Visitante:
         """
         Principal::= maracuya() xD ConjuntoInstrucciones v:
         """
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
 
         nodo_actual.atributos['tipo'] = nodo_actual.nodos[0].atributos['tipo']
 
@@ -384,9 +553,6 @@ class Visitante:
         ConjuntoInstrucciones ::= Instruccion+
         """
 
-        for nodo in nodo_actual.nodos:
-            self.visitar(nodo)
-
         nodo_actual.atributos['tipo'] = TipoDato.NINGUNO
 
         for nodo in nodo_actual.nodos:
@@ -462,6 +628,18 @@ class Visitante:
 
         raise TypeError("Error de tipos en verificador")
     
+    def __error_aridad(self, nativa: FuncionNativa,
+                       argumentos: int) -> NoReturn:
+        """
+        Levanta un error de tipo si una función nativa se invoca con otra
+        cantidad de argumentos
+        """
+
+        print(f'La funcion {nativa.nombre!r} recibe {nativa.aridad} ' +
+              f'argumentos y se invoca con {argumentos}')
+
+        raise TypeError("Error de tipos en verificador")
+
     def __error_expresion_matematica_identificador(self, registro: Registro) -> NoReturn:
         """
         Levanta un error de tipo si no se utiliza un entero en una expresión matemática
@@ -510,6 +688,395 @@ class Visitante:
         raise TypeError("Error de tipos en verificador")
 
 
+class ResultadoUnidad(NamedTuple):
+    """
+    Resultado de verificar una unidad en otro proceso: el tipo de dato
+    de cada nodo del subárbol en preorden, los registros que quedaron en
+    la tabla como (posición del nodo dentro del subárbol, profundidad),
+    la posición en `registros` de los visibles, lo que se imprimió y el
+    error si falló
+    """
+
+    tipos_dato: Optional[array]
+    registros: List[Tuple[int, int]]
+    visibles: List[int]
+    salida: str
+    error: Optional[Exception]
+
+
+class DependenciasUnidad:
+    """
+    Lo que la verificación incremental recuerda de una unidad: su huella
+    (hash del subárbol), los nombres que usa y declara, las entradas
+    (tipo de nodo y tipo de dato de cada global o función que encontró
+    visible) y el resultado de verificarla, con el tipo que infirió.
+    Si la huella y las entradas no cambian, verificarla de nuevo da el
+    mismo resultado.
+
+    El nodo y los registros sólo se conservan en memoria, no se guardan
+    al serializar
+    """
+
+    __slots__ = ('clave', 'huella', 'nombres', 'declaraciones', 'entradas',
+                 'resultado', 'nodo', 'registros', 'visibles')
+
+    clave: tuple
+    huella: bytes
+    nombres: Set[str]
+    declaraciones: List[str]
+    entradas: Dict[str, Tuple[int, int]]
+    resultado: ResultadoUnidad
+    nodo: Optional[Nodo]
+    registros: Optional[List[Registro]]
+    visibles: Optional[List[Registro]]
+
+    def __init__(self, unidad: 'UnidadVerificacion') -> None:
+        self.clave = unidad.clave
+        self.huella = unidad.huella
+        self.nombres = unidad.nombres
+        self.declaraciones = unidad.declaraciones
+        self.entradas = unidad.entradas
+        self.resultado = unidad.resultado
+        self.nodo = unidad.nodo
+        self.registros = unidad.registros
+        self.visibles = unidad.visibles
+
+    def __getstate__(self) -> tuple:
+        return (self.clave, self.huella, self.nombres, self.declaraciones,
+                self.entradas, self.resultado)
+
+    def __setstate__(self, estado: tuple) -> None:
+        (self.clave, self.huella, self.nombres, self.declaraciones,
+         self.entradas, self.resultado) = estado
+        self.nodo = self.registros = self.visibles = None
+
+    @property
+    def referencias(self) -> List[str]:
+        """
+        Globales y funciones declaradas fuera de la unidad que usa
+        """
+
+        return list(self.entradas)
+
+    @property
+    def tipo(self) -> Optional[TipoDato]:
+        """
+        Tipo que se infirió para la unidad, el de retorno en una función
+        """
+
+        return TIPOS_DATO.get(self.resultado.tipos_dato[0])
+
+
+class UnidadVerificacion:
+    """
+    Hijo de PROGRAMA que se verifica por separado: una asignación
+    global, una función o la principal. Sólo depende de las unidades
+    anteriores que declaran los nombres que usa.
+
+    Con `anterior` (lo que se recordó de la misma unidad en otra
+    verificación) la unidad se puede reutilizar si su huella es la misma.
+    Si el nodo es el mismo objeto se asume que no cambió y ni siquiera se
+    recorre, por eso al editar un árbol ya verificado hay que reemplazar
+    el hijo de PROGRAMA que cambió en lugar de modificarlo
+    """
+
+    __slots__ = ('posicion', 'nodo', 'nodos', 'nombres', 'declaraciones',
+                 'pendientes', 'dependientes', 'registros', 'visibles',
+                 'clave', 'huella', 'anterior', 'entradas', 'resultado')
+
+    posicion: int
+    nodo: Nodo
+    nodos: Optional[List[Nodo]]
+    nombres: Set[str]
+    declaraciones: List[str]
+    pendientes: int
+    dependientes: List['UnidadVerificacion']
+    registros: List[Registro]
+    visibles: List[Registro]
+    clave: Optional[tuple]
+    huella: Optional[bytes]
+    anterior: Optional[DependenciasUnidad]
+    entradas: Dict[str, Tuple[int, int]]
+    resultado: Optional[ResultadoUnidad]
+
+    def __init__(self, posicion: int, nodo: Nodo,
+                 clave: Optional[tuple] = None,
+                 anterior: Optional[DependenciasUnidad] = None) -> None:
+        self.posicion = posicion
+        self.nodo = nodo
+        self.clave = clave
+        self.huella = None
+        self.anterior = None
+        self.entradas = {}
+        self.resultado = None
+
+        self.pendientes = 0
+        self.dependientes = []
+        self.registros = []
+        self.visibles = []
+
+        if anterior is not None and anterior.nodo is nodo:
+            self.nodos = None
+            self.nombres = anterior.nombres
+            self.declaraciones = anterior.declaraciones
+            self.huella = anterior.huella
+            self.anterior = anterior
+            return
+
+        # Nombres que se buscan o declaran en la unidad, y los que
+        # declara en la profundidad 0: el de la función, o el de la
+        # asignación y los parámetros de su invocación
+        self.declaraciones = []
+        if nodo.tipo == TipoNodo.FUNCION:
+            self.declaraciones.append(nodo.contenido)
+        elif nodo.tipo == TipoNodo.ASIGNACION:
+            self.declaraciones.append(nodo.nodos[0].contenido)
+
+        if isinstance(nodo, NodoArena):
+            # En la arena el subárbol es un rango de las columnas y no
+            # hace falta crear los adaptadores
+            self.nodos = None
+            self.__revisar_arena(nodo.arena, nodo.indice)
+
+        else:
+            self.nodos = list(preorden(nodo))
+            self.nombres = {actual.contenido for actual in self.nodos
+                            if actual.tipo == TipoNodo.IDENTIFICADOR}
+
+            if nodo.tipo == TipoNodo.ASIGNACION:
+                self.declaraciones += [
+                    parametro.contenido for actual in self.nodos
+                    if actual.tipo == TipoNodo.PARAMETROS_FUNCION
+                    for parametro in actual.nodos]
+
+        self.nombres.update(self.declaraciones)
+
+        if clave is not None:
+            self.huella = _huella(nodo, self.nodos)
+            if anterior is not None and anterior.huella == self.huella:
+                self.anterior = anterior
+
+    def __revisar_arena(self, arena: ArenaNodos, inicio: int) -> None:
+        fin = arena.fin_subarbol(inicio)
+        tipos = arena.tipos
+        contenidos = arena.contenidos
+
+        identificador = TipoNodo.IDENTIFICADOR.value
+        self.nombres = {arena.cadenas[contenido]
+                        for tipo, contenido in zip(tipos[inicio:fin],
+                                                   contenidos[inicio:fin])
+                        if tipo == identificador and contenido != SIN_NODO}
+
+        if self.nodo.tipo == TipoNodo.ASIGNACION:
+            parametros = TipoNodo.PARAMETROS_FUNCION.value
+            self.declaraciones += [
+                arena.cadenas[contenidos[actual]]
+                for actual in range(inicio + 1, fin)
+                if tipos[arena.padres[actual]] == parametros
+                and contenidos[actual] != SIN_NODO]
+
+    def nodo_preorden(self, indice: int) -> Nodo:
+        """
+        Nodo en la posición `indice` del subárbol en preorden
+        """
+
+        if isinstance(self.nodo, NodoArena):
+            return self.nodo.arena.nodo(self.nodo.indice + indice)
+        return self.preorden()[indice]
+
+    def preorden(self) -> List[Nodo]:
+        """
+        Nodos del subárbol en preorden, en un árbol de Nodo
+        """
+
+        if self.nodos is None:
+            self.nodos = list(preorden(self.nodo))
+        return self.nodos
+
+    def reutilizable(self) -> bool:
+        """
+        Indica si la unidad no cambió desde la verificación anterior y
+        encontró visibles las mismas declaraciones con los mismos tipos
+        """
+
+        return self.anterior is not None and \
+            self.anterior.entradas == self.entradas
+
+    def en_paralelo(self) -> bool:
+        """
+        Las funciones y la principal se verifican en otro proceso, las
+        asignaciones globales son pequeñas y se verifican en este
+        """
+
+        return self.nodo.tipo in {TipoNodo.FUNCION, TipoNodo.PRINCIPAL}
+
+
+# Raíz del programa en cada proceso de la verificación en paralelo
+_raiz_proceso = None
+
+
+def _iniciar_proceso(raiz) -> None:
+    """
+    Guarda en el proceso la raíz del programa, así cada unidad sólo
+    envía su posición. Cuando los procesos se crean con fork heredan
+    el árbol sin copiarlo, si no se recibe serializado una sola vez
+    """
+
+    global _raiz_proceso
+    _raiz_proceso = raiz
+
+
+def _visitar_unidad(raiz, base: AlcanceBase
+                    ) -> Tuple[TablaSimbolos, str, Optional[Exception]]:
+    """
+    Verifica el subárbol de `raiz` con una tabla nueva sobre `base`,
+    retorna la tabla, lo que se imprimió y el error si falló
+    """
+
+    tabla = TablaSimbolos(base)
+    salida = io.StringIO()
+
+    try:
+        with redirect_stdout(salida):
+            Visitante(tabla).visitar(raiz)
+    except Exception as error:
+        return tabla, salida.getvalue(), error
+
+    return tabla, salida.getvalue(), None
+
+
+def _posiciones_visibles(tabla: TablaSimbolos) -> List[int]:
+    """
+    Posición en `tabla.simbolos` de los registros visibles, al terminar
+    la unidad sólo queda la profundidad 0 y uno por nombre
+    """
+
+    posiciones = {id(registro): posicion
+                  for posicion, registro in enumerate(tabla.simbolos)}
+
+    return [posiciones[id(registros[0])]
+            for registros in tabla.alcances.values()]
+
+
+def _verificar_unidad(posicion: int, base: AlcanceBase) -> ResultadoUnidad:
+    """
+    Verifica el hijo `posicion` de la raíz del proceso
+    """
+
+    raiz = _raiz_proceso.nodos[posicion]
+    tabla, salida, error = _visitar_unidad(raiz, base)
+
+    if error is not None:
+        return ResultadoUnidad(None, [], [], salida, error)
+
+    return _resultado_unidad(raiz, tabla, salida)
+
+
+def _resultado_unidad(raiz, tabla: TablaSimbolos, salida: str,
+                      nodos: Optional[List[Nodo]] = None) -> ResultadoUnidad:
+    """
+    Resultado de la unidad `raiz` ya verificada con `tabla`, `nodos` es
+    su subárbol en preorden si ya se tiene
+    """
+
+    if isinstance(raiz, NodoArena):
+        inicio = raiz.indice
+        tipos_dato = raiz.arena.tipos_dato[
+            inicio:raiz.arena.fin_subarbol(inicio)]
+
+        registros = [(registro.get_referencia().indice - inicio,
+                      registro.get_profundidad())
+                     for registro in tabla.simbolos]
+
+    else:
+        nodos = nodos or list(preorden(raiz))
+        tipos_dato = array('B', [VALORES_TIPO_DATO.get(
+            nodo.atributos.get('tipo'), 0) for nodo in nodos])
+
+        posiciones = {id(nodo): indice for indice, nodo in enumerate(nodos)}
+        registros = [(posiciones[id(registro.get_referencia())],
+                      registro.get_profundidad())
+                     for registro in tabla.simbolos]
+
+    return ResultadoUnidad(tipos_dato, registros,
+                           _posiciones_visibles(tabla), salida, None)
+
+
+def _entrada(registro: Registro) -> Tuple[int, int]:
+    """
+    Tipo de nodo y tipo de dato de una declaración, lo único de ella que
+    afecta la verificación de las unidades que la usan
+    """
+
+    referencia = registro.get_referencia()
+    return (referencia.tipo.value,
+            VALORES_TIPO_DATO.get(referencia.atributos.get('tipo'), 0))
+
+
+def _huella(raiz, nodos: Optional[List[Nodo]] = None) -> bytes:
+    """
+    Hash del subárbol: el tipo, la cantidad de hijos y el contenido de
+    cada nodo en preorden (`nodos` si ya se tiene). No incluye la línea
+    y columna, así una función que sólo cambió de lugar no se vuelve a
+    verificar
+    """
+
+    if isinstance(raiz, NodoArena):
+        arena = raiz.arena
+        inicio = raiz.indice
+        fin = arena.fin_subarbol(inicio)
+        cadenas = arena.cadenas
+
+        tipos = arena.tipos[inicio:fin]
+        hijos = array('i', bytes(4 * (fin - inicio)))
+        for padre in arena.padres[inicio + 1:fin]:
+            hijos[padre - inicio] += 1
+        contenidos = [cadenas[contenido] if contenido != SIN_NODO
+                      else SIN_CONTENIDO
+                      for contenido in arena.contenidos[inicio:fin]]
+
+    else:
+        nodos = nodos or list(preorden(raiz))
+        tipos = array('B', [nodo.tipo.value for nodo in nodos])
+        hijos = array('i', [len(nodo.nodos) for nodo in nodos])
+        contenidos = [SIN_CONTENIDO if nodo.contenido is None
+                      else nodo.contenido for nodo in nodos]
+
+    huella = hashlib.blake2b(tipos.tobytes(), digest_size=16)
+    huella.update(hijos.tobytes())
+    huella.update('\0'.join(contenidos).encode())
+    return huella.digest()
+
+
+def _clave_unidad(nodo: Nodo, ocurrencias: Dict[tuple, int]) -> tuple:
+    """
+    Identifica una unidad entre dos verificaciones: su tipo de nodo, el
+    nombre que declara y cuántas unidades antes declararon ese nombre
+    con el mismo tipo de nodo
+    """
+
+    nombre = None
+    if nodo.tipo == TipoNodo.FUNCION:
+        nombre = nodo.contenido
+    elif nodo.tipo == TipoNodo.ASIGNACION:
+        nombre = nodo.nodos[0].contenido
+
+    llave = (nodo.tipo.value, nombre)
+    ocurrencias[llave] = ocurrencias.get(llave, -1) + 1
+
+    return llave + (ocurrencias[llave],)
+
+
+def _copiar_referencia(nodo: Nodo) -> Nodo:
+    """
+    Copia del nodo sin sus hijos para enviarla a otro proceso
+    """
+
+    return Nodo(nodo.tipo, nodo.contenido, (),
+                dict(nodo.iterar_atributos()) or None,
+                nodo.linea, nodo.columna)
+
+
 class Verificador:
     """
     Clase encargada de invocar a la clase visitante
@@ -520,15 +1087,23 @@ class Verificador:
     ast: ArbolSintaxisAbstracta
     visitador: Visitante
     tabla_simbolos: TablaSimbolos
+    ambiente: AmbienteEstandar
+    dependencias: Optional[Dict[tuple, DependenciasUnidad]]
+    reverificadas: List[tuple]
 
-    def __init__(self, nuevo_ast: ArbolSintaxisAbstracta):
+    def __init__(self, nuevo_ast: ArbolSintaxisAbstracta,
+                 ambiente: Optional[AmbienteEstandar] = None):
         """
-        Constructor de clase verificador
+        Constructor de clase verificador, la tabla de símbolos parte del
+        ambiente estándar (con las funciones nativas registradas) sin
+        copiarlo
         """
         self.ast = nuevo_ast
-        self.tabla_simbolos = TablaSimbolos()
+        self.ambiente = ambiente or ambiente_estandar()
+        self.tabla_simbolos = TablaSimbolos(self.ambiente)
         self.visitador = Visitante(self.tabla_simbolos)
-        self.__cargar_ambiente_estandar()
+        self.dependencias = None
+        self.reverificadas = []
 
     def imprimir_ast(self):
         """
@@ -547,19 +1122,308 @@ class Verificador:
         """
         self.visitador.visitar(self.ast.raiz)
         return self.tabla_simbolos
+
+    def verificar_paralelo(self, procesos: Optional[int] = None
+                           ) -> TablaSimbolos:
+        """
+        Igual que `verificar`, pero verifica las funciones y la principal
+        en varios procesos
+
+        Primero se recorren los hijos de PROGRAMA para saber qué nombres
+        declara y usa cada uno. Cada unidad depende de las anteriores que
+        declaran primero los nombres que usa, porque necesita su tipo, y
+        se verifica en cuanto terminan esas unidades sobre un AlcanceBase
+        con sus registros. Los tipos y registros de cada unidad se unen
+        en el orden del programa, así el resultado y el error reportado
+        (el de la primera unidad que falla) son los mismos que al
+        verificar en un solo proceso
+        """
+
+        if procesos is None:
+            procesos = os.cpu_count() or 1
+
+        raiz = self.ast.raiz
+        funciones = sum(1 for nodo in raiz.nodos
+                        if nodo.tipo in {TipoNodo.FUNCION,
+                                         TipoNodo.PRINCIPAL}) \
+            if raiz is not None else 0
+
+        if procesos <= 1 or funciones < MINIMO_FUNCIONES_PARALELO:
+            return self.verificar()
+
+        self.__verificar_unidades(procesos)
+        return self.tabla_simbolos
+
+    def reverificar(self,
+                    anterior: Optional[Dict[tuple, DependenciasUnidad]] = None,
+                    procesos: int = 1) -> TablaSimbolos:
+        """
+        Igual que `verificar`, pero sólo verifica las unidades que cambiaron
+        desde la verificación que dejó `anterior` (el atributo
+        `dependencias` de otro Verificador, también cargado de la caché)
+
+        Una unidad se reutiliza si su huella es la misma y las globales y
+        funciones que usa tienen el mismo tipo que antes. Las unidades
+        se revisan en orden, así cuando cambia el tipo que se infiere
+        para una función se vuelven a verificar las que la invocan, y si
+        no cambia la verificación se detiene ahí. Sin `anterior` se
+        verifica todo. Al terminar `dependencias` tiene lo necesario para
+        la siguiente verificación y `reverificadas` las claves de las
+        unidades que se verificaron. Con `procesos` mayor que 1 y
+        suficientes funciones cambiadas se verifican en paralelo
+        """
+
+        if self.ast.raiz is None:
+            self.dependencias = {}
+            self.reverificadas = []
+            return self.verificar()
+
+        unidades = self.__verificar_unidades(procesos, anterior or {})
+
+        self.dependencias = {unidad.clave: DependenciasUnidad(unidad)
+                             for unidad in unidades}
+        self.reverificadas = [unidad.clave for unidad in unidades
+                              if not unidad.reutilizable()]
+
+        return self.tabla_simbolos
+
+    def __verificar_unidades(
+            self, procesos: int,
+            anteriores: Optional[Dict[tuple, DependenciasUnidad]] = None
+            ) -> List[UnidadVerificacion]:
+        """
+        Verifica por unidades, en varios procesos si `procesos` es mayor
+        que 1 y hay suficientes funciones por verificar, y une sus
+        registros en la tabla de símbolos
+        """
+
+        # El árbol ya existe y no se vuelve basura mientras se verifica,
+        # congelar los objetos existentes evita que el recolector de
+        # basura lo recorra en cada recolección y, como los procesos lo
+        # heredan, que cada proceso termine copiando toda la memoria
+        gc.freeze()
+        try:
+            unidades, primeras = self.__preparar_unidades(anteriores)
+
+            cambiadas = sum(1 for unidad in unidades
+                            if unidad.anterior is None and
+                            unidad.en_paralelo())
+
+            if procesos > 1 and cambiadas >= MINIMO_FUNCIONES_PARALELO:
+                with ProcessPoolExecutor(max_workers=procesos,
+                                         initializer=_iniciar_proceso,
+                                         initargs=(self.ast.raiz,)
+                                         ) as ejecutor:
+                    falla = self.__ejecutar_unidades(ejecutor, unidades,
+                                                     primeras)
+            else:
+                falla = self.__ejecutar_unidades(None, unidades, primeras)
+        finally:
+            gc.unfreeze()
+
+        if falla is not None:
+            salida, error = falla
+            print(salida, end='')
+            raise error
+
+        # Los registros que quedan son los de la profundidad 0, en el
+        # orden del programa. Una función nativa no se puede ocultar
+        for unidad in unidades:
+            self.tabla_simbolos.simbolos += unidad.registros
+            for registro in unidad.visibles:
+                if self.ambiente.buscar(registro.get_nombre()) is None:
+                    self.tabla_simbolos.alcances.setdefault(
+                        registro.get_nombre(), [registro])
+
+        return unidades
+
+    def __ejecutar_unidades(self, ejecutor: Optional[ProcessPoolExecutor],
+                            unidades: List[UnidadVerificacion],
+                            primeras: Dict[str, Optional[UnidadVerificacion]]
+                            ) -> Optional[Tuple[str, Exception]]:
+        """
+        Segunda fase: verifica cada unidad en cuanto terminan las unidades
+        de las que depende, o la reutiliza si no cambió. Sin `ejecutor`
+        todas se verifican en este proceso. Retorna lo que imprimió y el
+        error de la primera unidad que falló, o None si ninguna falló
+        """
+
+        # Registro visible de cada nombre declarado primero en la
+        # profundidad 0, empieza con las funciones estándar
+        visibles = dict(self.ambiente.registros)
+        entradas = {nombre: _entrada(registro)
+                    for nombre, registro in visibles.items()}
+
+        listas = [unidad.posicion for unidad in unidades
+                  if unidad.pendientes == 0]
+        en_curso = {}
+        terminados = SimpleQueue()
+        falla = None
+
+        def completar(unidad: UnidadVerificacion) -> None:
+            for registro in unidad.visibles:
+                if primeras.get(registro.get_nombre()) is unidad:
+                    visibles[registro.get_nombre()] = registro
+                    entradas[registro.get_nombre()] = _entrada(registro)
+
+            for dependiente in unidad.dependientes:
+                dependiente.pendientes -= 1
+                if dependiente.pendientes == 0:
+                    heappush(listas, dependiente.posicion)
+
+        def declarados(unidad: UnidadVerificacion) -> List[str]:
+            # Los nombres que la unidad usa y ya están declarados antes de
+            # ella: `visibles` se llena en el orden en que terminan las
+            # unidades, también tiene los de unidades posteriores
+            return [nombre for nombre in unidad.nombres
+                    if nombre in visibles and
+                    (primeras.get(nombre) is None or
+                     primeras[nombre].posicion < unidad.posicion)]
+
+        def fallar(unidad: UnidadVerificacion, salida: str,
+                   error: Exception) -> None:
+            nonlocal falla
+            if falla is None or unidad.posicion < falla[0]:
+                falla = (unidad.posicion, salida, error)
+
+        while listas or en_curso:
+
+            while listas:
+                unidad = unidades[heappop(listas)]
+
+                # Las unidades después de una que falló no cambian el
+                # resultado
+                if falla is not None and unidad.posicion > falla[0]:
+                    continue
+
+                nombres = declarados(unidad)
+                unidad.entradas = {nombre: entradas[nombre]
+                                   for nombre in nombres}
+                if unidad.reutilizable():
+                    self.__reutilizar(unidad)
+                    completar(unidad)
+                    continue
+
+                base = AlcanceBase({
+                    nombre: Registro(visibles[nombre].get_profundidad(),
+                                     _copiar_referencia(
+                                         visibles[nombre].get_referencia()))
+                    for nombre in nombres}, self.ambiente)
+
+                if ejecutor is not None and unidad.en_paralelo():
+                    futuro = ejecutor.submit(_verificar_unidad,
+                                             unidad.posicion, base)
+                    en_curso[futuro] = unidad
+                    futuro.add_done_callback(terminados.put)
+                    continue
+
+                tabla, salida, error = _visitar_unidad(unidad.nodo, base)
+                if error is not None:
+                    fallar(unidad, salida, error)
+                    continue
+
+                unidad.resultado = _resultado_unidad(unidad.nodo, tabla,
+                                                     salida, unidad.nodos)
+                unidad.registros = tabla.simbolos
+                unidad.visibles = [tabla.simbolos[posicion] for posicion
+                                   in unidad.resultado.visibles]
+                completar(unidad)
+
+            if not en_curso:
+                break
+
+            futuro = terminados.get()
+            unidad = en_curso.pop(futuro)
+            resultado = futuro.result()
+
+            if resultado.error is not None:
+                fallar(unidad, resultado.salida, resultado.error)
+            else:
+                self.__aplicar_resultado(unidad, resultado)
+                completar(unidad)
+
+        return falla[1:] if falla is not None else None
+
+    def __preparar_unidades(self, anteriores: Optional[
+            Dict[tuple, DependenciasUnidad]] = None) -> Tuple[
+            List[UnidadVerificacion],
+            Dict[str, Optional[UnidadVerificacion]]]:
+        """
+        Primera fase: separa los hijos de PROGRAMA en unidades y enlaza
+        cada una con las unidades anteriores de las que depende. Retorna
+        también la unidad que declara primero cada nombre (None para
+        las funciones estándar). Con `anteriores` cada unidad se compara
+        con la de la misma clave
+        """
+
+        if anteriores is None:
+            unidades = [UnidadVerificacion(posicion, nodo) for posicion, nodo
+                        in enumerate(self.ast.raiz.nodos)]
+
+        else:
+            unidades = []
+            ocurrencias = {}
+
+            for posicion, nodo in enumerate(self.ast.raiz.nodos):
+                clave = _clave_unidad(nodo, ocurrencias)
+                unidades.append(UnidadVerificacion(
+                    posicion, nodo, clave, anteriores.get(clave)))
+
+        # Unidad que declara primero cada nombre, las funciones estándar
+        # se declaran antes que todas
+        primeras = dict.fromkeys(self.ambiente.registros)
+        for unidad in unidades:
+            for nombre in unidad.declaraciones:
+                primeras.setdefault(nombre, unidad)
+
+        for unidad in unidades:
+            dependencias = {primeras.get(nombre) for nombre in unidad.nombres}
+            for dependencia in dependencias:
+                if dependencia is not None and \
+                        dependencia.posicion < unidad.posicion:
+                    dependencia.dependientes.append(unidad)
+                    unidad.pendientes += 1
+
+        return unidades, primeras
+
+    def __aplicar_resultado(self, unidad: UnidadVerificacion,
+                            resultado: ResultadoUnidad) -> None:
+        """
+        Copia los tipos de dato de la unidad verificada en otro proceso
+        (o en una verificación anterior) a los nodos del árbol y crea sus
+        registros con esos nodos
+        """
+
+        unidad.resultado = resultado
+
+        if isinstance(unidad.nodo, NodoArena):
+            arena = unidad.nodo.arena
+            inicio = unidad.nodo.indice
+            arena.tipos_dato[inicio:inicio + len(resultado.tipos_dato)] = \
+                resultado.tipos_dato
+
+        else:
+            for nodo, tipo in zip(unidad.preorden(), resultado.tipos_dato):
+                if tipo:
+                    nodo.atributos['tipo'] = TIPOS_DATO[tipo]
+
+        unidad.registros = [Registro(profundidad,
+                                     unidad.nodo_preorden(indice))
+                            for indice, profundidad in resultado.registros]
+        unidad.visibles = [unidad.registros[posicion]
+                           for posicion in resultado.visibles]
     
-    def __cargar_ambiente_estandar(self) -> None:
+    def __reutilizar(self, unidad: UnidadVerificacion) -> None:
         """
-        Determina funciones estándar del lenguaje cmamuth
+        Toma el resultado de la verificación anterior de la unidad, si el
+        nodo es el mismo ya tiene sus tipos y se conservan sus registros
         """
 
-        funciones_estandar = [ ('curcuma', TipoDato.TEXTO), 
-            ('nel', TipoDato.NUMERO), ('intnt', TipoDato.BOOLEANO), 
-            ('me_perdonas', TipoDato.NINGUNO), ('aber', TipoDato.NINGUNO),
-            ('duren', TipoDato.TEXTO), ('corona', TipoDato.TEXTO),
-            ('amimir', TipoDato.NINGUNO) , ('f_en_el_chat',TipoDato.NINGUNO),
-            ('lolazo',TipoDato.ENTERO)]
+        anterior = unidad.anterior
 
-        for nombre, tipo in  funciones_estandar:
-            nodo = Nodo(TipoNodo.FUNCION, contenido=nombre, atributos= {'tipo': tipo})
-            self.tabla_simbolos.nuevo_registro(nodo)
+        if anterior.nodo is unidad.nodo:
+            unidad.resultado = anterior.resultado
+            unidad.registros = anterior.registros
+            unidad.visibles = anterior.visibles
+        else:
+            self.__aplicar_resultado(unidad, anterior.resultado)